@@ -0,0 +1,668 @@
+"""
+The application: IPLVizApp and its layout constants.
+
+Boots the window, loads season data, and hands off to either the
+match-selection screen or the live-replay view depending on state.
+Started from main.py.
+"""
+
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pygame
+
+from data.theme import WINDOW_BG
+from data_io.season_index import list_seasons, list_matches_for_season
+from data_io.match_context import extract_game_details, weather_for_over
+from data_io.prefetch import Prefetcher
+from data_io.season_stats import (
+    career_table_if_ready, corpus_tables_failed, delivery_index_if_ready, outcome_tallies_if_ready,
+)
+from data_io.cricsheet import extract_ball_events
+from render.field import draw_field
+from render.team_view import draw_team_view
+from render.scorecard import ScorecardView
+from render.points_table import PointsTableView
+from render.tactical_overlay import OVERLAY_FIELDS, draw_tactical_overlay, invalidate_tactical_overlay
+from render.win_worm import draw_win_worm, invalidate_win_worm
+from render.charts import ChartsView
+from render.surface_cache import get_surface_cache
+from render.quality import cache_surface, scale_image
+
+from engine.timeline import Timeline
+from engine.bus import StateBus
+from engine.innings import MatchStates
+from engine.partnerships import PartnershipTracker
+from engine.navigation import BallIndex
+from engine.scorecard import LiveScorecard
+from engine.overs import OverIndex
+from engine.reducer import EVERYTHING
+from engine.state import MatchState
+from engine.query import Query
+from engine.winprob import chase_worm
+from engine.simulate import Projector, start_from
+
+from ui.dropdown import Dropdown
+from ui.panels import draw_histogram, draw_panel, draw_weather_panel
+from ui.title_bar import draw_title_bar
+from ui.match_table import MatchTable, abbreviate_teams
+from ui.hud import HUD
+from ui.view_selector import ViewSelector
+from ui.display import Display
+from engine.paths import get_resource_path
+
+log = logging.getLogger(__name__)
+
+
+class Cfg:
+    """Layout tokens and palette constants that don't belong to any widget."""
+    FPS           = 60
+    BG            = WINDOW_BG
+    HEADER_H      = 72
+    HEADER_PAD    = 16
+    CONTENT_TOP   = HEADER_H + 8
+    GAP           = 6
+    MARGIN        = 16
+
+    # Panel heights
+    P_MATCH   = 260
+    P_GAME    = 330
+    P_VENUE   = 190
+    P_WEATHER = 240
+
+    # Hover this long on a match row before loading it in the background
+    PREFETCH_DWELL_MS = 150
+    # Re-project the innings at most this often, however fast the replay runs
+    PROJECTION_EVERY_S = 0.5
+    # Memory for rendered surfaces kept between frames (render.surface_cache)
+    SURFACE_BUDGET_MB = 96
+    # Draw at this fraction of the window, or at most this size, and scale up
+    # to the window (ui.display) — for 4K walls, (1920, 1080) say
+    RENDER_SCALE = 1.0
+    RENDER_MAX   = None
+
+    C_TITLE    = (245, 245, 245)
+    C_SUBTITLE = (180, 180, 180)
+    C_BTN      = (235, 240, 255)
+
+
+# HUD / keyboard jump actions → (BallIndex target kind, direction)
+JUMPS = {
+    "NEXT_OVER": ("over", 1),          "PREV_OVER": ("over", -1),
+    "NEXT_WICKET": ("wicket", 1),      "PREV_WICKET": ("wicket", -1),
+    "NEXT_BOUNDARY": ("boundary", 1),  "PREV_BOUNDARY": ("boundary", -1),
+    "NEXT_INNINGS": ("innings", 1),    "PREV_INNINGS": ("innings", -1),
+    "NEXT_POWERPLAY": ("powerplay", 1), "PREV_POWERPLAY": ("powerplay", -1),
+}
+
+# Keys for the jumps; shift goes backwards
+JUMP_KEYS = {
+    pygame.K_w: "WICKET", pygame.K_b: "BOUNDARY", pygame.K_i: "INNINGS", pygame.K_p: "POWERPLAY",
+}
+
+
+class Phase:
+    SELECT = "select"
+    MATCH  = "match"
+
+
+class IPLVizApp:
+
+    def __init__(self):
+        pygame.init()
+        pygame.font.init()
+
+        disp = pygame.display.Info()
+        self.display = Display((int(disp.current_w * 0.92), int(disp.current_h * 0.92)),
+                               Cfg.RENDER_SCALE, Cfg.RENDER_MAX)
+        self.screen = self.display.canvas
+        self.w, self.h = self.display.size
+        pygame.display.set_caption("ipl-viz")
+        get_surface_cache().set_budget(Cfg.SURFACE_BUDGET_MB * 1024 * 1024)
+        self.clock = pygame.time.Clock()
+
+        self.ft  = pygame.font.SysFont("JetBrainsMono NF", 14, bold=True)
+        self.fb  = pygame.font.SysFont("JetBrainsMono NF", 12)
+        self.fst = pygame.font.SysFont("JetBrainsMono NF", 12, bold=True)
+        self.fsb = pygame.font.SysFont("JetBrainsMono NF", 10)
+
+        self.phase    = Phase.SELECT
+        self.running  = True
+        self.sel_idx  = None
+        self.view     = "view_field"
+
+        self.seasons = list_seasons()
+        self.matches = list_matches_for_season(self.seasons[0]) if self.seasons else []
+
+        self.match_data   = None
+        self.stadium      = None
+        self.game_info    = None
+        self.timeline     = None
+        self.partnerships = None
+        self.ball_index   = None
+        self.states       = None    # MatchStates — one MatchState per innings
+        self.card         = None    # LiveScorecard
+        self.overs        = None    # OverIndex
+        self.deltas       = []      # per ball, the BallDelta that undoes it (None until first applied)
+        self.state        = MatchState()
+        self.cur_event    = None
+        self.matchups     = {}      # (batter id, bowler id) → QuerySummary before this match
+        self.worm         = None
+
+        self.prefetch  = Prefetcher()
+        self.projector = Projector()
+        self.proj_key  = None       # (innings, over) of the projection last asked for
+        self.proj_at   = 0.0
+        self.scorecard = ScorecardView()
+        self.pts_view  = PointsTableView()
+        self.charts    = ChartsView()
+        self.hud       = HUD(self.w, self.h, {})
+        self.panel_keys = {}        # side panel name → its key in the surface cache's "panels"
+
+        # Views with cached surfaces hear about every state change
+        self.bus = StateBus()
+        self.bus.subscribe(self.hud.invalidate)
+        self.bus.subscribe(self.scorecard.invalidate)
+        self.bus.subscribe(invalidate_tactical_overlay, OVERLAY_FIELDS, boundaries=True)
+        self.bus.subscribe(invalidate_win_worm)
+        self.bus.subscribe(lambda diff: self._drop_panel("game"))
+        self.bus.subscribe(lambda diff: self._drop_panel("weather"), (), boundaries=True)
+
+        self._load_assets()
+        self._init_ui()
+        self._layout()
+
+    # -- Asset loading --------------------------------------------------------
+
+    def _load_assets(self):
+        self.wx_icons = {}
+        names = {
+            "temp_hot": "hotthermometer.png", "humid": "drop.png",
+            "wind": "wind.png",               "rain_drop": "waterdrops.png",
+            "clear": "sun.png",               "cloudy_sun": "cloudysun.png",
+            "cloudy": "clouds.png",           "cloudy_wind": "cloudywind.png",
+            "drizzle": "drizzle.png",         "rain": "rain.png",
+            "thunder": "thunder.png",
+        }
+        summary_keys = {"clear", "cloudy", "rain", "thunder", "cloudy_sun", "cloudy_wind", "drizzle"}
+        base = get_resource_path("images/weather")
+
+        for key, fname in names.items():
+            try:
+                img = pygame.image.load(base / fname).convert_alpha()
+                sz = (42, 42) if key in summary_keys else (24, 24)
+                self.wx_icons[key] = scale_image(img, sz)
+            except Exception as exc:
+                log.warning("Missing weather icon %s: %s", fname, exc)
+
+    # -- UI bootstrap ---------------------------------------------------------
+
+    def _init_ui(self):
+        self.dd = Dropdown(
+            x=self.w - 180 - Cfg.HEADER_PAD, y=Cfg.HEADER_PAD,
+            w=180, h=32,
+            options=self.seasons or ["<no seasons>"],
+            font=self.fb,
+        )
+        self.table = MatchTable(0, Cfg.CONTENT_TOP, self.w, self.h, self.fb)
+        self.table.set_matches(self.matches)
+        self._layout()
+
+    def _layout(self):
+        ratio = 0.72
+        self.table.rect.width  = int(self.w * ratio)
+        self.table.rect.x      = (self.w - self.table.rect.width) // 2
+        self.table.rect.height = self.h - Cfg.CONTENT_TOP - 16
+
+        self.dd.rect.x = self.w - self.dd.rect.width - Cfg.HEADER_PAD
+
+        pw = 320
+        px_l = Cfg.MARGIN
+        px_r = self.w - pw - Cfg.MARGIN
+        py   = Cfg.HEADER_H + Cfg.MARGIN
+
+        cx = px_l + pw + Cfg.MARGIN
+        cw = px_r - cx - Cfg.MARGIN
+        ch = self.h - py - 100
+        self.center = pygame.Rect(cx, py, cw, ch)
+        self.pw, self.px_l, self.px_r, self.py = pw, px_l, px_r, py
+
+        self.vs = ViewSelector(px_l, py + Cfg.P_VENUE + Cfg.P_WEATHER + 12, pw, self.fst)
+
+        hud_h = 80
+        self.hud.rect  = pygame.Rect(0, self.h - hud_h, self.w, hud_h)
+        self.hud.width = self.w
+        self.btn_back  = pygame.Rect(20, 16, 90, 32)
+
+    # -- Main loop ------------------------------------------------------------
+
+    def run(self):
+        while self.running:
+            dt = self.clock.tick(Cfg.FPS) / 1000.0
+            self._events()
+            self._tick(dt)
+            self._draw()
+        self.prefetch.shutdown()
+        self.projector.shutdown()
+        pygame.quit()
+        sys.exit()
+
+    # -- Events ---------------------------------------------------------------
+
+    def _events(self):
+        for ev in pygame.event.get():
+            ev = self.display.map_event(ev)
+            if ev.type == pygame.QUIT:
+                self.running = False
+
+            elif ev.type == pygame.VIDEORESIZE:
+                self.display.resize((ev.w, ev.h))
+                self.screen = self.display.canvas
+                self.w, self.h = self.display.size
+                self._layout()
+
+            elif ev.type == pygame.KEYDOWN:
+                if ev.key == pygame.K_F9:
+                    log.warning("%s", get_surface_cache().dump())
+                elif ev.key == pygame.K_ESCAPE:
+                    if self.phase == Phase.MATCH:
+                        self.phase = Phase.SELECT
+                    else:
+                        self.running = False
+
+                if self.phase == Phase.MATCH and self.timeline:
+                    if ev.key == pygame.K_SPACE:
+                        self.timeline.toggle_play()
+                    elif ev.key == pygame.K_r:
+                        self._toggle_rewind()
+                    elif ev.key == pygame.K_RIGHT:
+                        self._seek(self.timeline.index + 1)
+                    elif ev.key == pygame.K_LEFT:
+                        self._seek(self.timeline.index - 1)
+                    elif ev.key == pygame.K_UP:
+                        self._jump("NEXT_OVER")
+                    elif ev.key == pygame.K_DOWN:
+                        self._jump("PREV_OVER")
+                    elif ev.key in JUMP_KEYS:
+                        back = ev.mod & pygame.KMOD_SHIFT
+                        self._jump(("PREV_" if back else "NEXT_") + JUMP_KEYS[ev.key])
+
+            if self.phase == Phase.SELECT:
+                self._ev_select(ev)
+            elif self.phase == Phase.MATCH:
+                self._ev_match(ev)
+
+    def _ev_select(self, ev):
+        if self.dd.handle_event(ev):
+            self.matches = list_matches_for_season(self.seasons[self.dd.selected])
+            self.table.set_matches(self.matches)
+            return
+
+        row = self.table.handle_event(ev)
+        if row is not None:
+            self.sel_idx = row
+            if self._load_match():
+                self.phase = Phase.MATCH
+
+    def _ev_match(self, ev):
+        if self.view in ("view_batting", "view_bowling"):
+            if self.scorecard.handle_event(ev):
+                return
+        elif self.view == "view_points":
+            if self.pts_view.handle_event(ev):
+                return
+
+        action = self.hud.handle_event(ev)
+        if action:
+            if action == "PLAY_PAUSE":
+                self._play_pause()
+            elif action == "REWIND":
+                self._toggle_rewind()
+            elif action == "SPEED_UP":
+                self.timeline.set_speed(min(self.timeline.speed + 0.5, 4.0))
+            elif action == "SPEED_DOWN":
+                self.timeline.set_speed(max(self.timeline.speed - 0.5, 0.5))
+            elif action == "RESTART":
+                self._seek(0)
+            elif action == "PREV":
+                self._seek(self.timeline.index - 1)
+            elif action == "NEXT":
+                self._seek(self.timeline.index + 1)
+            elif action in JUMPS:
+                self._jump(action)
+            return
+
+        nv = self.vs.handle_event(ev)
+        if nv:
+            self.view = nv
+            return
+
+        if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
+            if self.btn_back.collidepoint(ev.pos):
+                self.phase = Phase.SELECT
+
+    # -- Match loading --------------------------------------------------------
+
+    def _load_match(self):
+        m = self.matches[self.sel_idx]
+        loaded = self.prefetch.get(m["id"])
+        if loaded is None:
+            return False
+        self.match_data = loaded.raw
+        self.stadium    = loaded.stadium
+        self.game_info  = loaded.details
+
+        self.timeline = Timeline(loaded.columns)
+        self.partnerships = PartnershipTracker(loaded.columns)
+        self.ball_index = BallIndex(loaded.columns)
+        self.states = MatchStates(loaded.columns, loaded.raw)
+        self.deltas = [None] * len(loaded.columns)
+        self.card = LiveScorecard(loaded.columns)
+        self.overs = OverIndex(loaded.columns)
+        self.worm     = chase_worm(loaded.columns, loaded.raw)
+        self.timeline.playing = True
+        self.timeline.set_speed(1.0)
+        self.state     = self.states.state_at(0)
+        self.cur_event = None
+        self.matchups  = {}
+        for name in list(self.panel_keys):
+            self._drop_panel(name)
+        self.charts.invalidate()
+        self.bus.publish(EVERYTHING)
+        self.projector.reset()
+        self.proj_key  = None
+        return True
+
+    # -- Seeking --------------------------------------------------------------
+
+    def _seek(self, index):
+        """
+        Move the replay to `index` balls bowled.  One ball back undoes it
+        from its delta if we have one; anything else rebuilds from the
+        nearest checkpoint.
+        """
+        here = self.timeline.index
+        self.timeline.seek(index)
+        index = self.timeline.index
+        if index == here - 1 and self.deltas[index] is not None:
+            self._set_state(self.states.revert(self.state, self.deltas[index], index), here)
+        elif index != here:
+            self._set_state(self.states.state_at(index), here)
+        self.cur_event = self.timeline.events[index - 1] if index else None
+        self.partnerships.seek(index)
+
+    def _set_state(self, state, was):
+        """Show `state`, the replay having moved on from `was` balls, and tell the views what changed."""
+        diff = self.states.diff(self.state, state, was, self.timeline.index)
+        self.state = state
+        self.bus.publish(diff)
+
+    def _play_pause(self):
+        """Pause, or play forwards — which also ends a rewind."""
+        if self.timeline.reverse:
+            self.timeline.toggle_reverse()
+            self.timeline.playing = True
+        else:
+            self.timeline.toggle_play()
+
+    def _toggle_rewind(self):
+        """Pause a rewind, or start one."""
+        if self.timeline.reverse:
+            self.timeline.toggle_play()
+        else:
+            self.timeline.toggle_reverse()
+            self.timeline.playing = True
+
+    def _jump(self, action):
+        kind, step = JUMPS[action]
+        here = self.timeline.index
+        target = self.ball_index.next(kind, here) if step > 0 else self.ball_index.prev(kind, here)
+        if target is not None:
+            self._seek(target)
+
+    # -- Update ---------------------------------------------------------------
+
+    def _tick(self, dt):
+        if self.phase == Phase.SELECT:
+            self._tick_prefetch()
+            return
+        if not self.timeline:
+            return
+        ev = self.timeline.update(dt)
+        if ev and self.timeline.reverse:
+            i = self.timeline.index     # the ball just un-bowled
+            delta = self.deltas[i]
+            self._set_state(self.states.revert(self.state, delta, i) if delta else self.states.state_at(i), i + 1)
+            self.cur_event = self.timeline.events[i - 1] if i else None
+        elif ev:
+            self.cur_event = ev
+            i = self.timeline.index - 1
+            state, self.deltas[i] = self.states.apply(self.state, ev, i)
+            self._set_state(state, i)
+        self.partnerships.seek(self.timeline.index)
+        self._tick_projection()
+
+    def _tick_projection(self):
+        """Ask for a fresh innings projection once per over; never waits for one."""
+        self.projector.poll()
+        tallies = outcome_tallies_if_ready()
+        if tallies is None or not self.cur_event:
+            return
+        key = (self.cur_event.innings, self.cur_event.over)
+        now = time.monotonic()
+        if key == self.proj_key or self.projector.busy or now - self.proj_at < Cfg.PROJECTION_EVERY_S:
+            return
+        start = start_from(self.state, self.timeline.events, self.timeline.index, self.match_data)
+        if start is None:
+            return
+        season = self.matches[self.sel_idx]["date"][:4]
+        if self.projector.request(key, tallies.model_for(season), start):
+            self.proj_key, self.proj_at = key, now
+
+    def _tick_prefetch(self):
+        """Warm the cache for whichever row the pointer has settled on."""
+        hovered = self.table.hover_index
+        if hovered is None or hovered >= len(self.matches):
+            self.prefetch.cancel_pending()
+            return
+        match_id = self.matches[hovered]["id"]
+        if self.table.dwell_index(Cfg.PREFETCH_DWELL_MS) is None:
+            self.prefetch.cancel_pending(keep=match_id)
+        else:
+            self.prefetch.request(match_id)
+
+    # -- Render ---------------------------------------------------------------
+
+    def _draw(self):
+        self.screen.fill(Cfg.BG)
+        if self.phase == Phase.SELECT:
+            self._draw_select()
+        else:
+            self._draw_match()
+        self.display.present()
+
+    def _draw_select(self):
+        self.screen.blit(self.ft.render("IPL Match Replay", True, Cfg.C_TITLE), (Cfg.HEADER_PAD, Cfg.HEADER_PAD))
+        self.table.draw(self.screen)
+        self.dd.draw(self.screen)
+
+    def _draw_match(self):
+        m = self.matches[self.sel_idx]
+        # The field texture spans the window (opaque under low), so it goes down before the header
+        if self.view == "view_field" and self.stadium:
+            draw_field(self.screen, self.stadium)
+        draw_title_bar(self.screen, pygame.Rect(0, 0, self.w, Cfg.HEADER_H),
+                        m["teams"], f"{m['date']} | {m['stage']}", self.ft, self.fb)
+        self._btn(self.btn_back, "← Back")
+
+        # Career numbers appear once the background build lands
+        careers = None
+        table = career_table_if_ready()
+        if table is not None:
+            careers = lambda pid: table.before(pid, m["id"])
+
+        if self.view == "view_field":
+            if self.cur_event:
+                draw_tactical_overlay(self.screen, self.cur_event, self.stadium,
+                                      self.match_data, self.game_info)
+            if self.timeline:
+                draw_win_worm(self.screen, self.center, self.worm, self.timeline.index)
+        elif self.view == "view_teams":
+            draw_team_view(self.screen, self.center, self.match_data, self.ft, self.fb, careers)
+        elif self.view == "view_batting":
+            self.scorecard.draw(self.screen, self.center, self.match_data, "batting", self.ft, self.fb,
+                                self.card, self.timeline.index, self.partnerships)
+        elif self.view == "view_bowling":
+            self.scorecard.draw(self.screen, self.center, self.match_data, "bowling", self.ft, self.fb,
+                                self.card, self.timeline.index)
+        elif self.view == "view_charts":
+            if self.timeline:
+                self.charts.draw(self.screen, self.center, self.timeline.events, self.timeline.index)
+        elif self.view == "view_points":
+            year = m["date"].split("-")[0]
+            self.pts_view.draw(self.screen, self.center, year, self.ft, self.fb, m)
+
+        self._panels()
+        self.vs.draw(self.screen, self.view)
+
+        self.hud.render(
+            self.screen, self.state,
+            self.overs.current(self.timeline.index) if self.timeline else None,
+            self.timeline.speed if self.timeline else 1.0,
+            self.timeline.playing if self.timeline else False,
+            reverse=self.timeline.reverse if self.timeline else False,
+            careers=careers,
+            partnership=self.partnerships.current if self.partnerships else None,
+            last_wicket=self.partnerships.last_wicket if self.partnerships else None,
+        )
+
+    # -- Side panels ----------------------------------------------------------
+
+    def _panels(self):
+        """
+        The four side panels, each blitted from a cached surface.  The
+        state bus drops the game and weather panels when the replay moves;
+        venue and match only change with the match.
+        """
+        pw, fb, ft = self.pw, self.fb, self.ft
+        cur_inn = self.cur_event.innings if self.cur_event else 1
+        cur_over = self.cur_event.over if self.cur_event else 0
+
+        self._panel("venue", self.px_l, self.py, Cfg.P_VENUE, None,
+                    lambda surf: draw_panel(surf, 0, 0, pw, Cfg.P_VENUE, "Venue", self._venue_lines(), fb, ft))
+        self._panel("weather", self.px_l, self.py + Cfg.P_VENUE + Cfg.GAP, Cfg.P_WEATHER, None,
+                    lambda surf: draw_weather_panel(surf, 0, 0, pw, Cfg.P_WEATHER,
+                                                    weather_for_over(self.game_info, cur_inn, cur_over),
+                                                    self.wx_icons, fb, ft))
+        self._panel("match", self.px_r, self.py, Cfg.P_MATCH, None,
+                    lambda surf: draw_panel(surf, 0, 0, pw, Cfg.P_MATCH, "Match", self._match_lines(), fb, ft))
+
+        # The projection and the head-to-head index arrive in the background, off the bus
+        proj = self._current_projection()
+        extra = (id(proj) if proj else None, delivery_index_if_ready() is not None, corpus_tables_failed())
+        self._panel("game", self.px_r, self.py + Cfg.P_MATCH + Cfg.GAP, Cfg.P_GAME, extra,
+                    lambda surf: self._game_panel(surf, proj, cur_inn))
+
+    def _panel(self, name, x, y, h, extra, draw):
+        """Blit panel `name`, rendering it with `draw(surface)` if it was dropped, evicted or `extra` has moved on."""
+        key = (name, self.pw, h, extra)
+        if self.panel_keys.get(name) != key:
+            self._drop_panel(name)
+            self.panel_keys[name] = key
+        surf = get_surface_cache().get("panels", key, lambda: self._render_panel(h, draw))
+        self.screen.blit(surf, (x, y))
+
+    def _render_panel(self, h, draw):
+        surf = cache_surface((self.pw, h), Cfg.BG)
+        draw(surf)
+        return surf
+
+    def _drop_panel(self, name):
+        key = self.panel_keys.pop(name, None)
+        if key is not None:
+            get_surface_cache().discard("panels", key)
+
+    def _venue_lines(self):
+        info, stad = self.match_data.get("info", {}), self.stadium
+        return [
+            f"Stadium: {stad.name}",
+            f"City: {info.get('city')}",
+            f"Boundaries: {stad.straight_boundary_m}m(S) | {stad.square_boundary_m}m(Q)",
+            "",
+        ]
+
+    def _match_lines(self):
+        info, det = self.match_data.get("info", {}), self.game_info
+        offs = info.get("officials", {})
+        return [
+            f"Season: {info.get('season')}",
+            f"Match: #{info.get('event', {}).get('match_number', 'N/A')}",
+            f"Teams: {info['teams'][0]} v {info['teams'][1]}",
+            f"Date: {det['date']}",
+            f"Umpires: {', '.join(offs.get('umpires', []))}",
+            f"Referee: {offs.get('match_referees', ['N/A'])[0]}",
+        ]
+
+    def _game_panel(self, surf, proj, cur_inn):
+        det = self.game_info
+        pp = det.get("powerplay", {})
+        pp_txt = "Standard" if pp else "None"
+        if self.state.legal_balls <= 36:
+            pp_txt = f"ACTIVE ({pp.get('type', 'Mandatory')})"
+
+        game_lines = [
+            f"Toss: {det['toss_winner']} ({det['toss_decision']})",
+            f"Innings: {cur_inn}",
+        ]
+        st = self.state
+        if st.target:
+            game_lines.append(f"Target: {st.target} ({st.overs_limit_str} ov)")
+        game_lines += [f"Powerplay: {pp_txt}", f"Run Rate: {st.run_rate}"]
+        if st.target and not st.is_innings_complete:
+            game_lines.append(f"Need: {max(0, st.target - st.score)} off {st.balls_left} (RRR {st.req_run_rate})")
+        game_lines += self._matchup_lines()
+        if proj:
+            game_lines.append(f"Projected: {proj.percentile(50)} ({proj.percentile(10)}–{proj.percentile(90)})")
+            if proj.chase_win is not None:
+                game_lines.append(f"Chase (sim): {proj.chase_win:.0%} to get {proj.start.target}")
+
+        draw_panel(surf, 0, 0, self.pw, Cfg.P_GAME, "Game", game_lines, self.fb, self.ft)
+        if proj:
+            counts, edges = proj.histogram()
+            hist = pygame.Rect(18, Cfg.P_GAME - 78, self.pw - 36, 64)
+            draw_histogram(surf, hist, counts, edges, proj.start.target, self.fb)
+
+    def _current_projection(self):
+        """The latest projection, if it's for the innings being shown."""
+        proj = self.projector.latest
+        if proj is None or not self.cur_event or proj.start.innings != self.cur_event.innings:
+            return None
+        return proj
+
+    def _matchup_lines(self):
+        """Head-to-head of the batter on strike against the bowler, in earlier matches."""
+        index = delivery_index_if_ready()
+        st = self.state
+        if not self.cur_event:
+            return []
+        if index is None:
+            # Nothing while it builds; say so if the build failed (it's retried in the background)
+            return ["Head-to-head: unavailable"] if corpus_tables_failed() else []
+        key = (st.current_batter_id, st.current_bowler_id)
+        if key not in self.matchups:
+            q = Query(batters=key[:1], bowlers=key[1:], before_match=self.matches[self.sel_idx]["id"])
+            self.matchups[key] = index.select(q).summary()
+        h2h = self.matchups[key]
+        record = "First meeting"
+        if h2h.balls:
+            record = f"{h2h.batter_runs} off {h2h.balls}, {h2h.bowler_wickets} out (SR {h2h.strike_rate:.0f})"
+        return [f"Matchup: {st.current_batter} v {st.current_bowler}", f"Head-to-head: {record}"]
+
+    def _btn(self, rect, text):
+        pygame.draw.rect(self.screen, (40, 40, 40), rect, border_radius=8)
+        pygame.draw.rect(self.screen, (120, 120, 120), rect, 1, border_radius=8)
+        t = self.fb.render(text, True, Cfg.C_BTN)
+        self.screen.blit(t, t.get_rect(center=rect.center))
+
@@ -38,6 +38,9 @@ SECTION_COLOR = (200, 220, 255)
 LABEL_COLOR   = (180, 180, 190)
 
 PANEL_RADIUS  = 12
+
+# The window behind everything (app.Cfg.BG) — opaque cached surfaces are pre-filled with it
+WINDOW_BG     = ( 18,  18,  18)
 PANEL_PAD_X   = 18
 PANEL_PAD_Y   = 14
 COL_GAP       = 20
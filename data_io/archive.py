@@ -0,0 +1,201 @@
+"""
+Packed match archive (data/matches.pack).
+
+Twelve hundred loose JSON files are fine in a checkout but slow to ship
+and slow to open cold: every launch walks the season folders and every
+match is its own file open.  The archive keeps each match compressed
+back-to-back in one file, with a central directory at the end holding
+every entry's offset and the season index, so opening it is one read and
+loading a match is one seek.
+
+Layout:
+
+    MAGIC (8 bytes) | directory offset (u64) | directory length (u32)
+    entry, entry, ...                 — each a zlib/lzma-compressed match JSON
+    directory                         — zlib-compressed JSON, see write_archive
+
+Build it with scripts/build_match_archive.py.  The directory also keeps a
+manifest of the loose files it was packed from (match id → file size).
+When the archive is missing, or the match files next to it no longer
+match that manifest, everything falls back to data/ipl_json.  Sizes
+rather than mtimes: a git checkout or the indexer rewriting .index.json
+touches the folders without changing any match.
+"""
+
+import json
+import logging
+import lzma
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from engine.paths import get_resource_path
+
+log = logging.getLogger(__name__)
+
+IPL_JSON_DIR = get_resource_path("data/ipl_json")
+ARCHIVE_FILE = get_resource_path("data/matches.pack")
+ARCHIVE_VERSION = 2
+
+_MAGIC = b"IPLPACK\x01"
+_HEADER = struct.Struct("<8sQI")
+
+_CODECS = {
+    "zlib": (lambda b: zlib.compress(b, 9), zlib.decompress),
+    "lzma": (lambda b: lzma.compress(b, preset=9), lzma.decompress),
+}
+
+
+def match_id_for(season: str, filename: str) -> str:
+    """Corpus-wide match id — '<season>/<cricsheet id>', e.g. '2024/1426312'."""
+    return f"{season}/{Path(filename).stem}"
+
+
+class MatchArchive:
+    """Read side of the archive.  Safe to share between threads."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._f = open(path, "rb")
+        self._lock = threading.Lock()
+        try:
+            magic, dir_off, dir_len = _HEADER.unpack(self._f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError("not a match archive")
+            self._f.seek(dir_off)
+            directory = json.loads(zlib.decompress(self._f.read(dir_len)))
+            if directory.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"unsupported archive version {directory.get('version')}")
+        except Exception:
+            self._f.close()
+            raise
+
+        self.codec: str = directory["codec"]
+        self._decompress = _CODECS[self.codec][1]
+        self._entries: Dict[str, Tuple[int, int]] = {k: tuple(v) for k, v in directory["entries"].items()}
+        self._seasons: Dict[str, List[Dict[str, Any]]] = directory["seasons"]
+        self.sources: Dict[str, int] = directory["sources"]
+
+    def __contains__(self, match_id) -> bool:
+        return match_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def seasons(self) -> List[str]:
+        return sorted(self._seasons)
+
+    def matches(self, season: str) -> List[Dict[str, Any]]:
+        """Index metadata for a season — copies, so callers can annotate them."""
+        return [dict(m) for m in self._seasons.get(season, [])]
+
+    def read_bytes(self, match_id: str) -> bytes:
+        """Decompressed JSON for one match."""
+        offset, length = self._entries[match_id]
+        with self._lock:
+            self._f.seek(offset)
+            blob = self._f.read(length)
+        return self._decompress(blob)
+
+    def read(self, match_id: str) -> dict:
+        return json.loads(self.read_bytes(match_id))
+
+    def close(self):
+        self._f.close()
+
+
+# -- Shared instance ----------------------------------------------------------
+
+_archive: Optional[MatchArchive] = None
+_checked = False
+
+
+def open_archive() -> Optional[MatchArchive]:
+    """
+    The shipped archive, or None when we should read loose files instead —
+    it doesn't exist, can't be read, or the loose folders have changed
+    since it was built.
+    """
+    global _archive, _checked
+    if _checked:
+        return _archive
+    _checked = True
+
+    if not ARCHIVE_FILE.exists():
+        return None
+    try:
+        archive = MatchArchive(ARCHIVE_FILE)
+    except (OSError, ValueError, KeyError, zlib.error) as exc:
+        log.warning("Unreadable match archive %s: %s", ARCHIVE_FILE, exc)
+        return None
+    if archive_is_stale(archive):
+        log.warning("%s doesn't match data/ipl_json — using loose files (rebuild the archive)", ARCHIVE_FILE)
+        archive.close()
+        return None
+    _archive = archive
+    return _archive
+
+
+def disable_archive():
+    """Read loose files for the rest of the process (the converter needs its sources)."""
+    global _archive, _checked
+    if _archive:
+        _archive.close()
+    _archive, _checked = None, True
+
+
+def loose_manifest() -> Dict[str, int]:
+    """{match id: file size} for every match JSON under data/ipl_json — the indexer's dot-files aside."""
+    return {
+        match_id_for(season.name, f.name): f.stat().st_size
+        for season in IPL_JSON_DIR.iterdir() if season.is_dir()
+        for f in season.glob("*.json") if not f.name.startswith(".")
+    }
+
+
+def archive_is_stale(archive: MatchArchive) -> bool:
+    """True if a match file was added, removed or resized since the archive was packed."""
+    if not IPL_JSON_DIR.exists():
+        return False        # bundled build — the archive is all there is
+    return loose_manifest() != archive.sources
+
+
+# -- Writing ------------------------------------------------------------------
+
+def write_archive(path: Path, seasons: Dict[str, List[Dict[str, Any]]],
+                  sources: Iterable[Tuple[str, Path]], codec: str = "zlib") -> int:
+    """
+    Pack `sources` — (match id, JSON path) pairs — into `path`, with
+    `seasons` (season → index metadata) stored in the directory.  The
+    match JSON is re-serialised compactly before compressing.  Written to a
+    temp file and swapped in, so a failed build never leaves half an
+    archive behind.  Returns the number of matches packed.
+    """
+    compress = _CODECS[codec][0]
+    entries, manifest = {}, {}
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, 0, 0))
+        for match_id, src in sources:
+            with open(src, "r", encoding="utf-8") as sf:
+                data = json.load(sf)
+                manifest[match_id] = os.fstat(sf.fileno()).st_size
+            blob = compress(json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+            entries[match_id] = (f.tell(), len(blob))
+            f.write(blob)
+
+        directory = {"version": ARCHIVE_VERSION, "codec": codec, "seasons": seasons,
+                     "entries": entries, "sources": manifest}
+        dir_blob = zlib.compress(json.dumps(directory, separators=(",", ":")).encode("utf-8"), 9)
+        dir_off = f.tell()
+        f.write(dir_blob)
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, dir_off, len(dir_blob)))
+
+    os.replace(tmp, path)
+    return len(entries)
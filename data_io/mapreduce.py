@@ -0,0 +1,231 @@
+"""
+Map-reduce over the whole match corpus.
+
+Anything corpus-wide — standings, career numbers, venue averages — is the
+same shape: do something per match, then fold the answers together.
+`run_corpus` does the plumbing once:
+
+    def first_innings_total(m):          # module-level, so it pickles
+        return m.info["venue"], int(m.columns.runs_total[m.columns.innings == 1].sum())
+
+    def add(acc, item):
+        venue, runs = item
+        acc.setdefault(venue, []).append(runs)
+        return acc
+
+    by_venue, stats = run_corpus(first_innings_total, add, {}, cache=("venue_totals", 1))
+    print(stats)
+
+The map step runs in a process pool, a chunk of matches per task.  Map
+results are cached per match under data/mapreduce_cache/, keyed by the
+SHA-1 of the match JSON, so a rerun only maps matches that are new or
+changed.  Bump the version in `cache=` whenever the map function changes.
+The reduce step always runs in this process, in corpus order (oldest
+first), so results don't depend on which worker finished first.
+
+Matches come from a source: CorpusSource (the default — the packed
+archive when there is a fresh one, else data/ipl_json) or ArchiveSource
+for an explicit .pack file.  Anything with the same two methods works.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from data_io.archive import MatchArchive
+from data_io.cricsheet import load_match_bytes
+from engine.columns import EventColumns
+from engine.parser import parse_match_events
+from engine.paths import get_resource_path
+
+log = logging.getLogger(__name__)
+
+RESULT_CACHE_DIR = get_resource_path("data/mapreduce_cache")
+CHUNK_SIZE = 24
+
+
+@dataclass(frozen=True)
+class MatchRecord:
+    """What a map function sees for one match."""
+    match_id: str
+    season: str
+    info: dict
+    columns: EventColumns
+    innings: Tuple[dict, ...] = ()      # raw innings headers (team, target, super_over, ...) minus the overs
+
+
+@dataclass
+class RunStats:
+    matches: int = 0
+    cached: int = 0
+    deliveries: int = 0         # in the matches actually mapped this run
+    hash_s: float = 0.0
+    map_s: float = 0.0
+    reduce_s: float = 0.0
+    workers: int = 1
+
+    @property
+    def total_s(self) -> float:
+        return self.hash_s + self.map_s + self.reduce_s
+
+    def __str__(self):
+        mapped = self.matches - self.cached
+        rate = "nothing to map"
+        if mapped and self.map_s > 0:
+            rate = f"{mapped / self.map_s:.0f} matches/s, {self.deliveries / self.map_s / 1000:.1f}k deliveries/s"
+        return (f"{self.matches} matches ({self.cached} cached, {mapped} mapped on {self.workers} worker(s)) "
+                f"in {self.total_s:.2f} s — hash {self.hash_s:.2f} s, map {self.map_s:.2f} s ({rate}), "
+                f"reduce {self.reduce_s:.2f} s")
+
+
+# -- Sources ------------------------------------------------------------------
+
+class CorpusSource:
+    """The app's own corpus — whatever data_io.season_index and load_match see."""
+
+    def match_ids(self, seasons: Optional[Iterable[str]] = None) -> List[Tuple[str, str]]:
+        from data_io.season_index import list_seasons, list_matches_for_season
+        seasons = list(seasons) if seasons is not None else list_seasons()
+        return [(s, m["id"]) for s in seasons for m in list_matches_for_season(s)]
+
+    def read_bytes(self, match_id: str) -> bytes:
+        return load_match_bytes(match_id)
+
+
+class ArchiveSource:
+    """A specific packed archive (see data_io.archive), opened lazily in each process."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._archive = None
+
+    def __getstate__(self):
+        return {"path": self.path, "_archive": None}    # file handles don't cross processes
+
+    def _open(self) -> MatchArchive:
+        if self._archive is None:
+            self._archive = MatchArchive(self.path)
+        return self._archive
+
+    def match_ids(self, seasons: Optional[Iterable[str]] = None) -> List[Tuple[str, str]]:
+        archive = self._open()
+        seasons = list(seasons) if seasons is not None else archive.seasons()
+        return [(s, m["id"]) for s in seasons for m in archive.matches(s)]
+
+    def read_bytes(self, match_id: str) -> bytes:
+        return self._open().read_bytes(match_id)
+
+
+# -- Runner -------------------------------------------------------------------
+
+def run_corpus(map_fn: Callable[[MatchRecord], Any],
+               reduce_fn: Callable[[Any, Any], Any],
+               initial: Any,
+               seasons: Optional[Iterable[str]] = None,
+               source=None,
+               cache: Optional[Tuple[str, int]] = None,
+               workers: Optional[int] = None,
+               chunk_size: int = CHUNK_SIZE,
+               mp_context=None,
+               initializer: Optional[Callable[[], None]] = None) -> Tuple[Any, RunStats]:
+    """
+    Map every match through `map_fn`, fold the results with `reduce_fn`
+    starting from `initial`, and return (result, RunStats).  `map_fn` must
+    be a module-level function and its results picklable.  `cache` is a
+    (name, version) pair; leave it None to always map everything.
+    `mp_context` and `initializer` go to the process pool — the app passes
+    a spawn context, since forking a process with threads isn't safe.
+    `workers=1` runs in-process, which is handy under a debugger.
+    """
+    source = source or CorpusSource()
+    stats = RunStats()
+
+    t0 = time.perf_counter()
+    order = source.match_ids(seasons)
+    digests = {match_id: hashlib.sha1(source.read_bytes(match_id)).hexdigest() for _, match_id in order}
+    stats.matches = len(order)
+
+    stored = _load_results(cache) if cache else {}
+    results = {match_id: stored[d] for match_id, d in digests.items() if d in stored}
+    todo = [(season, match_id) for season, match_id in order if match_id not in results]
+    stats.cached = len(results)
+    stats.hash_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    if todo:
+        chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+        stats.workers = 1 if len(chunks) == 1 else (workers or os.cpu_count() or 1)
+        if stats.workers == 1:
+            mapped = [_map_chunk(map_fn, source, chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=stats.workers, mp_context=mp_context,
+                                     initializer=initializer) as pool:
+                mapped = list(pool.map(_map_chunk, [map_fn] * len(chunks), [source] * len(chunks), chunks))
+        for chunk in mapped:
+            for match_id, value, balls in chunk:
+                results[match_id] = value
+                stats.deliveries += balls
+    stats.map_s = time.perf_counter() - t0
+
+    if cache and todo:
+        stored.update({digests[match_id]: results[match_id] for _, match_id in todo})
+        _save_results(cache, stored)
+
+    t0 = time.perf_counter()
+    acc = initial
+    for _, match_id in order:
+        acc = reduce_fn(acc, results[match_id])
+    stats.reduce_s = time.perf_counter() - t0
+
+    log.info("run_corpus(%s): %s", getattr(map_fn, "__name__", map_fn), stats)
+    return acc, stats
+
+
+def _map_chunk(map_fn, source, chunk) -> List[Tuple[str, Any, int]]:
+    """Worker side: decode and map a batch of matches."""
+    out = []
+    for season, match_id in chunk:
+        raw = json.loads(source.read_bytes(match_id))
+        cols = EventColumns.from_events(parse_match_events(raw, match_id))
+        headers = tuple({k: v for k, v in inn.items() if k != "overs"} for inn in raw.get("innings", []))
+        record = MatchRecord(match_id, season, raw.get("info", {}), cols, headers)
+        out.append((match_id, map_fn(record), len(cols)))
+    return out
+
+
+# -- Result cache -------------------------------------------------------------
+
+def _results_path(cache: Tuple[str, int]) -> Path:
+    name, version = cache
+    return RESULT_CACHE_DIR / f"{name}-v{version}.pkl"
+
+
+def _load_results(cache: Tuple[str, int]) -> Dict[str, Any]:
+    path = _results_path(cache)
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as exc:
+        log.warning("Unreadable map-reduce cache %s: %s", path.name, exc)
+        return {}
+
+
+def _save_results(cache: Tuple[str, int], results: Dict[str, Any]):
+    path = _results_path(cache)
+    tmp = path.with_suffix(".tmp")
+    try:
+        RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError as exc:
+        log.warning("Couldn't write map-reduce cache %s: %s", path.name, exc)
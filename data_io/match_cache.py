@@ -0,0 +1,157 @@
+"""
+Two-tier cache of opened matches.
+
+Reopening a match used to mean re-reading the JSON, re-running the
+parser and re-hydrating the game details (weather included).  Now:
+
+  * memory — the last few opened matches, whole (raw dict, stadium,
+    details, EventColumns), in an LRU.  Flipping between matches in the
+    selector is a dict lookup.
+  * disk   — each match's EventColumns as a small .npz under
+    data/match_cache/, keyed by the SHA-1 of the source JSON.  Edit or
+    replace a match file and its hash changes, so stale entries are never
+    read — they're just orphaned.
+
+The raw JSON still has to be read and decoded on a memory miss (the
+scorecard and team views use it), but the parse is skipped.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from data.stadium_lookup import Stadium
+from data_io.cricsheet import load_match_bytes
+from data_io.match_context import resolve_stadium, extract_game_details
+from engine.columns import COLUMNS, EventColumns
+from engine.parser import parse_match_events
+from engine.paths import get_resource_path
+from engine.players import get_registry
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = get_resource_path("data/match_cache")
+CACHE_VERSION = 3
+MEMORY_SLOTS = 8        # whole matches kept in memory (~1 MB each, mostly the raw dict)
+
+# Columns holding registry ids — remapped on load if the registry numbering moved
+_PLAYER_COLUMNS = ("batter", "bowler", "non_striker", "player_out", "fielder_ids")
+
+
+@dataclass(frozen=True)
+class LoadedMatch:
+    match_id: str
+    raw: dict
+    stadium: Stadium
+    details: dict
+    columns: EventColumns
+
+
+_memory: "OrderedDict[str, LoadedMatch]" = OrderedDict()
+_memory_lock = threading.Lock()     # the prefetch worker fills the cache too
+
+
+def get_match(match_id: str) -> Optional[LoadedMatch]:
+    """Open a match by id, from memory, the disk cache, or from scratch."""
+    with _memory_lock:
+        hit = _memory.get(match_id)
+        if hit is not None:
+            _memory.move_to_end(match_id)
+            return hit
+
+    try:
+        blob = load_match_bytes(match_id)
+        raw = json.loads(blob)
+    except Exception as exc:
+        log.error("Failed to load match %s: %s", match_id, exc)
+        return None
+
+    digest = hashlib.sha1(blob).hexdigest()
+    cols = _read_columns(digest, match_id)
+    if cols is None:
+        cols = EventColumns.from_events(parse_match_events(raw, match_id))
+        _write_columns(digest, cols)
+
+    stadium = resolve_stadium(raw.get("info", {}).get("venue", "Unknown Venue"))
+    loaded = LoadedMatch(match_id, raw, stadium, extract_game_details(raw, stadium), cols)
+
+    with _memory_lock:
+        _memory[match_id] = loaded
+        while len(_memory) > MEMORY_SLOTS:
+            _memory.popitem(last=False)
+    return loaded
+
+
+def is_cached(match_id: str) -> bool:
+    """True if `match_id` is in the memory tier — opening it is free."""
+    return match_id in _memory
+
+
+def clear_memory():
+    with _memory_lock:
+        _memory.clear()
+
+
+# -- Disk tier ----------------------------------------------------------------
+
+def _cache_path(digest: str) -> Path:
+    return CACHE_DIR / f"{digest}.npz"
+
+
+def _write_columns(digest: str, cols: EventColumns):
+    reg = get_registry()
+    meta = {
+        "version": CACHE_VERSION,
+        "match_id": cols.match_id,
+        "date": cols.date,
+        "teams": cols.teams,
+        "kinds": cols.kinds,
+        # Registry keys travel with the ids so a renumbered registry can't mislabel anyone
+        "players": [[pid, reg.keys[pid], name] for pid, name in cols.names.items() if pid >= 0],
+    }
+    buf = io.BytesIO()
+    np.savez(buf, meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+             **{key: getattr(cols, key) for key in COLUMNS})
+
+    path = _cache_path(digest)
+    tmp = path.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(buf.getvalue())
+        os.replace(tmp, path)
+    except OSError as exc:
+        log.warning("Couldn't write match cache %s: %s", path.name, exc)
+
+
+def _read_columns(digest: str, match_id: str) -> Optional[EventColumns]:
+    path = _cache_path(digest)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            meta = json.loads(npz["meta"].tobytes())
+            if meta.get("version") != CACHE_VERSION:
+                return None
+            arrays = {key: npz[key] for key in COLUMNS}
+    except (OSError, ValueError, KeyError) as exc:
+        log.warning("Unreadable match cache %s: %s", path.name, exc)
+        return None
+
+    reg = get_registry()
+    remap = {old: reg.id_for(key, name) for old, key, name in meta["players"]}
+    if any(old != new for old, new in remap.items()):
+        for key in _PLAYER_COLUMNS:
+            arrays[key] = np.array([remap.get(p, p) for p in arrays[key].tolist()], dtype=np.int32)
+    names = {remap[old]: name for old, _, name in meta["players"]}
+
+    # The id comes from the caller: identical bytes filed under two ids share one entry
+    return EventColumns(match_id, meta["date"], names, meta["teams"], meta["kinds"], **arrays)
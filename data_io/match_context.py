@@ -2,35 +2,150 @@ import json
 import logging
 from functools import lru_cache
 from data.stadium_lookup import STADIUMS_BY_VENUE, Stadium
-from engine.weather import get_match_weather
+from data_io.cricsheet import load_match
+from engine.paths import get_resource_path
+from engine.weather import get_hourly_weather, cached_summary, conditions_at, hour_for_over, MATCH_START_HOUR
 
 log = logging.getLogger(__name__)
 
+_NO_WEATHER = {
+    "air_temp": None, "humidity": None, "wind": None,
+    "rain": None, "summary": "Unavailable", "source": "N/A",
+}
+
 
 def _normalize(text: str) -> str:
-    """Lowercase alphanumeric — good enough for fuzzy venue matching."""
-    return "".join(c.lower() for c in text if c.isalnum() or c.isspace())
+    """Lowercase alphanumeric tokens, single-spaced — punctuation splits words."""
+    return " ".join("".join(c.lower() if c.isalnum() else " " for c in text).split())
 
 
-@lru_cache(maxsize=32)
-def resolve_stadium(venue_name: str) -> Stadium:
+# -- Alias index --------------------------------------------------------------
+# Built once at import.  Every known spelling (STADIUMS_BY_VENUE keys, canonical
+# names, data/stadiums.json names) is normalized into one dict, so a venue that
+# misses the exact key is usually still a single lookup.  Only genuinely new
+# spellings fall through to token scoring.
+
+# Words that show up in half the venue names — they count, but only a little
+_GENERIC_TOKENS = frozenset({
+    "stadium", "cricket", "international", "ground", "association",
+    "sports", "academy", "complex", "the", "of",
+})
+_GENERIC_WEIGHT = 0.25
+_FUZZY_THRESHOLD = 0.6
+
+
+def _load_json_stadiums() -> dict:
+    path = get_resource_path("data/stadiums.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return {s["name"]: s for s in json.load(f).get("stadiums", [])}
+    except (OSError, json.JSONDecodeError, KeyError) as exc:
+        log.warning("Couldn't read %s: %s", path, exc)
+        return {}
+
+
+def _build_alias_index():
+    stadiums = {}       # stadium id (canonical name) → Stadium
+    aliases = {}        # normalized spelling → stadium id
+
+    def add(alias, sid):
+        norm = _normalize(alias)
+        if norm:
+            aliases.setdefault(norm, sid)
+
+    for venue, stadium in STADIUMS_BY_VENUE.items():
+        stadiums.setdefault(stadium.name, stadium)
+        add(venue, stadium.name)
+        add(stadium.name, stadium.name)
+
+    # stadiums.json has no coordinates, so it only contributes spellings — or
+    # a coordinate-less Stadium for a ground the lookup table doesn't know
+    for name, entry in _load_json_stadiums().items():
+        known = STADIUMS_BY_VENUE.get(name) or stadiums.get(name)
+        if known:
+            add(name, known.name)
+            continue
+        dims = entry.get("dimensions", {})
+        try:
+            stadiums[name] = Stadium(
+                name=name, location=entry.get("location", "Unknown"),
+                width_m=dims["width_m"], length_m=dims["length_m"],
+                straight_boundary_m=dims["straight_boundary_m"],
+                square_boundary_m=dims["square_boundary_m"],
+            )
+        except KeyError:
+            continue
+        add(name, name)
+
+    # Token sets per alias, plus the city/country words from each location
+    # (those can only add to a score, never dilute it)
+    tokens = [(frozenset(a.split()), sid) for a, sid in aliases.items()]
+    places = {sid: frozenset(_normalize(st.location).split()) for sid, st in stadiums.items()}
+    return stadiums, aliases, tokens, places
+
+
+STADIUMS_BY_ID, _ALIASES, _ALIAS_TOKENS, _PLACE_TOKENS = _build_alias_index()
+
+
+def _weight(tokens) -> float:
+    return sum(_GENERIC_WEIGHT if t in _GENERIC_TOKENS else 1.0 for t in tokens)
+
+
+def _fuzzy_match(norm: str):
+    """Best weighted-Jaccard alias for a normalized venue string, or None."""
+    venue = frozenset(norm.split())
+    best, best_score = None, 0.0
+    for alias, sid in _ALIAS_TOKENS:
+        hits = venue & (alias | _PLACE_TOKENS[sid])
+        if not hits - _GENERIC_TOKENS:
+            continue
+        score = _weight(hits) / _weight(venue | alias)
+        if score > best_score:
+            best, best_score = sid, score
+    if best_score >= _FUZZY_THRESHOLD:
+        return best
+    return None
+
+
+@lru_cache(maxsize=None)
+def stadium_id_for(venue_name: str):
     """
-    Try to match a Cricsheet venue string to one of our known stadiums.
+    Map a Cricsheet venue string to a stadium id, or None if we can't.
 
-    Order: exact key → substring match → fallback with dummy coordinates.
-    The lru_cache means we only pay the fuzzy-match cost once per venue.
+    Order: exact key → normalized alias → same with trailing ", City" parts
+    dropped → token scoring.  Cached per spelling, and there are only ~60.
     """
-    # Exact hit — covers most cases
     if venue_name in STADIUMS_BY_VENUE:
-        return STADIUMS_BY_VENUE[venue_name]
+        return STADIUMS_BY_VENUE[venue_name].name
 
-    # Some Cricsheet files use slightly different names for the same ground
     norm = _normalize(venue_name)
-    for stadium in STADIUMS_BY_VENUE.values():
-        s_norm = _normalize(stadium.name)
-        if norm in s_norm or s_norm in norm:
-            log.debug("Fuzzy matched '%s' → '%s'", venue_name, stadium.name)
-            return stadium
+    if norm in _ALIASES:
+        return _ALIASES[norm]
+
+    # "Wankhede Stadium, Mumbai" → "Wankhede Stadium"
+    parts = venue_name.split(",")
+    while len(parts) > 1:
+        parts.pop()
+        head = _normalize(",".join(parts))
+        if head in _ALIASES:
+            return _ALIASES[head]
+
+    sid = _fuzzy_match(norm)
+    if sid:
+        log.debug("Fuzzy matched '%s' → '%s'", venue_name, sid)
+    return sid
+
+
+def resolve_venues(venues) -> dict:
+    """Batch form of stadium_id_for: {venue: stadium id or None} for each unique venue."""
+    return {v: stadium_id_for(v) for v in set(venues)}
+
+
+def resolve_stadium(venue_name: str) -> Stadium:
+    """Match a Cricsheet venue string to a known stadium, or a generic stand-in."""
+    sid = stadium_id_for(venue_name)
+    if sid:
+        return STADIUMS_BY_ID[sid]
 
     log.warning("No stadium match for '%s' — using generic dimensions", venue_name)
     return Stadium(
@@ -49,10 +164,15 @@ def extract_game_details(match_data: dict, stadium: Stadium) -> dict:
 
     match_date = info.get("dates", ["2008-01-01"])[0]
 
-    weather = get_match_weather(stadium.lat, stadium.lon, match_date) or {
-        "air_temp": None, "humidity": None, "wind": None,
-        "rain": None, "summary": "Unavailable", "source": "N/A",
-    }
+    # Pack and cached series, then summaries cached by older versions — only
+    # a venue-date none of them cover goes to the network
+    hourly = get_hourly_weather(stadium.lat, stadium.lon, match_date, fetch=False)
+    weather = cached_summary(stadium.lat, stadium.lon, match_date) if not hourly else None
+    if not hourly and not weather:
+        hourly = get_hourly_weather(stadium.lat, stadium.lon, match_date)
+    if hourly:
+        weather = conditions_at(hourly, MATCH_START_HOUR)
+    weather = weather or dict(_NO_WEATHER)
 
     # Grab the first powerplay block we can find
     powerplay = None
@@ -80,17 +200,30 @@ def extract_game_details(match_data: dict, stadium: Stadium) -> dict:
         "target": target,
         "powerplay": powerplay,
         "weather": weather,
+        "weather_hourly": hourly,
     }
 
 
-def load_match_and_stadium(file_path: str):
+def weather_for_over(details: dict, innings: int, over: int) -> dict:
+    """
+    Conditions at the hour a given over was bowled, read from the match's
+    hourly series.  Falls back to the start-of-match sample when there's
+    no series (e.g. offline with no pack).
+    """
+    hourly = details.get("weather_hourly")
+    if not hourly:
+        return details.get("weather", _NO_WEATHER)
+    return conditions_at(hourly, hour_for_over(innings, over))
+
+
+def load_match_and_stadium(match_ref: str):
     """
-    One-shot loader: reads the JSON, resolves the stadium, and hydrates
-    the game-details dict (including weather).  Returns a triple.
+    One-shot loader: reads the match (by id or file path — see
+    data_io.cricsheet.load_match), resolves the stadium, and hydrates the
+    game-details dict (including weather).  Returns a triple.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            match_data = json.load(f)
+        match_data = load_match(match_ref)
     except Exception as exc:
         log.error("Failed to load match file: %s", exc)
         return None, None, None
@@ -0,0 +1,68 @@
+"""
+Speculative match loading for the selection screen.
+
+People hover a row well before they click it.  Once the hover has dwelt
+long enough the app asks for that match here, and a single background
+worker runs the normal data_io.match_cache.get_match for it — JSON,
+stadium, events, weather — so by the time the click lands the match is
+usually sitting in the memory cache.
+
+At most one request waits behind the one running; asking for a new one
+cancels any that haven't started.  A load that's already running can't be
+interrupted, but it isn't wasted either — it warms the cache, and stays
+tracked until it finishes so a click on that row waits for it instead of
+loading the match a second time.
+"""
+
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from data_io.match_cache import LoadedMatch, get_match, is_cached
+
+log = logging.getLogger(__name__)
+
+
+class Prefetcher:
+
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._futures: "OrderedDict[str, Future]" = OrderedDict()
+
+    def request(self, match_id: str):
+        """Start loading `match_id` in the background unless it's cached or already on its way."""
+        self._reap()
+        if match_id in self._futures or is_cached(match_id):
+            return
+        self.cancel_pending()
+        self._futures[match_id] = self._pool.submit(get_match, match_id)
+        log.debug("Prefetching %s", match_id)
+
+    def cancel_pending(self, keep: Optional[str] = None):
+        """Drop queued loads that haven't started (except `keep`)."""
+        for match_id, fut in list(self._futures.items()):
+            if match_id != keep and fut.cancel():
+                del self._futures[match_id]
+
+    def get(self, match_id: str) -> Optional[LoadedMatch]:
+        """
+        The match, waiting on an in-flight prefetch rather than loading it a
+        second time.  Falls through to a normal load otherwise.
+        """
+        fut = self._futures.pop(match_id, None)
+        self.cancel_pending()
+        if fut is not None and not fut.cancelled():
+            try:
+                return fut.result()
+            except Exception as exc:
+                log.warning("Prefetch of %s failed: %s", match_id, exc)
+        return get_match(match_id)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _reap(self):
+        for match_id, fut in list(self._futures.items()):
+            if fut.done():
+                del self._futures[match_id]
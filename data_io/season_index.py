@@ -1,20 +1,28 @@
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-from engine.paths import get_resource_path
+from data_io.archive import IPL_JSON_DIR, match_id_for, open_archive
+from data_io.match_context import resolve_venues
 
 log = logging.getLogger(__name__)
 
-IPL_JSON_DIR = get_resource_path("data/ipl_json")
 CACHE_FILENAME = ".index.json"
 
+# Background builds and the UI both index seasons; one at a time, so two
+# threads never write the same .index.json at once
+_index_lock = threading.Lock()
+
 logging.basicConfig(level=logging.WARNING)
 
 
 def list_seasons() -> List[str]:
     """Scan the data directory for year-named folders (e.g. '2008', '2024')."""
+    archive = open_archive()
+    if archive:
+        return archive.seasons()
     if not IPL_JSON_DIR.exists():
         log.warning("Data directory missing: %s", IPL_JSON_DIR)
         return []
@@ -29,25 +37,38 @@ def list_matches_for_season(season: str, use_cache: bool = True) -> List[Dict[st
     that we stash a .index.json cache so subsequent launches skip the parse.
     The cache is invalidated whenever the folder's mtime is newer (i.e. you
     dropped in new match files).
+
+    With a packed archive (data_io.archive) none of that happens — the
+    index ships inside it.
     """
+    archive = open_archive()
+    if archive:
+        return attach_stadium_ids(archive.matches(season))
+    with _index_lock:
+        return _index_loose(season, use_cache)
+
+
+def _index_loose(season: str, use_cache: bool) -> List[Dict[str, Any]]:
     season_dir = IPL_JSON_DIR / season
     if not season_dir.exists():
         return []
 
     cache_path = season_dir / CACHE_FILENAME
 
-    # Fast path: if the cache is still fresh, use it
+    # Fast path: if the cache is still fresh, use it.  Indexes written before
+    # stadium ids existed just get them attached on the way out.
     if use_cache and _cache_is_fresh(season_dir, cache_path):
         try:
             with open(cache_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+                return attach_stadium_ids(_attach_ids(season, json.load(f)))
         except (json.JSONDecodeError, OSError):
             log.warning("Corrupt cache for season %s — rebuilding", season)
 
     # Slow path: parse every JSON in the folder
     json_files = [f for f in season_dir.glob("*.json") if f.name != CACHE_FILENAME]
-    matches = [m for f in json_files if (m := _parse_match_meta(f))]
+    matches = _attach_ids(season, [m for f in json_files if (m := _parse_match_meta(f))])
     matches.sort(key=lambda m: (m.get("date", ""), m.get("match_number", 999)))
+    attach_stadium_ids(matches)
 
     try:
         with open(cache_path, "w", encoding="utf-8") as f:
@@ -58,6 +79,32 @@ def list_matches_for_season(season: str, use_cache: bool = True) -> List[Dict[st
     return matches
 
 
+def attach_stadium_ids(matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Resolve every distinct venue once and stamp its stadium id on each match."""
+    ids = resolve_venues(m["venue"] for m in matches if "stadium_id" not in m)
+    for m in matches:
+        if "stadium_id" not in m:
+            m["stadium_id"] = ids[m["venue"]]
+    return matches
+
+
+def _attach_ids(season: str, matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Stamp the corpus-wide match id (see data_io.archive) on each entry."""
+    for m in matches:
+        m.setdefault("id", match_id_for(season, m["filename"]))
+    return matches
+
+
+def unresolved_venues() -> Dict[str, List[str]]:
+    """Venue strings in the corpus we can't place, mapped to the files using them."""
+    missing: Dict[str, List[str]] = {}
+    for season in list_seasons():
+        for m in list_matches_for_season(season):
+            if m.get("stadium_id") is None:
+                missing.setdefault(m["venue"], []).append(m["filename"])
+    return missing
+
+
 # ---------------------------------------------------------------------------
 
 def _cache_is_fresh(season_dir: Path, cache_path: Path) -> bool:
@@ -0,0 +1,212 @@
+"""
+Per-season and corpus-wide aggregates the views ask for, computed from
+the corpus on first use and memoised for the session.  The per-match work
+goes through data_io.mapreduce, so its on-disk result cache makes later
+launches cheap.
+
+The corpus-wide tables — careers, the delivery index, ball outcomes — come
+from one pass: each match is decoded once and mapped for all three, on a
+niced process pool, so a cold build neither decodes the corpus three
+times nor fights the render loop for the GIL.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Generic, NamedTuple, Optional, TypeVar
+
+from data_io.mapreduce import run_corpus
+from data_io.match_context import stadium_id_for
+from engine.careers import CareerTable, career_rows
+from engine.query import DeliveryIndex, delivery_block
+from engine.simulate import OutcomeTallies, add_counts, lower_priority, outcome_counts
+from engine.standings import SeasonStandings, abandoned_results, match_result
+
+log = logging.getLogger(__name__)
+
+# Bump when match_result changes shape or rules
+RESULTS_CACHE = ("match_results", 2)
+# Bump when career_rows, delivery_block or outcome_counts change
+CORPUS_CACHE = ("corpus_tables", 2)
+
+# Leave a core for the render loop
+CORPUS_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# A failed background build is retried after this long, doubling each time up to the cap
+RETRY_FIRST_S = 5.0
+RETRY_MAX_S = 300.0
+
+T = TypeVar("T")
+
+
+def _collect(acc, item):
+    acc.append(item)
+    return acc
+
+
+# -- Corpus-wide builds -------------------------------------------------------
+
+class _CorpusBuild(Generic[T]):
+    """
+    A whole-corpus aggregate, built once.  A cold build maps every match
+    (several seconds), so frame code polls if_ready() — which starts a
+    background build the first time — instead of blocking in get().  A
+    background build that raises is recorded (`failed`) and started again
+    by a later poll, after a backoff.
+    """
+
+    def __init__(self, name: str, build: Callable[[], T]):
+        self.name = name
+        self._build = build
+        self._value: Optional[T] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._failures = 0
+        self._retry_at = 0.0
+
+    def get(self) -> T:
+        with self._lock:
+            if self._value is None:
+                self._value = self._build()
+            return self._value
+
+    def if_ready(self) -> Optional[T]:
+        if self._value is not None:
+            return self._value
+        if self._thread is None and time.monotonic() >= self._retry_at:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return None
+
+    @property
+    def failed(self) -> bool:
+        """True while the last background build failed and the next hasn't started."""
+        return self._failures > 0 and self._thread is None and self._value is None
+
+    def _run(self):
+        try:
+            self.get()
+            self._failures = 0
+        except Exception:
+            self._failures += 1
+            delay = min(RETRY_MAX_S, RETRY_FIRST_S * 2 ** (self._failures - 1))
+            self._retry_at = time.monotonic() + delay
+            log.exception("Building %s failed (attempt %d) — retrying in %.0f s", self.name, self._failures, delay)
+        finally:
+            self._thread = None
+
+
+class CorpusTables(NamedTuple):
+    careers: CareerTable
+    deliveries: DeliveryIndex
+    outcomes: OutcomeTallies
+
+
+def corpus_row(record):
+    """Map step for the shared pass: one match's career rows, delivery block and outcome counts."""
+    return career_rows(record), delivery_block(record), outcome_counts(record)
+
+
+def _add_corpus_row(acc, item):
+    rows, blocks, by_season = acc
+    career, block, counts = item
+    rows.append(career)
+    blocks.append(block)
+    add_counts(by_season, counts)
+    return acc
+
+
+def _build_corpus() -> CorpusTables:
+    try:
+        acc, stats = run_corpus(corpus_row, _add_corpus_row, ([], [], {}), cache=CORPUS_CACHE,
+                                workers=CORPUS_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+                                initializer=lower_priority)
+    except (BrokenProcessPool, OSError) as exc:
+        log.warning("Corpus pool failed (%s) — mapping in-process", exc)
+        acc, stats = run_corpus(corpus_row, _add_corpus_row, ([], [], {}), cache=CORPUS_CACHE, workers=1)
+    rows, blocks, by_season = acc
+    tables = CorpusTables(
+        careers=CareerTable(rows),
+        deliveries=DeliveryIndex(blocks, venue_for=lambda v: stadium_id_for(v) or v),
+        outcomes=OutcomeTallies(by_season),
+    )
+    log.info("Corpus tables: %d players, %d deliveries — %s", len(tables.careers), len(tables.deliveries), stats)
+    return tables
+
+
+def _build_standings(season: str) -> SeasonStandings:
+    # In-process: one season is ~70 matches, and forking the app's process
+    # (pygame and all) for that isn't worth it
+    results, stats = run_corpus(match_result, _collect, [], seasons=[season], cache=RESULTS_CACHE, workers=1)
+    log.info("Standings for %s: %s", season, stats)
+    return SeasonStandings.from_results(results + abandoned_results(season))
+
+
+_corpus = _CorpusBuild("corpus-tables", _build_corpus)
+_standings: Dict[str, _CorpusBuild[SeasonStandings]] = {}
+
+
+def _standings_for(season: str) -> _CorpusBuild[SeasonStandings]:
+    if season not in _standings:
+        _standings[season] = _CorpusBuild(f"standings-{season}", lambda: _build_standings(season))
+    return _standings[season]
+
+
+def season_standings(season: str) -> SeasonStandings:
+    """Cumulative league table for `season` (see engine.standings) — blocks on first use."""
+    return _standings_for(season).get()
+
+
+def season_standings_if_ready(season: str) -> Optional[SeasonStandings]:
+    """The season's standings, or None while they're still building in the background."""
+    return _standings_for(season).if_ready()
+
+
+def season_standings_failed(season: str) -> bool:
+    """True if the season's standings build failed; if_ready() will try again after a backoff."""
+    return _standings_for(season).failed
+
+
+def _ready() -> Optional[CorpusTables]:
+    return _corpus.if_ready()
+
+
+def corpus_tables_failed() -> bool:
+    """True if the career/delivery/outcome build failed; the *_if_ready() calls retry after a backoff."""
+    return _corpus.failed
+
+
+def career_table() -> CareerTable:
+    """Career prefix table over the whole corpus (engine.careers) — blocks on first use."""
+    return _corpus.get().careers
+
+
+def career_table_if_ready() -> Optional[CareerTable]:
+    """The career table, or None while it's still building in the background."""
+    tables = _ready()
+    return tables.careers if tables else None
+
+
+def delivery_index() -> DeliveryIndex:
+    """Query index over every delivery (engine.query) — blocks on first use."""
+    return _corpus.get().deliveries
+
+
+def delivery_index_if_ready() -> Optional[DeliveryIndex]:
+    """The delivery index, or None while it's still building in the background."""
+    tables = _ready()
+    return tables.deliveries if tables else None
+
+
+def outcome_tallies() -> OutcomeTallies:
+    """Per-season ball outcomes for the simulator (engine.simulate) — blocks on first use."""
+    return _corpus.get().outcomes
+
+
+def outcome_tallies_if_ready() -> Optional[OutcomeTallies]:
+    """The outcome tallies, or None while they're still building in the background."""
+    tables = _ready()
+    return tables.outcomes if tables else None
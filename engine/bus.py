@@ -0,0 +1,35 @@
+"""
+A small publish/subscribe bus for replay state changes.
+
+Whenever the MatchState on screen moves — a ball bowled or taken back, a
+seek, a new match — main publishes the StateDiff between the old state
+and the new one.  Views that keep rendered surfaces subscribe to the
+fields they draw and drop just those surfaces; the rest go on blitting
+what they rendered last.
+"""
+
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from engine.reducer import StateDiff
+
+
+class StateBus:
+
+    def __init__(self):
+        self._subscribers: List[Tuple[Callable[[StateDiff], None], Optional[frozenset], bool]] = []
+
+    def subscribe(self, callback: Callable[[StateDiff], None], fields: Iterable[str] = None,
+                  boundaries: bool = False):
+        """
+        Call `callback(diff)` for diffs that change any of `fields` (every
+        non-empty diff if None) or, with `boundaries`, that cross an over
+        or innings.
+        """
+        self._subscribers.append((callback, frozenset(fields) if fields is not None else None, boundaries))
+
+    def publish(self, diff: StateDiff):
+        if not diff:
+            return
+        for callback, fields, boundaries in self._subscribers:
+            if fields is None or diff.touches(fields) or (boundaries and (diff.over or diff.innings)):
+                callback(diff)
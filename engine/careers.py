@@ -0,0 +1,173 @@
+"""
+IPL career numbers as of any match, from per-player prefix sums.
+
+Each match contributes one row per player who appeared in it (see
+career_rows, a data_io.mapreduce map fn).  CareerTable stacks every
+player's rows in corpus order and keeps running totals, so a player's
+career going into match X is one searchsorted on their match ordinals
+plus a row read — no corpus scan per lookup.
+
+Super-over deliveries are left out, as the official records do.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from engine.columns import FLAG_LEGAL, FLAG_WIDE, FLAG_WICKET, NO_ID
+from engine.players import NO_PLAYER, get_registry
+
+# Column order of a career row / the prefix arrays
+FIELDS = (
+    "matches", "runs", "balls", "outs", "fours", "sixes",
+    "wickets", "balls_bowled", "runs_conceded",
+)
+
+# Dismissal kinds that don't count as an out for the batter, or a wicket for the bowler
+NOT_OUT_KINDS = frozenset({"retired hurt", "retired not out"})
+NOT_BOWLER_KINDS = frozenset({"run out", "retired hurt", "retired not out", "retired out", "obstructing the field"})
+
+
+@dataclass(frozen=True)
+class CareerStats:
+    matches: int = 0
+    runs: int = 0
+    balls: int = 0
+    outs: int = 0
+    fours: int = 0
+    sixes: int = 0
+    wickets: int = 0
+    balls_bowled: int = 0
+    runs_conceded: int = 0
+
+    @property
+    def batting_avg(self) -> Optional[float]:
+        return self.runs / self.outs if self.outs else None
+
+    @property
+    def strike_rate(self) -> float:
+        return self.runs * 100 / self.balls if self.balls else 0.0
+
+    @property
+    def economy(self) -> float:
+        return self.runs_conceded * 6 / self.balls_bowled if self.balls_bowled else 0.0
+
+    def plus_innings(self, runs=0, balls=0, fours=0, sixes=0,
+                     wickets=0, balls_bowled=0, runs_conceded=0) -> "CareerStats":
+        """These numbers with a live, in-progress innings added on top."""
+        return CareerStats(
+            self.matches + 1, self.runs + runs, self.balls + balls, self.outs,
+            self.fours + fours, self.sixes + sixes, self.wickets + wickets,
+            self.balls_bowled + balls_bowled, self.runs_conceded + runs_conceded,
+        )
+
+
+NO_CAREER = CareerStats()
+
+
+# -- Map step -----------------------------------------------------------------
+
+def career_rows(record) -> Tuple[str, List[Tuple[str, str, List[int]]]]:
+    """
+    (match_id, [(registry key, name, row)]) for everyone in the match's
+    squads.  Keys rather than ids cross the process boundary, since a
+    worker's registry may number unseen players differently.
+    """
+    cols = record.columns
+    reg = get_registry()
+    regular = cols.innings <= 2
+    flags = cols.flags[regular]
+    bat, bowl = cols.batter[regular], cols.bowler[regular]
+    runs_bat, runs_tot = cols.runs_batter[regular], cols.runs_total[regular]
+
+    squad = set(reg.register_match(record.info).values())
+    ids = np.array(sorted(squad | set(bat.tolist()) | set(bowl.tolist())), dtype=np.int64)
+    n = len(ids)
+
+    def tally(players, weights=None):
+        return np.bincount(np.searchsorted(ids, players), weights=weights, minlength=n).astype(np.int64)
+
+    wide = (flags & FLAG_WIDE) != 0
+    legal = (flags & FLAG_LEGAL) != 0
+    # Byes and leg byes aren't the bowler's — but a no-ball's penalty run still is
+    not_bowlers = cols.runs_byes[regular]
+
+    # Wickets: outs for whoever was dismissed, credit for the bowler if it's theirs
+    kinds = cols.dismissal[regular]
+    wkt = ((flags & FLAG_WICKET) != 0) & (kinds != NO_ID)
+    kind_names = [cols.kinds[k] for k in kinds[wkt].tolist()]
+    out_ids = cols.player_out[regular][wkt]
+    counted_out = np.array([k not in NOT_OUT_KINDS for k in kind_names], dtype=bool)
+    credited = np.array([k not in NOT_BOWLER_KINDS for k in kind_names], dtype=bool)
+    outs = out_ids[counted_out & (out_ids != NO_PLAYER) & np.isin(out_ids, ids)]
+
+    table = np.stack([
+        np.ones(n, dtype=np.int64),
+        tally(bat, runs_bat),
+        tally(bat, ~wide),
+        tally(outs),
+        tally(bat, runs_bat == 4),
+        tally(bat, runs_bat == 6),
+        tally(bowl[wkt][credited]),
+        tally(bowl, legal),
+        tally(bowl, runs_tot - not_bowlers),
+    ], axis=1)
+
+    names = dict(cols.names)
+    rows = []
+    for pid, row in zip(ids.tolist(), table.tolist()):
+        if pid >= 0:
+            rows.append((reg.keys[pid], names.get(pid) or reg.name(pid), row))
+    return record.match_id, rows
+
+
+# -- Prefix table -------------------------------------------------------------
+
+class CareerTable:
+    """
+    Every player's running career totals.  Build it from career_rows
+    results in corpus order (oldest first), which is what run_corpus
+    hands its reduce step.
+    """
+
+    def __init__(self, per_match: List[Tuple[str, list]]):
+        self.match_index: Dict[str, int] = {}
+        reg = get_registry()
+
+        rows_by_player: Dict[int, Tuple[List[int], List[List[int]]]] = {}
+        for ordinal, (match_id, rows) in enumerate(per_match):
+            self.match_index[match_id] = ordinal
+            for key, name, row in rows:
+                ords, vals = rows_by_player.setdefault(reg.id_for(key, name), ([], []))
+                ords.append(ordinal)
+                vals.append(row)
+
+        # pid → (match ordinals ascending, cumulative totals — row i covers matches 0..i)
+        self._prefix: Dict[int, Tuple[np.ndarray, np.ndarray]] = {
+            pid: (np.asarray(ords, dtype=np.int32), np.cumsum(np.asarray(vals, dtype=np.int32), axis=0))
+            for pid, (ords, vals) in rows_by_player.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._prefix)
+
+    def before(self, player_id: int, match_id: str) -> CareerStats:
+        """Career totals going into `match_id` (that match excluded)."""
+        entry = self._prefix.get(player_id)
+        ordinal = self.match_index.get(match_id)
+        if entry is None or ordinal is None:
+            return NO_CAREER
+        ords, cum = entry
+        i = int(np.searchsorted(ords, ordinal, side="left"))
+        return CareerStats(*cum[i - 1].tolist()) if i else NO_CAREER
+
+    def through(self, player_id: int, match_id: str) -> CareerStats:
+        """Career totals including `match_id`."""
+        entry = self._prefix.get(player_id)
+        ordinal = self.match_index.get(match_id)
+        if entry is None or ordinal is None:
+            return NO_CAREER
+        ords, cum = entry
+        i = int(np.searchsorted(ords, ordinal, side="right"))
+        return CareerStats(*cum[i - 1].tolist()) if i else NO_CAREER
@@ -0,0 +1,210 @@
+"""
+Struct-of-arrays storage for a match's deliveries.
+
+A list of BallEvents costs one object per ball plus whatever it points at.
+EventColumns keeps the same data as parallel NumPy columns — registry ids
+for players, small ints for teams, one bit-packed flags byte per ball — so
+scanning or slicing a match is array work, not object churn.  Index it like
+a list and you get a BallEvent built on the spot; slice it and you get
+another EventColumns viewing the same buffers.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from engine.events import BallEvent, NO_FIELDERS
+from engine.players import NO_PLAYER
+
+# Bit layout of the `flags` column
+FLAG_LEGAL  = 1 << 0
+FLAG_WIDE   = 1 << 1
+FLAG_NOBALL = 1 << 2
+FLAG_BYE    = 1 << 3
+FLAG_LEGBYE = 1 << 4
+FLAG_WICKET = 1 << 5
+FLAG_NON_BOUNDARY = 1 << 6     # runs.non_boundary: all-run four or six
+
+NO_ID = -1      # dismissal column for balls without a wicket
+
+# The per-ball arrays, in storage order (fielder_ids is the flat ragged one)
+COLUMNS = (
+    "innings", "over", "ball",
+    "batter", "bowler", "non_striker", "batting_team", "bowling_team",
+    "runs_batter", "runs_extras", "runs_total", "runs_byes", "flags",
+    "dismissal", "player_out", "fielder_offsets", "fielder_ids",
+)
+
+
+class EventColumns:
+    """
+    One match's deliveries as columns.  Player columns hold registry ids
+    (engine.players) and `names` maps each id to the spelling this match
+    used; `teams` and `kinds` are per-match string tables.  Fielders are
+    ragged, so they live in one flat id array addressed by per-ball offsets.
+    """
+
+    __slots__ = ("match_id", "date", "names", "teams", "kinds") + COLUMNS
+
+    def __init__(self, match_id, date, names, teams, kinds, **cols):
+        self.match_id = match_id
+        self.date = date
+        self.names: Dict[int, str] = names
+        self.teams: List[str] = teams
+        self.kinds: List[str] = kinds
+        for key in COLUMNS:
+            setattr(self, key, cols[key])
+
+    # -- Construction ---------------------------------------------------------
+
+    @classmethod
+    def from_events(cls, events: Iterable[BallEvent]) -> "EventColumns":
+        events = list(events)
+        teams, kinds = _Table(), _Table()
+        names = {}
+
+        fielder_offsets = [0]
+        fielder_ids = []
+        for e in events:
+            names[e.batter_id] = e.batter
+            names[e.bowler_id] = e.bowler
+            names[e.non_striker_id] = e.non_striker
+            if e.player_out is not None:
+                names[e.player_out_id] = e.player_out
+            names.update(zip(e.fielder_ids, e.fielders))
+            fielder_ids.extend(e.fielder_ids)
+            fielder_offsets.append(len(fielder_ids))
+
+        def col(values, dtype):
+            return np.fromiter(values, dtype=dtype, count=len(events))
+
+        first = events[0] if events else None
+        return cls(
+            match_id=first.match_id if first else None,
+            date=first.date if first else None,
+            names=names, teams=teams.values, kinds=kinds.values,
+            innings=col((e.innings for e in events), np.int8),
+            over=col((e.over for e in events), np.int16),
+            ball=col((e.ball for e in events), np.int16),
+            batter=col((e.batter_id for e in events), np.int32),
+            bowler=col((e.bowler_id for e in events), np.int32),
+            non_striker=col((e.non_striker_id for e in events), np.int32),
+            batting_team=col((teams.id(e.batting_team) for e in events), np.int16),
+            bowling_team=col((teams.id(e.bowling_team) for e in events), np.int16),
+            runs_batter=col((e.runs_batter for e in events), np.int16),
+            runs_extras=col((e.runs_extras for e in events), np.int16),
+            runs_total=col((e.runs_total for e in events), np.int16),
+            runs_byes=col((e.runs_byes for e in events), np.int16),
+            flags=col((_pack_flags(e) for e in events), np.uint8),
+            dismissal=col((kinds.id(e.dismissal_kind) if e.dismissal_kind else NO_ID for e in events), np.int16),
+            player_out=col((e.player_out_id for e in events), np.int32),
+            fielder_offsets=np.asarray(fielder_offsets, dtype=np.int32),
+            fielder_ids=np.asarray(fielder_ids, dtype=np.int32),
+        )
+
+    # -- Sequence protocol ----------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self._event(i) for i in range(start, stop, step)]
+            return self._view(start, max(start, stop))
+        i = int(key)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("EventColumns index out of range")
+        return self._event(i)
+
+    def __iter__(self) -> Iterator[BallEvent]:
+        for i in range(len(self)):
+            yield self._event(i)
+
+    def _view(self, start: int, stop: int) -> "EventColumns":
+        cols = {key: getattr(self, key)[start:stop] for key in COLUMNS}
+        # Offsets need one extra entry to close the last ball's fielder run
+        cols["fielder_offsets"] = self.fielder_offsets[start:stop + 1]
+        cols["fielder_ids"] = self.fielder_ids
+        return EventColumns(self.match_id, self.date, self.names, self.teams, self.kinds, **cols)
+
+    def _event(self, i: int) -> BallEvent:
+        flags = int(self.flags[i])
+        kind = int(self.dismissal[i])
+        out = int(self.player_out[i])
+        bat, bowl, ns = int(self.batter[i]), int(self.bowler[i]), int(self.non_striker[i])
+        lo, hi = self.fielder_offsets[i], self.fielder_offsets[i + 1]
+        fielder_ids = tuple(self.fielder_ids[lo:hi].tolist())
+        return BallEvent(
+            match_id=self.match_id,
+            date=self.date,
+            innings=int(self.innings[i]),
+            batting_team=self.teams[self.batting_team[i]],
+            bowling_team=self.teams[self.bowling_team[i]],
+            over=int(self.over[i]),
+            ball=int(self.ball[i]),
+            batter=self.names[bat],
+            bowler=self.names[bowl],
+            non_striker=self.names[ns],
+            runs_batter=int(self.runs_batter[i]),
+            runs_extras=int(self.runs_extras[i]),
+            runs_total=int(self.runs_total[i]),
+            runs_byes=int(self.runs_byes[i]),
+            is_legal=bool(flags & FLAG_LEGAL),
+            is_wide=bool(flags & FLAG_WIDE),
+            is_noball=bool(flags & FLAG_NOBALL),
+            is_bye=bool(flags & FLAG_BYE),
+            is_legbye=bool(flags & FLAG_LEGBYE),
+            is_wicket=bool(flags & FLAG_WICKET),
+            dismissal_kind=self.kinds[kind] if kind != NO_ID else None,
+            player_out=self.names[out] if out != NO_PLAYER else None,
+            fielders=tuple(self.names[f] for f in fielder_ids) or NO_FIELDERS,
+            non_boundary=bool(flags & FLAG_NON_BOUNDARY),
+            batter_id=bat,
+            bowler_id=bowl,
+            non_striker_id=ns,
+            player_out_id=out,
+            fielder_ids=fielder_ids,
+        )
+
+    # -- Column helpers -------------------------------------------------------
+
+    def mask(self, flag: int) -> np.ndarray:
+        """Boolean array of balls with the given FLAG_* bit set."""
+        return (self.flags & flag) != 0
+
+    def name(self, player_id: int) -> Optional[str]:
+        return self.names.get(player_id)
+
+
+# -- Internals ----------------------------------------------------------------
+
+class _Table:
+    """Insertion-ordered string → dense int table for per-match lookups."""
+    __slots__ = ("values", "_ids")
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._ids = {}
+
+    def id(self, value: str) -> int:
+        i = self._ids.get(value)
+        if i is None:
+            i = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+
+def _pack_flags(e: BallEvent) -> int:
+    return (
+        (FLAG_LEGAL if e.is_legal else 0)
+        | (FLAG_WIDE if e.is_wide else 0)
+        | (FLAG_NOBALL if e.is_noball else 0)
+        | (FLAG_BYE if e.is_bye else 0)
+        | (FLAG_LEGBYE if e.is_legbye else 0)
+        | (FLAG_WICKET if e.is_wicket else 0)
+        | (FLAG_NON_BOUNDARY if e.non_boundary else 0)
+    )
@@ -1,5 +1,10 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from engine.players import NO_PLAYER
+
+# Shared by every delivery without a catch/run-out — no per-event allocation
+NO_FIELDERS: Tuple[str, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -12,7 +17,7 @@ class BallEvent:
     savings matter.
     """
     # Who's playing and when
-    match_id: Optional[int]
+    match_id: Optional[str]     # corpus id, '<season>/<cricsheet id>'
     date: Optional[str]
     innings: int
     batting_team: str
@@ -43,4 +48,19 @@ class BallEvent:
     is_wicket: bool
     dismissal_kind: Optional[str] = None
     player_out: Optional[str] = None
-    fielders: List[str] = field(default_factory=list)
\ No newline at end of file
+    fielders: Tuple[str, ...] = NO_FIELDERS
+
+    # Bye and leg-bye runs — the part of runs_extras that isn't charged to the
+    # bowler (a no-ball's penalty run is, even when byes were run off it too)
+    runs_byes: int = 0
+
+    # Cricsheet's runs.non_boundary: a four or six that was run, not hit over the rope
+    non_boundary: bool = False
+
+    # Registry ids (engine.players) for the names above — what state and
+    # aggregations key on, since names aren't unique or stable
+    batter_id: int = NO_PLAYER
+    bowler_id: int = NO_PLAYER
+    non_striker_id: int = NO_PLAYER
+    player_out_id: int = NO_PLAYER
+    fielder_ids: Tuple[int, ...] = ()
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Match-level state: one MatchState per innings, super overs included.
+
+A MatchState describes a single innings, so each innings folds from its
+own starting state — the right teams, its ball quota (a rain-revised one
+can end part-way through an over), its wicket limit (two in a super
+over) and, for a chase, its target — instead of carrying the previous
+innings' score on.
+Targets come from the Cricsheet `target` block where there is one (which
+also covers rain-revised chases) and from the previous innings' total
+where there isn't.
+
+Every innings keeps its own StateCheckpoints, so the state of any innings
+at any point is one checkpoint plus a handful of balls away.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from engine.columns import EventColumns
+from engine.navigation import StateCheckpoints
+from engine.reducer import BallDelta, StateDiff, apply_ball_undoable, diff_states, revert_ball
+from engine.state import MatchState
+from engine.winprob import chase_target
+
+SUPER_OVER_BALLS = 6
+SUPER_OVER_WICKETS = 2
+
+
+class MatchStates:
+
+    def __init__(self, cols: EventColumns, raw: dict):
+        self.cols = cols
+        headers = raw.get("innings", [])
+        info = raw.get("info", {})
+        teams = info.get("teams", [])
+        overs = int(info.get("overs") or 20)
+
+        self.spans: Dict[int, Tuple[int, int]] = {}
+        self.starts: Dict[int, MatchState] = {}
+        self.checkpoints: Dict[int, StateCheckpoints] = {}
+
+        numbers = cols.innings
+        for inn in dict.fromkeys(numbers.tolist()):
+            balls = np.flatnonzero(numbers == inn)
+            lo, hi = int(balls[0]), int(balls[-1]) + 1
+            self.spans[inn] = (lo, hi)
+
+            head = headers[inn - 1] if inn <= len(headers) else {}
+            batting = head.get("team") or cols.teams[cols.batting_team[lo]]
+            bowling = next((t for t in teams if t != batting), cols.teams[cols.bowling_team[lo]])
+            target, quota = self._target(inn, head, headers, info, overs)
+            self.starts[inn] = MatchState(
+                batting_team=batting, bowling_team=bowling,
+                balls_limit=quota, target=target,
+                wickets_limit=SUPER_OVER_WICKETS if head.get("super_over") else 10,
+            )
+            self.checkpoints[inn] = StateCheckpoints(cols[lo:hi], start=self.starts[inn])
+
+        self.first = int(numbers[0]) if len(cols) else 1
+
+    def _target(self, inn, head, headers, info, overs):
+        """(target or None, balls available) for innings `inn`."""
+        if head.get("super_over"):
+            block = head.get("target") or {}
+            if inn % 2 == 0:
+                prev = self.spans.get(inn - 1)
+                runs = block.get("runs") or (int(self.cols.runs_total[prev[0]:prev[1]].sum()) + 1 if prev else None)
+                return runs, SUPER_OVER_BALLS
+            return None, SUPER_OVER_BALLS
+        if inn == 2:
+            return chase_target(self.cols, headers, info)
+        return None, overs * 6
+
+    # -- Lookups --------------------------------------------------------------
+
+    def innings_at(self, index: int) -> int:
+        """The innings of the last ball bowled before `index` (the first innings at 0)."""
+        return int(self.cols.innings[min(index, len(self.cols)) - 1]) if index > 0 else self.first
+
+    def state_at(self, index: int) -> MatchState:
+        """The innings in progress after `index` balls — or just finished, at an innings break."""
+        if not self.spans:
+            return MatchState()
+        return self.innings_state(self.innings_at(index), index)
+
+    def innings_state(self, innings: int, index: int = None) -> MatchState:
+        """Innings `innings` as it stood at timeline `index` (its end if None)."""
+        lo, hi = self.spans[innings]
+        index = hi if index is None else max(lo, min(index, hi))
+        return self.checkpoints[innings].state_at(index - lo)
+
+    # -- Stepping -------------------------------------------------------------
+
+    def apply(self, state: MatchState, event, position: int) -> Tuple[MatchState, BallDelta]:
+        """Fold `event`, the ball at `position`, into `state`; an innings' first ball starts from its own blank state."""
+        if position == self.spans[event.innings][0]:
+            state = self.starts[event.innings]
+        return apply_ball_undoable(state, event)
+
+    def revert(self, state: MatchState, delta: BallDelta, position: int) -> MatchState:
+        """Undo the ball at `position`.  Undoing an innings' first ball goes back to the one before."""
+        inn = int(self.cols.innings[position])
+        if position == self.spans[inn][0]:
+            return self.state_at(position)
+        return revert_ball(state, delta)
+
+    # -- Diffs ----------------------------------------------------------------
+
+    def _over_at(self, index: int) -> Tuple[int, int]:
+        """(innings, over) of the last ball bowled before `index`; over -1 before the first ball."""
+        if index <= 0:
+            return self.first, -1
+        i = min(index, len(self.cols)) - 1
+        return int(self.cols.innings[i]), int(self.cols.over[i])
+
+    def diff(self, before: MatchState, after: MatchState, was: int, now: int) -> StateDiff:
+        """What changed moving the replay from `was` balls bowled (showing `before`) to `now` (`after`)."""
+        a, b = self._over_at(was), self._over_at(now)
+        return diff_states(before, after, over=a != b, innings=a[0] != b[0])
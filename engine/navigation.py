@@ -0,0 +1,106 @@
+"""
+Jumping around a match: where each ball is, and the state at any point.
+
+BallIndex is built once per match from its EventColumns.  It maps a ball
+address — (innings, over, legal ball) — to its timeline position, and
+keeps sorted jump targets for overs, wickets, boundaries, innings breaks
+and powerplay ends.  For every target kind it also precomputes the next
+and previous target from each timeline index, so a jump is two array
+reads, not a search.
+
+Jump targets are timeline indices, i.e. "this many balls bowled": a
+wicket or boundary lands just after the ball itself, an over or innings
+lands just before its first ball.
+
+StateCheckpoints pairs with it: a MatchState every CHECKPOINT_EVERY balls,
+so the state at any index is one checkpoint plus at most that many balls
+through apply_range — the same cost wherever the jump lands.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from engine.columns import EventColumns, FLAG_LEGAL, FLAG_NON_BOUNDARY, FLAG_WICKET
+from engine.reducer import apply_range
+from engine.state import MatchState
+
+POWERPLAY_OVERS = 6
+CHECKPOINT_EVERY = 12
+
+# Jump target kinds, as used by BallIndex.next / prev
+TARGETS = ("over", "wicket", "boundary", "innings", "powerplay")
+
+
+class BallIndex:
+
+    def __init__(self, cols: EventColumns):
+        n = len(cols)
+        self.total = n
+        legal = (cols.flags & FLAG_LEGAL) != 0
+        positions = np.arange(n)
+
+        # Legal ball number within its over: 1–6, extras share the next legal ball's number
+        self.address: Dict[Tuple[int, int, int], int] = {}
+        inn, over = cols.innings.tolist(), cols.over.tolist()
+        count, prev = 0, None
+        for i, (a, b, ok) in enumerate(zip(inn, over, legal.tolist())):
+            if (a, b) != prev:
+                count, prev = 0, (a, b)
+            count += ok
+            # First position wins, so an address lands on the earliest ball bearing it
+            self.address.setdefault((a, b, count if ok else count + 1), i)
+
+        new_over = np.ones(n, dtype=bool)
+        new_over[1:] = (cols.innings[1:] != cols.innings[:-1]) | (cols.over[1:] != cols.over[:-1])
+        new_innings = np.ones(n, dtype=bool)
+        new_innings[1:] = cols.innings[1:] != cols.innings[:-1]
+        last_of_pp = np.zeros(n, dtype=bool)
+        last_of_pp[:-1] = (cols.over[:-1] == POWERPLAY_OVERS - 1) & new_over[1:]
+        last_of_pp[-1:] = cols.over[-1:] == POWERPLAY_OVERS - 1
+
+        self.targets: Dict[str, np.ndarray] = {
+            "over": np.append(positions[new_over], n),
+            "wicket": positions[(cols.flags & FLAG_WICKET) != 0] + 1,
+            # A four or six counts only if it reached the rope — all-run ones carry non_boundary
+            "boundary": positions[np.isin(cols.runs_batter, (4, 6)) & ((cols.flags & FLAG_NON_BOUNDARY) == 0)] + 1,
+            "innings": positions[new_innings],
+            "powerplay": positions[last_of_pp] + 1,
+        }
+
+        # next[kind][i]: first target after index i (or None); prev likewise before it
+        index = np.arange(n + 1)
+        self._next, self._prev = {}, {}
+        for kind, t in self.targets.items():
+            padded = np.concatenate([[-1], t, [-1]])
+            self._next[kind] = padded[np.searchsorted(t, index, side="right") + 1].tolist()
+            self._prev[kind] = padded[np.searchsorted(t, index, side="left")].tolist()
+
+    def position(self, innings: int, over: int, ball: int = 1) -> Optional[int]:
+        """Timeline position of a ball (over 0-based, ball 1–6 counting legal balls), or None."""
+        return self.address.get((innings, over, ball))
+
+    def next(self, kind: str, index: int) -> Optional[int]:
+        """The first `kind` target after timeline index `index`, or None if there isn't one."""
+        j = self._next[kind][max(0, min(index, self.total))]
+        return None if j < 0 else j
+
+    def prev(self, kind: str, index: int) -> Optional[int]:
+        j = self._prev[kind][max(0, min(index, self.total))]
+        return None if j < 0 else j
+
+
+class StateCheckpoints:
+    """MatchState after every `every` balls; state_at(i) folds the rest from the nearest one."""
+
+    def __init__(self, cols: EventColumns, every: int = CHECKPOINT_EVERY, start: MatchState = None):
+        self.cols = cols
+        self.every = every
+        self.states = [start or MatchState()]
+        for lo in range(0, len(cols) - every + 1, every):
+            self.states.append(apply_range(self.states[-1], cols, lo, lo + every))
+
+    def state_at(self, index: int) -> MatchState:
+        index = max(0, min(index, len(self.cols)))
+        base = min(index // self.every, len(self.states) - 1)
+        return apply_range(self.states[base], self.cols, base * self.every, index)
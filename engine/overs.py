@@ -0,0 +1,94 @@
+"""
+Per-over summaries, worked out once when a match loads.
+
+Each OverSummary carries what the HUD's over strip draws — one chip per
+delivery — along with the over's runs, wickets and whether it was a
+maiden.  OverIndex finds the over in progress at any timeline index with
+one array read, so nothing re-filters recent deliveries per frame, and an
+over full of wides or no-balls is still shown whole.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from engine.careers import NOT_OUT_KINDS
+from engine.columns import EventColumns, FLAG_LEGAL, FLAG_WIDE, FLAG_WICKET, NO_ID
+
+
+@dataclass(frozen=True, slots=True)
+class BallChip:
+    label: str                  # "0"–"6", "W", "wd", "nb"
+    runs_batter: int
+    wicket: bool
+    legal: bool
+
+
+@dataclass(frozen=True, slots=True)
+class OverSummary:
+    innings: int
+    over: int                   # 0-based, as Cricsheet numbers them
+    start: int                  # timeline position of its first delivery
+    chips: Tuple[BallChip, ...]
+    runs: int
+    wickets: int                # batting side's, retirements aside
+    maiden: bool                # six legal balls and nothing off the bowler
+
+    @property
+    def stop(self) -> int:
+        return self.start + len(self.chips)
+
+
+def _chip(runs_batter: int, flags: int) -> BallChip:
+    wicket, legal = bool(flags & FLAG_WICKET), bool(flags & FLAG_LEGAL)
+    if wicket:
+        label = "W"
+    elif not legal:
+        label = "wd" if flags & FLAG_WIDE else "nb"
+    else:
+        label = str(runs_batter)
+    return BallChip(label, runs_batter, wicket, legal)
+
+
+class OverIndex:
+    """Every over of a match, and which one is in progress at any timeline index."""
+
+    def __init__(self, cols: EventColumns):
+        n = len(cols)
+        starts = np.flatnonzero(np.append(True, (cols.innings[1:] != cols.innings[:-1])
+                                          | (cols.over[1:] != cols.over[:-1]))) if n else np.array([], dtype=int)
+        stops = np.append(starts[1:], n)
+
+        flags = cols.flags.tolist()
+        runs_batter = cols.runs_batter.tolist()
+        cost = cols.runs_total - cols.runs_byes     # what the bowler's charged with
+        not_out = [i for i, k in enumerate(cols.kinds) if k in NOT_OUT_KINDS]
+        fell = ((cols.flags & FLAG_WICKET) != 0) & (cols.dismissal != NO_ID) & ~np.isin(cols.dismissal, not_out)
+        legal = (cols.flags & FLAG_LEGAL) != 0
+
+        self.overs: List[OverSummary] = []
+        self.lookup: Dict[Tuple[int, int], OverSummary] = {}
+        for lo, hi in zip(starts.tolist(), stops.tolist()):
+            o = OverSummary(
+                innings=int(cols.innings[lo]),
+                over=int(cols.over[lo]),
+                start=lo,
+                chips=tuple(_chip(runs_batter[i], flags[i]) for i in range(lo, hi)),
+                runs=int(cols.runs_total[lo:hi].sum()),
+                wickets=int(fell[lo:hi].sum()),
+                maiden=bool(legal[lo:hi].sum() == 6 and cost[lo:hi].sum() == 0),
+            )
+            self.overs.append(o)
+            self.lookup[(o.innings, o.over)] = o
+
+        # over_at[i]: the over holding delivery i
+        self._over_at = np.repeat(np.arange(len(starts)), stops - starts)
+
+    def current(self, index: int) -> Optional[Tuple[OverSummary, int]]:
+        """(over of the last ball bowled, how many of its deliveries are in) before `index`, or None at the start."""
+        index = min(index, len(self._over_at))
+        if index <= 0:
+            return None
+        o = self.overs[self._over_at[index - 1]]
+        return o, index - o.start
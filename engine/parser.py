@@ -1,28 +1,51 @@
-from engine.events import BallEvent
+import sys
 
+from engine.events import BallEvent, NO_FIELDERS
+from engine.players import NO_PLAYER, get_registry
 
-def parse_match_events(match_data):
+
+def parse_match_events(match_data, match_id=None, registry=None):
     """
     Flatten Cricsheet's nested innings→overs→deliveries structure into a
-    linear list of BallEvents.  This is the simpler parser used by main.py;
-    see data_io.cricsheet.extract_ball_events for the richer version that
-    also pulls fielder names.
+    linear list of BallEvents.  This is the one decoder — data_io.cricsheet
+    delegates here, so both entry points produce identical events.
+
+    Team, player and dismissal strings are interned, so a season's worth of
+    events shares one copy of each name instead of one per delivery.
+    `ball` is the 0-based legal-ball index within the over.  `match_id`
+    should be the corpus id ('2024/1426312', data_io.archive.match_id_for);
+    it stays None without one — Cricsheet's match number is no id, being
+    absent for playoffs and repeated every season.  Every player also gets
+    their registry id (see engine.players), which is what state keys on.
     """
     events = []
+    intern = sys.intern
 
     info = match_data.get("info", {})
-    match_id = 1
-    date = info.get("dates", ["Unknown"])[0]
-    teams = info.get("teams", ["Team A", "Team B"])
+    if registry is None:
+        registry = get_registry()
+    pids = registry.register_match(info)
+
+    def pid(name):
+        if name is None:
+            return NO_PLAYER
+        p = pids.get(name)
+        if p is None:
+            p = pids[name] = registry.id_for(f"name:{name}", name)
+        return p
+
+    date = (info.get("dates") or [None])[0]
+    teams = [intern(t) for t in info.get("teams", [])]
 
     for inn_idx, inning in enumerate(match_data.get("innings", [])):
-        bat_team = inning.get("team")
-        bowl_team = teams[1] if teams[0] == bat_team else teams[0]
+        bat_team = intern(inning.get("team", "Unknown"))
+        bowl_team = next((t for t in teams if t != bat_team), "Unknown")
 
         for over_data in inning.get("overs", []):
             over_num = over_data.get("over")
+            legal_idx = 0
 
-            for ball_idx, delivery in enumerate(over_data.get("deliveries", [])):
+            for delivery in over_data.get("deliveries", []):
                 runs = delivery.get("runs", {})
                 extras = delivery.get("extras", {})
 
@@ -32,10 +55,23 @@ def parse_match_events(match_data):
                 is_legbye = "legbyes" in extras
                 is_legal = not (is_wide or is_noball)
 
+                # Wicket data — rarely more than one per delivery, but the
+                # spec allows it (e.g. obstructing-the-field during a run-out)
                 wickets = delivery.get("wickets", [])
-                got_wicket = len(wickets) > 0
-                kind = wickets[0].get("kind") if got_wicket else None
-                out_batter = wickets[0].get("player_out") if got_wicket else None
+                got_wicket = bool(wickets)
+                kind = out_batter = None
+                fielders, fielder_ids = NO_FIELDERS, ()
+                if got_wicket:
+                    w = wickets[0]
+                    kind = intern(w["kind"]) if "kind" in w else None
+                    out_batter = intern(w["player_out"]) if "player_out" in w else None
+                    if w.get("fielders"):
+                        fielders = tuple(intern(f["name"]) for f in w["fielders"] if "name" in f)
+                        fielder_ids = tuple(pid(f) for f in fielders)
+
+                batter = intern(delivery.get("batter", ""))
+                bowler = intern(delivery.get("bowler", ""))
+                non_striker = intern(delivery.get("non_striker", ""))
 
                 events.append(BallEvent(
                     match_id=match_id,
@@ -44,13 +80,14 @@ def parse_match_events(match_data):
                     batting_team=bat_team,
                     bowling_team=bowl_team,
                     over=over_num,
-                    ball=ball_idx,
-                    batter=delivery.get("batter"),
-                    bowler=delivery.get("bowler"),
-                    non_striker=delivery.get("non_striker"),
+                    ball=legal_idx,
+                    batter=batter,
+                    bowler=bowler,
+                    non_striker=non_striker,
                     runs_batter=runs.get("batter", 0),
                     runs_extras=runs.get("extras", 0),
                     runs_total=runs.get("total", 0),
+                    runs_byes=extras.get("byes", 0) + extras.get("legbyes", 0),
                     is_legal=is_legal,
                     is_wide=is_wide,
                     is_noball=is_noball,
@@ -59,6 +96,16 @@ def parse_match_events(match_data):
                     is_wicket=got_wicket,
                     dismissal_kind=kind,
                     player_out=out_batter,
+                    fielders=fielders,
+                    non_boundary=bool(runs.get("non_boundary")),
+                    batter_id=pid(batter),
+                    bowler_id=pid(bowler),
+                    non_striker_id=pid(non_striker),
+                    player_out_id=pid(out_batter),
+                    fielder_ids=fielder_ids,
                 ))
 
-    return events
\ No newline at end of file
+                if is_legal:
+                    legal_idx += 1
+
+    return events
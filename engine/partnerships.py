@@ -0,0 +1,141 @@
+"""
+Partnerships and fall of wickets, kept up to date ball by ball.
+
+Both are running totals over the innings so far, so rescanning the
+deliveries every frame would cost O(balls) per frame.  PartnershipTracker
+folds each ball in once, alongside apply_ball, and keeps:
+  * the current partnership — runs, legal balls and what each batter in
+    it has scored
+  * an append-only fall-of-wickets list for the whole match
+
+Seeking backwards restores the nearest checkpoint (one every
+CHECKPOINT_EVERY balls) and folds forward from there.  Because the FoW
+list only ever grows, a checkpoint just remembers how long it was — going
+back truncates it rather than copying it.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from engine.careers import NOT_OUT_KINDS
+from engine.columns import EventColumns, FLAG_LEGAL, FLAG_WIDE, FLAG_WICKET, NO_ID
+from engine.players import NO_PLAYER
+from engine.state import PlayerStats
+
+CHECKPOINT_EVERY = 24       # balls between checkpoints — at most this many to refold on a seek back
+
+
+@dataclass(frozen=True, slots=True)
+class Partnership:
+    """One stand.  `wicket` is the wicket it's for: 1 is the opening stand."""
+    innings: int = 1
+    wicket: int = 1
+    runs: int = 0               # everything scored during it, extras included
+    balls: int = 0              # legal balls
+    batters: Dict[int, PlayerStats] = field(default_factory=dict)   # in order of arrival
+
+    def contribution(self, pid: int) -> PlayerStats:
+        return self.batters.get(pid, PlayerStats())
+
+
+@dataclass(frozen=True, slots=True)
+class FallOfWicket:
+    innings: int
+    wicket: int                 # 1 for the first wicket down
+    score: int                  # team total when it fell
+    legal_balls: int
+    player_out: int
+    name: str
+    partnership: Partnership    # the stand it ended
+
+    @property
+    def overs_str(self) -> str:
+        return f"{self.legal_balls // 6}.{self.legal_balls % 6}"
+
+
+class PartnershipTracker:
+    """
+    Incremental partnership / FoW state over one match's EventColumns.
+    seek(index) brings it to "balls [0, index) bowled" from wherever it
+    is — forward by folding the gap, backward via the nearest checkpoint.
+    """
+
+    def __init__(self, cols: EventColumns, every: int = CHECKPOINT_EVERY):
+        self.cols = cols
+        self.every = every
+        self.position = 0               # balls folded in so far
+        self.fow: List[FallOfWicket] = []
+        self.current = Partnership()
+        # Innings score / balls / wickets feed the FoW entries
+        self._innings = (0, 0, 0)       # (runs, legal balls, wickets)
+        self._checkpoints: Dict[int, Tuple[int, Partnership, Tuple[int, int, int]]] = {}
+
+        not_out = {i for i, k in enumerate(cols.kinds) if k in NOT_OUT_KINDS}
+        self._counts_as_wicket = lambda kind: kind != NO_ID and kind not in not_out
+        self._checkpoint()
+
+    def fow_for(self, innings: int) -> List[FallOfWicket]:
+        return [f for f in self.fow if f.innings == innings]
+
+    @property
+    def last_wicket(self) -> Optional[FallOfWicket]:
+        """The most recent wicket of the innings in progress."""
+        if self.fow and self.fow[-1].innings == self.current.innings:
+            return self.fow[-1]
+        return None
+
+    def seek(self, index: int):
+        index = max(0, min(index, len(self.cols)))
+        if index < self.position:
+            self._restore(index - index % self.every)
+        if index > self.position:
+            self._fold(index)
+
+    # -- Internals ------------------------------------------------------------
+
+    def _checkpoint(self):
+        self._checkpoints[self.position] = (len(self.fow), self.current, self._innings)
+
+    def _restore(self, position: int):
+        fow_len, self.current, self._innings = self._checkpoints[position]
+        del self.fow[fow_len:]
+        self.position = position
+
+    def _fold(self, stop: int):
+        cols, start = self.cols, self.position
+        rows = zip(
+            cols.innings[start:stop].tolist(), cols.batter[start:stop].tolist(),
+            cols.non_striker[start:stop].tolist(), cols.runs_batter[start:stop].tolist(),
+            cols.runs_total[start:stop].tolist(), cols.flags[start:stop].tolist(),
+            cols.dismissal[start:stop].tolist(), cols.player_out[start:stop].tolist(),
+        )
+        p = self.current
+        runs, balls, wkts = self._innings
+        for i, (inn, bat, ns, rb, rt, fl, kind, out) in enumerate(rows, start):
+            if inn != p.innings:
+                p, (runs, balls, wkts) = Partnership(innings=inn), (0, 0, 0)
+
+            legal = 1 if fl & FLAG_LEGAL else 0
+            b = p.batters.copy()
+            prev = b.get(bat, PlayerStats())
+            b[bat] = PlayerStats(
+                runs=prev.runs + rb,
+                balls=prev.balls + (0 if fl & FLAG_WIDE else 1),
+                fours=prev.fours + (1 if rb == 4 else 0),
+                sixes=prev.sixes + (1 if rb == 6 else 0),
+            )
+            b.setdefault(ns, PlayerStats())
+            p = Partnership(p.innings, p.wicket, p.runs + rt, p.balls + legal, b)
+            runs, balls = runs + rt, balls + legal
+
+            # Any dismissal ends the stand; retirements just don't make the FoW list
+            if fl & FLAG_WICKET and out != NO_PLAYER:
+                if self._counts_as_wicket(kind):
+                    wkts += 1
+                    name = cols.names.get(out, "")
+                    self.fow.append(FallOfWicket(inn, wkts, runs, balls, out, name, p))
+                p = Partnership(innings=inn, wicket=wkts + 1)
+
+            self.current, self._innings, self.position = p, (runs, balls, wkts), i + 1
+            if self.position % self.every == 0 and self.position not in self._checkpoints:
+                self._checkpoint()
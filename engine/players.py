@@ -0,0 +1,123 @@
+"""
+Corpus-wide player identity.
+
+Display names aren't guaranteed unique and aren't stable across seasons
+(Cricsheet respells players over time), but every file carries
+`info.registry.people` — a stable id per player.  The registry maps those ids to dense ints so the
+parser, reducer and scorecards can key on small ints instead of strings.
+
+The shipped `data/player_registry.json` fixes the numbering for the bundled
+corpus (see scripts/build_player_registry.py).  Players it hasn't seen are
+appended at runtime, so new match files still work — their ids just aren't
+persisted.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from engine.paths import get_resource_path
+
+log = logging.getLogger(__name__)
+
+REGISTRY_FILE = get_resource_path("data/player_registry.json")
+REGISTRY_VERSION = 1
+NO_PLAYER = -1
+
+
+class PlayerRegistry:
+    """Cricsheet registry id → dense int, with the latest display name for each."""
+
+    def __init__(self):
+        self.keys: List[str] = []       # pid → Cricsheet registry id
+        self.names: List[str] = []      # pid → display name
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()   # prefetch workers register players too
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def id_for(self, key: str, name: str) -> int:
+        """Dense id for a registry key, allocating one on first sight."""
+        pid = self._ids.get(key)
+        if pid is not None:
+            return pid
+        with self._lock:
+            pid = self._ids.get(key)
+            if pid is None:
+                pid = self._ids[key] = len(self.keys)
+                self.keys.append(key)
+                self.names.append(name)
+            return pid
+
+    def register_match(self, info: dict) -> Dict[str, int]:
+        """
+        Name → pid for everyone in one match.  Names missing from the file's
+        registry (very old files) fall back to a name-derived key — no worse
+        than keying on the name directly.
+        """
+        people = info.get("registry", {}).get("people", {})
+        ids = {name: self.id_for(key, name) for name, key in people.items()}
+        for squad in info.get("players", {}).values():
+            for name in squad:
+                if name not in ids:
+                    ids[name] = self.id_for(f"name:{name}", name)
+        return ids
+
+    def rename(self, pid: int, name: str):
+        """Keep the most recent spelling — callers walk the corpus oldest-first."""
+        self.names[pid] = name
+
+    def name(self, pid: int) -> Optional[str]:
+        return self.names[pid] if 0 <= pid < len(self.names) else None
+
+    # -- Persistence ----------------------------------------------------------
+
+    def to_json(self) -> dict:
+        return {"version": REGISTRY_VERSION, "players": [list(p) for p in zip(self.keys, self.names)]}
+
+    @classmethod
+    def from_json(cls, blob: dict) -> "PlayerRegistry":
+        reg = cls()
+        if blob.get("version") != REGISTRY_VERSION:
+            log.warning("Player registry has an incompatible version — starting empty")
+            return reg
+        for key, name in blob.get("players", []):
+            reg.id_for(key, name)
+        return reg
+
+
+_registry: Optional[PlayerRegistry] = None
+_registry_lock = threading.Lock()   # two threads each loading one would hand out clashing ids
+
+
+def get_registry() -> PlayerRegistry:
+    """Process-wide registry, loaded from the shipped file on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = load_registry(REGISTRY_FILE)
+    return _registry
+
+
+def load_registry(path: Path) -> PlayerRegistry:
+    if not path.exists():
+        return PlayerRegistry()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return PlayerRegistry.from_json(json.load(f))
+    except (OSError, json.JSONDecodeError, ValueError) as exc:
+        log.warning("Unreadable player registry %s: %s", path, exc)
+        return PlayerRegistry()
+
+
+def save_registry(registry: PlayerRegistry, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # One player per line so new seasons show up as readable diffs
+    blob = registry.to_json()
+    rows = ",\n".join(json.dumps(p, ensure_ascii=False) for p in blob["players"])
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'{{"version": {blob["version"]}, "players": [\n{rows}\n]}}\n')
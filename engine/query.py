@@ -0,0 +1,416 @@
+"""
+Ad-hoc questions over every delivery in the corpus.
+
+    index = delivery_index()                        # data_io.season_stats
+    bumrah = index.find_players("Bumrah")
+    q = Query(bowlers=bumrah, venues=("Wankhede Stadium",), overs=(16, 20), outcomes=("boundary",))
+    result = index.select(q)
+    print(result.summary())
+
+DeliveryIndex holds the whole corpus as flat NumPy columns, one row per
+delivery, oldest match first.  Two kinds of index sit on top:
+
+  * postings — for the categorical columns (players, teams, venue,
+    season, match), every value's delivery offsets as a sorted array,
+    built once per column with a stable argsort
+  * bitmaps — a boolean mask over all deliveries per outcome flag and
+    over phase, built on first use
+
+A query ANDs its filters and ORs the values within each one.  It starts
+from the shortest posting list and narrows it by gathering the other
+columns at those offsets, so a selective query never touches the other
+~280k rows; with no categorical filter it's straight mask arithmetic.
+
+The per-match rows come from delivery_block, a data_io.mapreduce map fn.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine.careers import NOT_BOWLER_KINDS, NOT_OUT_KINDS
+from engine.columns import FLAG_BYE, FLAG_LEGAL, FLAG_LEGBYE, FLAG_NOBALL, FLAG_WICKET, FLAG_WIDE, NO_ID
+from engine.players import NO_PLAYER, get_registry
+
+# Per-delivery arrays a block carries, and their corpus-wide dtypes
+_BALL_COLUMNS = {
+    "innings": np.int8, "over": np.int8, "ball": np.int8,
+    "batter": np.int32, "bowler": np.int32, "player_out": np.int32,
+    "batting_team": np.int16, "bowling_team": np.int16,
+    "runs_batter": np.int16, "runs_total": np.int16,
+    "flags": np.uint8, "dismissal": np.int16,
+}
+
+# Columns with a postings index, and the Query field that filters each
+CATEGORICAL = {
+    "batter": "batters", "bowler": "bowlers",
+    "batting_team": "batting_teams", "bowling_team": "bowling_teams",
+    "venue": "venues", "season": "seasons", "match": "matches",
+}
+
+# Over ranges (0-based, inclusive) of the standard T20 phases
+PHASES = {"powerplay": (0, 5), "middle": (6, 14), "death": (15, 19)}
+
+OUTCOMES = ("dot", "single", "four", "six", "boundary", "wicket", "bowler_wicket",
+            "wide", "noball", "extra", "legal")
+
+
+# -- Map step -----------------------------------------------------------------
+
+def delivery_block(record) -> dict:
+    """
+    One match's deliveries for the corpus index.  Players travel as
+    registry keys and teams/kinds as string tables, so the builder can
+    renumber them consistently whatever process mapped the match.
+    """
+    cols = record.columns
+    reg = get_registry()
+    people = np.concatenate([cols.batter, cols.bowler, cols.player_out])
+    local = np.unique(people[people != NO_PLAYER])
+
+    def localise(ids):
+        return np.where(ids != NO_PLAYER, np.searchsorted(local, ids), -1).astype(np.int32)
+
+    block = {
+        "match_id": record.match_id,
+        "season": record.season,
+        "date": (record.info.get("dates") or [""])[0],
+        "venue": record.info.get("venue", ""),
+        "teams": list(cols.teams),
+        "kinds": list(cols.kinds),
+        "players": [(reg.keys[p], cols.names.get(p) or reg.name(p)) for p in local.tolist()],
+    }
+    for name in _BALL_COLUMNS:
+        values = getattr(cols, name)
+        block[name] = localise(values) if name in ("batter", "bowler", "player_out") else values
+    return block
+
+
+# -- Queries ------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Query:
+    """
+    Filters are ANDed; the values inside one filter are ORed.  Empty
+    means "don't filter on this".  Overs are numbered from 1, as
+    scorecards do, and the range is inclusive.
+    """
+    batters: Tuple[int, ...] = ()           # registry ids
+    bowlers: Tuple[int, ...] = ()
+    batting_teams: Tuple[str, ...] = ()
+    bowling_teams: Tuple[str, ...] = ()
+    venues: Tuple[str, ...] = ()            # stadium names (data_io.match_context.stadium_id_for)
+    seasons: Tuple[str, ...] = ()
+    matches: Tuple[str, ...] = ()
+    innings: Tuple[int, ...] = ()
+    overs: Optional[Tuple[int, int]] = None
+    phases: Tuple[str, ...] = ()
+    outcomes: Tuple[str, ...] = ()
+    before_match: Optional[str] = None      # only matches earlier in the corpus than this one
+    super_overs: bool = False
+
+
+@dataclass(frozen=True)
+class QuerySummary:
+    deliveries: int = 0
+    balls: int = 0              # legal deliveries
+    runs: int = 0               # everything off the bat and extras
+    batter_runs: int = 0
+    wickets: int = 0            # dismissals, retirements aside
+    bowler_wickets: int = 0     # the ones a bowler is credited with
+    fours: int = 0
+    sixes: int = 0
+    dots: int = 0
+    matches: int = 0
+
+    @property
+    def economy(self) -> float:
+        return self.runs * 6 / self.balls if self.balls else 0.0
+
+    @property
+    def strike_rate(self) -> float:
+        return self.batter_runs * 100 / self.balls if self.balls else 0.0
+
+    @property
+    def dot_pct(self) -> float:
+        return self.dots * 100 / self.balls if self.balls else 0.0
+
+    def __str__(self):
+        return (f"{self.deliveries} deliveries ({self.balls} legal) in {self.matches} matches — "
+                f"{self.runs} runs, {self.wickets} wkts ({self.bowler_wickets} to the bowler), "
+                f"{self.fours}x4 {self.sixes}x6, {self.dots} dots · econ {self.economy:.2f}, "
+                f"SR {self.strike_rate:.1f}")
+
+
+class QueryResult:
+    """Matching delivery offsets (ascending) into a DeliveryIndex."""
+
+    def __init__(self, index: "DeliveryIndex", offsets: np.ndarray, elapsed_ms: float = 0.0):
+        self.index = index
+        self.offsets = offsets
+        self.elapsed_ms = elapsed_ms
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def summary(self) -> QuerySummary:
+        return self.index.summarise(self.offsets)
+
+    def group_by(self, column: str) -> List[Tuple[str, QuerySummary]]:
+        """Summary per value of a categorical column, busiest first."""
+        values = self.index.column(column)[self.offsets]
+        groups = []
+        for value in np.unique(values).tolist():
+            groups.append((self.index.label(column, value), self.index.summarise(self.offsets[values == value])))
+        return sorted(groups, key=lambda g: -g[1].deliveries)
+
+    def rows(self, limit: Optional[int] = None) -> List[dict]:
+        return [self.index.describe(int(i)) for i in self.offsets[:limit]]
+
+
+# -- Index --------------------------------------------------------------------
+
+class DeliveryIndex:
+    """Every delivery in the corpus as columns, with postings and bitmaps on top."""
+
+    def __init__(self, blocks: Sequence[dict], venue_for: Callable[[str], str] = lambda v: v):
+        reg = get_registry()
+        self.match_ids: List[str] = [b["match_id"] for b in blocks]
+        self.dates: List[str] = [b["date"] for b in blocks]
+        self.match_index: Dict[str, int] = {m: i for i, m in enumerate(self.match_ids)}
+        self.seasons: List[str] = sorted({b["season"] for b in blocks})
+        self.venues: List[str] = sorted({venue_for(b["venue"]) for b in blocks})
+        self.teams: List[str] = sorted({t for b in blocks for t in b["teams"]})
+        self.kinds: List[str] = sorted({k for b in blocks for k in b["kinds"]})
+
+        season_id = {s: i for i, s in enumerate(self.seasons)}
+        venue_id = {v: i for i, v in enumerate(self.venues)}
+        team_id = {t: i for i, t in enumerate(self.teams)}
+        kind_id = {k: i for i, k in enumerate(self.kinds)}
+
+        parts: Dict[str, List[np.ndarray]] = {name: [] for name in (*_BALL_COLUMNS, "match", "season", "venue")}
+        for ordinal, b in enumerate(blocks):
+            n = len(b["flags"])
+            # Trailing NO_PLAYER so a local -1 maps to itself
+            pids = np.array([reg.id_for(k, name) for k, name in b["players"]] + [NO_PLAYER], dtype=np.int32)
+            teams = np.array([team_id[t] for t in b["teams"]] or [0], dtype=np.int16)
+            kinds = np.array([kind_id[k] for k in b["kinds"]] + [NO_ID], dtype=np.int16)
+            for name in _BALL_COLUMNS:
+                values = b[name]
+                if name in ("batter", "bowler", "player_out"):
+                    values = pids[values]
+                elif name in ("batting_team", "bowling_team"):
+                    values = teams[values]
+                elif name == "dismissal":
+                    values = kinds[values]     # NO_ID (-1) lands on the trailing NO_ID
+                parts[name].append(values)
+            parts["match"].append(np.full(n, ordinal, dtype=np.int32))
+            parts["season"].append(np.full(n, season_id[b["season"]], dtype=np.int16))
+            parts["venue"].append(np.full(n, venue_id[venue_for(b["venue"])], dtype=np.int16))
+
+        dtypes = {**_BALL_COLUMNS, "match": np.int32, "season": np.int16, "venue": np.int16}
+        self._cols: Dict[str, np.ndarray] = {
+            name: (np.concatenate(chunks).astype(dtypes[name], copy=False) if chunks else np.zeros(0, dtypes[name]))
+            for name, chunks in parts.items()
+        }
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._bitmaps: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._cols["flags"])
+
+    def column(self, name: str) -> np.ndarray:
+        return self._cols[name]
+
+    # -- Postings and bitmaps -------------------------------------------------
+
+    def postings(self, column: str, value: int) -> np.ndarray:
+        """Sorted offsets of the deliveries where `column` == `value`."""
+        if column not in self._postings:
+            col = self._cols[column]
+            order = np.argsort(col, kind="stable").astype(np.int32)
+            values, starts = np.unique(col[order], return_index=True)
+            self._postings[column] = (values, np.append(starts, len(col)), order)
+        values, starts, order = self._postings[column]
+        i = int(np.searchsorted(values, value))
+        if i == len(values) or values[i] != value:
+            return np.zeros(0, dtype=np.int32)
+        return order[starts[i]:starts[i + 1]]
+
+    def bitmap(self, name: str) -> np.ndarray:
+        """Boolean mask over every delivery for an outcome or phase name."""
+        if name not in self._bitmaps:
+            self._bitmaps[name] = self._build_bitmap(name)
+        return self._bitmaps[name]
+
+    def _build_bitmap(self, name: str) -> np.ndarray:
+        c = self._cols
+        flags, bat = c["flags"], c["runs_batter"]
+        legal = (flags & FLAG_LEGAL) != 0
+        if name in PHASES:
+            lo, hi = PHASES[name]
+            return (c["over"] >= lo) & (c["over"] <= hi)
+        if name == "legal":
+            return legal
+        if name == "dot":
+            return legal & (c["runs_total"] == 0)
+        if name == "single":
+            return bat == 1
+        if name == "four":
+            return bat == 4
+        if name == "six":
+            return bat == 6
+        if name == "boundary":
+            return (bat == 4) | (bat == 6)
+        if name == "wicket":
+            return ((flags & FLAG_WICKET) != 0) & ~np.isin(c["dismissal"], self._kind_ids(NOT_OUT_KINDS))
+        if name == "bowler_wicket":
+            return ((flags & FLAG_WICKET) != 0) & ~np.isin(c["dismissal"], self._kind_ids(NOT_BOWLER_KINDS))
+        if name == "wide":
+            return (flags & FLAG_WIDE) != 0
+        if name == "noball":
+            return (flags & FLAG_NOBALL) != 0
+        if name == "extra":
+            return (flags & (FLAG_WIDE | FLAG_NOBALL | FLAG_BYE | FLAG_LEGBYE)) != 0
+        raise ValueError(f"Unknown outcome or phase {name!r} — expected one of {OUTCOMES + tuple(PHASES)}")
+
+    def _kind_ids(self, kinds) -> List[int]:
+        return [i for i, k in enumerate(self.kinds) if k in kinds]
+
+    # -- Lookups --------------------------------------------------------------
+
+    def find_players(self, text: str) -> Tuple[int, ...]:
+        """Registry ids whose name matches `text` — exactly if anyone does, else by substring."""
+        names = get_registry().names
+        seen = set(np.unique(np.concatenate([self._cols["batter"], self._cols["bowler"]])).tolist())
+        exact = tuple(pid for pid in seen if names[pid].lower() == text.lower())
+        return exact or tuple(sorted(pid for pid in seen if text.lower() in names[pid].lower()))
+
+    def find(self, column: str, text: str) -> Tuple[str, ...]:
+        """Teams, venues or seasons containing `text` (case-insensitive)."""
+        table = {"batting_team": self.teams, "bowling_team": self.teams,
+                 "venue": self.venues, "season": self.seasons}[column]
+        exact = tuple(v for v in table if v.lower() == text.lower())
+        return exact or tuple(v for v in table if text.lower() in v.lower())
+
+    def _ids_for(self, column: str, values) -> List[int]:
+        if column in ("batter", "bowler"):
+            return list(values)
+        if column == "match":
+            return [self.match_index[v] for v in values if v in self.match_index]
+        table = {"batting_team": self.teams, "bowling_team": self.teams,
+                 "venue": self.venues, "season": self.seasons}[column]
+        lookup = {v: i for i, v in enumerate(table)}
+        return [lookup[v] for v in values if v in lookup]
+
+    def label(self, column: str, value: int) -> str:
+        if column in ("batter", "bowler"):
+            return get_registry().name(value) or "?"
+        if column == "match":
+            return self.match_ids[value]
+        if column == "over":
+            return str(value + 1)
+        if column == "innings":
+            return str(value)
+        table = {"batting_team": self.teams, "bowling_team": self.teams,
+                 "venue": self.venues, "season": self.seasons}[column]
+        return table[value]
+
+    def describe(self, i: int) -> dict:
+        """
+        One delivery, readable.  `ball` is "over.ball", both 1-based like
+        Query.overs and the "over" labels — 17.6 is the last ball of the
+        17th over, not Cricsheet's 16.5.
+        """
+        c = self._cols
+        reg = get_registry()
+        kind = int(c["dismissal"][i])
+        return {
+            "match_id": self.match_ids[c["match"][i]],
+            "date": self.dates[c["match"][i]],
+            "innings": int(c["innings"][i]),
+            "ball": f"{c['over'][i] + 1}.{c['ball'][i] + 1}",
+            "batter": reg.name(int(c["batter"][i])),
+            "bowler": reg.name(int(c["bowler"][i])),
+            "runs": int(c["runs_total"][i]),
+            "wicket": self.kinds[kind] if kind != NO_ID else None,
+        }
+
+    # -- Execution ------------------------------------------------------------
+
+    def select(self, q: Query) -> QueryResult:
+        t0 = time.perf_counter()
+
+        candidates = []
+        for column, field in CATEGORICAL.items():
+            values = getattr(q, field)
+            if values:
+                ids = self._ids_for(column, values)
+                lists = [self.postings(column, v) for v in ids]
+                # Values of one column never share a delivery, so OR is a sorted concat
+                candidates.append(np.sort(np.concatenate(lists)) if len(lists) > 1 else
+                                  (lists[0] if lists else np.zeros(0, dtype=np.int32)))
+
+        predicates = self._predicates(q)
+        if candidates:
+            candidates.sort(key=len)
+            offsets = candidates[0]
+            for other in candidates[1:]:
+                if not len(offsets):
+                    break
+                offsets = offsets[np.isin(offsets, other, assume_unique=True)]
+            if len(offsets) and predicates:
+                keep = np.ones(len(offsets), dtype=bool)
+                for pred in predicates:
+                    keep &= pred(offsets)
+                offsets = offsets[keep]
+        else:
+            everything = slice(None)
+            keep = np.ones(len(self), dtype=bool)
+            for pred in predicates:
+                keep &= pred(everything)
+            offsets = np.flatnonzero(keep).astype(np.int32)
+
+        return QueryResult(self, offsets, (time.perf_counter() - t0) * 1000)
+
+    def _predicates(self, q: Query) -> List[Callable]:
+        """Filters that aren't postings, as functions of an offset array (or a full slice)."""
+        c = self._cols
+        preds = []
+        if not q.super_overs:
+            preds.append(lambda at: c["innings"][at] <= 2)
+        if q.innings:
+            preds.append(lambda at: np.isin(c["innings"][at], q.innings))
+        if q.overs:
+            lo, hi = q.overs[0] - 1, q.overs[1] - 1
+            preds.append(lambda at: (c["over"][at] >= lo) & (c["over"][at] <= hi))
+        if q.phases:
+            masks = [self.bitmap(p) for p in q.phases]
+            preds.append(lambda at: np.logical_or.reduce([m[at] for m in masks]))
+        if q.outcomes:
+            masks = [self.bitmap(o) for o in q.outcomes]
+            preds.append(lambda at: np.logical_or.reduce([m[at] for m in masks]))
+        if q.before_match is not None:
+            cutoff = self.match_index.get(q.before_match, len(self.match_ids))
+            preds.append(lambda at: c["match"][at] < cutoff)
+        return preds
+
+    def summarise(self, offsets: np.ndarray) -> QuerySummary:
+        c = self._cols
+        if not len(offsets):
+            return QuerySummary()
+        bat = c["runs_batter"][offsets]
+        return QuerySummary(
+            deliveries=len(offsets),
+            balls=int(self.bitmap("legal")[offsets].sum()),
+            runs=int(c["runs_total"][offsets].sum()),
+            batter_runs=int(bat.sum()),
+            wickets=int(self.bitmap("wicket")[offsets].sum()),
+            bowler_wickets=int(self.bitmap("bowler_wicket")[offsets].sum()),
+            fours=int((bat == 4).sum()),
+            sixes=int((bat == 6).sum()),
+            dots=int(self.bitmap("dot")[offsets].sum()),
+            matches=len(np.unique(c["match"][offsets])),
+        )
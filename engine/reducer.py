@@ -1,5 +1,11 @@
+from dataclasses import dataclass, fields
+from typing import FrozenSet, Optional, Tuple
+
 from engine.state import MatchState, PlayerStats, BowlerStats
 from engine.events import BallEvent
+from engine.columns import (
+    EventColumns, FLAG_LEGAL, FLAG_WIDE, FLAG_NOBALL, FLAG_BYE, FLAG_LEGBYE, FLAG_WICKET, NO_ID,
+)
 
 
 def apply_ball(state: MatchState, event: BallEvent) -> MatchState:
@@ -7,57 +13,199 @@ def apply_ball(state: MatchState, event: BallEvent) -> MatchState:
     Pure reducer: (old state + ball event) → new state.  Never mutates —
     always returns a fresh MatchState so we can seek to any ball cheaply.
     """
-    new_balls = state.legal_balls + (1 if event.is_legal else 0)
-    new_score = state.score + event.runs_total
-    new_wkts = state.wickets + (1 if event.is_wicket else 0)
+    return _apply(
+        state, event.batting_team, event.bowling_team,
+        event.batter, event.bowler, event.non_striker,
+        event.batter_id, event.bowler_id, event.non_striker_id,
+        event.runs_batter, event.runs_extras, event.runs_total, event.runs_byes,
+        event.is_legal, event.is_wide, event.is_noball, event.is_bye, event.is_legbye,
+        event.is_wicket, event.dismissal_kind,
+    )
+
+
+def apply_range(state: MatchState, cols: EventColumns, start: int, stop: int) -> MatchState:
+    """
+    Fold balls [start, stop) of an EventColumns into `state`, reading the
+    columns directly instead of materialising a BallEvent per ball.
+    """
+    names, teams, kinds = cols.names, cols.teams, cols.kinds
+    rows = zip(
+        cols.batting_team[start:stop].tolist(), cols.bowling_team[start:stop].tolist(),
+        cols.batter[start:stop].tolist(), cols.bowler[start:stop].tolist(),
+        cols.non_striker[start:stop].tolist(),
+        cols.runs_batter[start:stop].tolist(), cols.runs_extras[start:stop].tolist(),
+        cols.runs_total[start:stop].tolist(), cols.runs_byes[start:stop].tolist(),
+        cols.flags[start:stop].tolist(), cols.dismissal[start:stop].tolist(),
+    )
+    for bat_t, bowl_t, bat, bowl, ns, rb, rx, rt, rby, fl, kind in rows:
+        state = _apply(
+            state, teams[bat_t], teams[bowl_t], names[bat], names[bowl], names[ns],
+            bat, bowl, ns, rb, rx, rt, rby,
+            bool(fl & FLAG_LEGAL), bool(fl & FLAG_WIDE), bool(fl & FLAG_NOBALL),
+            bool(fl & FLAG_BYE), bool(fl & FLAG_LEGBYE), bool(fl & FLAG_WICKET),
+            kinds[kind] if kind != NO_ID else None,
+        )
+    return state
+
+
+def _apply(state, batting_team, bowling_team, batter, bowler, non_striker,
+           batter_id, bowler_id, non_striker_id, runs_batter, runs_extras, runs_total, runs_byes,
+           is_legal, is_wide, is_noball, is_bye, is_legbye, is_wicket, dismissal_kind):
+    new_balls = state.legal_balls + (1 if is_legal else 0)
+    new_score = state.score + runs_total
+    new_wkts = state.wickets + (1 if is_wicket else 0)
 
     # --- batter stats ---
     b = state.batter_stats.copy()
-    prev = b.get(event.batter, PlayerStats())
-    b[event.batter] = PlayerStats(
-        runs=prev.runs + event.runs_batter,
-        balls=prev.balls + (0 if event.is_wide else 1),  # wides don't count
-        fours=prev.fours + (1 if event.runs_batter == 4 else 0),
-        sixes=prev.sixes + (1 if event.runs_batter == 6 else 0),
+    prev = b.get(batter_id, PlayerStats())
+    b[batter_id] = PlayerStats(
+        runs=prev.runs + runs_batter,
+        balls=prev.balls + (0 if is_wide else 1),  # wides don't count
+        fours=prev.fours + (1 if runs_batter == 4 else 0),
+        sixes=prev.sixes + (1 if runs_batter == 6 else 0),
     )
-    if event.non_striker not in b:
-        b[event.non_striker] = PlayerStats()
+    if non_striker_id not in b:
+        b[non_striker_id] = PlayerStats()
 
     # --- bowler stats ---
-    # Byes/legbyes aren't charged to the bowler, but wides/noballs are.
+    # Byes/legbyes aren't charged to the bowler, but wides/noballs are — a no-ball's
+    # penalty run too, when byes were run off it.
     bl = state.bowler_stats.copy()
-    prev_bl = bl.get(event.bowler, BowlerStats())
-    cost = event.runs_total - (event.runs_extras if (event.is_bye or event.is_legbye) else 0)
+    prev_bl = bl.get(bowler_id, BowlerStats())
+    cost = runs_total - runs_byes
     # Run-outs aren't the bowler's wicket
-    credited_wkt = 1 if (event.is_wicket and event.dismissal_kind != "run out") else 0
-    bl[event.bowler] = BowlerStats(
-        balls=prev_bl.balls + (1 if event.is_legal else 0),
+    credited_wkt = 1 if (is_wicket and dismissal_kind != "run out") else 0
+    bl[bowler_id] = BowlerStats(
+        balls=prev_bl.balls + (1 if is_legal else 0),
         runs_conceded=prev_bl.runs_conceded + cost,
         wickets=prev_bl.wickets + credited_wkt,
     )
 
     # Did the innings just end?
-    all_out = new_wkts >= 10
-    overs_done = new_balls >= (state.overs_limit * 6)
+    all_out = new_wkts >= state.wickets_limit
+    overs_done = new_balls >= state.balls_limit
     chased = state.target is not None and new_score >= state.target
 
     return MatchState(
         score=new_score,
         wickets=new_wkts,
         legal_balls=new_balls,
-        batting_team=event.batting_team,
-        bowling_team=event.bowling_team,
-        current_batter=event.batter,
-        current_non_striker=event.non_striker,
-        current_bowler=event.bowler,
+        batting_team=batting_team,
+        bowling_team=bowling_team,
+        current_batter=batter,
+        current_non_striker=non_striker,
+        current_bowler=bowler,
+        current_batter_id=batter_id,
+        current_non_striker_id=non_striker_id,
+        current_bowler_id=bowler_id,
         batter_stats=b,
         bowler_stats=bl,
-        overs_limit=state.overs_limit,
+        balls_limit=state.balls_limit,
+        wickets_limit=state.wickets_limit,
         target=state.target,
-        extras_total=state.extras_total + event.runs_extras,
-        wides=state.wides + (1 if event.is_wide else 0),
-        noballs=state.noballs + (1 if event.is_noball else 0),
-        byes=state.byes + (1 if event.is_bye else 0),
-        legbyes=state.legbyes + (1 if event.is_legbye else 0),
+        extras_total=state.extras_total + runs_extras,
+        wides=state.wides + (1 if is_wide else 0),
+        noballs=state.noballs + (1 if is_noball else 0),
+        byes=state.byes + (1 if is_bye else 0),
+        legbyes=state.legbyes + (1 if is_legbye else 0),
         is_innings_complete=state.is_innings_complete or all_out or overs_done or chased,
-    )
\ No newline at end of file
+    )
+
+
+# -- Undo -----------------------------------------------------------------------
+
+# Every MatchState field except the two per-player dicts — a delta keeps them whole
+_SCALARS = tuple(f.name for f in fields(MatchState) if f.name not in ("batter_stats", "bowler_stats"))
+
+
+@dataclass(frozen=True, slots=True)
+class BallDelta:
+    """
+    What one ball changed, enough to take it back: the scalar fields from
+    before it, and the three per-player entries it touched as they were
+    (None where the player had no entry yet).
+    """
+    scalars: tuple
+    batter: Tuple[int, Optional[PlayerStats]]
+    non_striker: Tuple[int, Optional[PlayerStats]]
+    bowler: Tuple[int, Optional[BowlerStats]]
+
+
+def apply_ball_undoable(state: MatchState, event: BallEvent) -> Tuple[MatchState, BallDelta]:
+    """apply_ball, plus the delta that revert_ball needs to get `state` back."""
+    delta = BallDelta(
+        scalars=tuple(getattr(state, name) for name in _SCALARS),
+        batter=(event.batter_id, state.batter_stats.get(event.batter_id)),
+        non_striker=(event.non_striker_id, state.batter_stats.get(event.non_striker_id)),
+        bowler=(event.bowler_id, state.bowler_stats.get(event.bowler_id)),
+    )
+    return apply_ball(state, event), delta
+
+
+def revert_ball(state: MatchState, delta: BallDelta) -> MatchState:
+    """Undo one ball in O(1): put back the entries and counters it changed."""
+    b = state.batter_stats.copy()
+    for pid, prev in (delta.non_striker, delta.batter):
+        if prev is None:
+            b.pop(pid, None)
+        else:
+            b[pid] = prev
+    bl = state.bowler_stats.copy()
+    pid, prev = delta.bowler
+    if prev is None:
+        bl.pop(pid, None)
+    else:
+        bl[pid] = prev
+    return MatchState(**dict(zip(_SCALARS, delta.scalars)), batter_stats=b, bowler_stats=bl)
+
+
+# -- Diffs ----------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class StateDiff:
+    """
+    What changed between two MatchStates, for views deciding what to
+    redraw: the fields whose values differ, the players whose batting or
+    bowling entries differ, and whether the move crossed into another
+    over or innings.  An empty diff is falsy.
+    """
+    fields: FrozenSet[str] = frozenset()
+    players: FrozenSet[int] = frozenset()
+    over: bool = False
+    innings: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.fields) or self.over or self.innings
+
+    def touches(self, names) -> bool:
+        return not self.fields.isdisjoint(names)
+
+
+# Everything at once — a new match, say
+EVERYTHING = StateDiff(frozenset(f.name for f in fields(MatchState)), frozenset(), True, True)
+
+
+def _changed(before: dict, after: dict) -> set:
+    return {pid for pid in before.keys() | after.keys() if before.get(pid) != after.get(pid)}
+
+
+def diff_states(before: MatchState, after: MatchState, over: bool = False, innings: bool = False) -> StateDiff:
+    """
+    The StateDiff from `before` to `after` — one ball apart or a whole
+    seek apart.  The over / innings flags come from the caller, which
+    knows where in the match each state sits.
+    """
+    if before is after:
+        return StateDiff(over=over, innings=innings)
+    changed = {name for name in _SCALARS if getattr(before, name) != getattr(after, name)}
+    players = set()
+    if before.batter_stats is not after.batter_stats:
+        players |= _changed(before.batter_stats, after.batter_stats)
+        if players:
+            changed.add("batter_stats")
+    if before.bowler_stats is not after.bowler_stats:
+        bowlers = _changed(before.bowler_stats, after.bowler_stats)
+        if bowlers:
+            players |= bowlers
+            changed.add("bowler_stats")
+    return StateDiff(frozenset(changed), frozenset(players), over, innings)
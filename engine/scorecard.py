@@ -0,0 +1,178 @@
+"""
+Batting and bowling cards as they stood at any ball of the replay.
+
+LiveScorecard is built once when a match loads.  For each innings it
+keeps running totals per player — one row per ball bowled, one column per
+player — so the card after k balls is row k of each table: a lookup,
+however often it's asked for.  Scrubbing, rewinding and turbo playback
+can redraw the card every frame.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from engine.careers import NOT_BOWLER_KINDS
+from engine.columns import EventColumns, FLAG_LEGAL, FLAG_WIDE, FLAG_WICKET, NO_ID
+from engine.players import NO_PLAYER
+
+BALLS_PER_OVER = 6
+
+
+@dataclass(frozen=True, slots=True)
+class BattingLine:
+    pid: int
+    name: str
+    runs: int
+    balls: int
+    fours: int
+    sixes: int
+    status: str                 # dismissal kind, "batting" or "not out"
+
+    @property
+    def strike_rate(self) -> float:
+        return round(self.runs / self.balls * 100, 1) if self.balls else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class BowlingLine:
+    pid: int
+    name: str
+    balls: int                  # legal balls
+    maidens: int
+    runs: int
+    wickets: int
+
+    @property
+    def overs_str(self) -> str:
+        return f"{self.balls // BALLS_PER_OVER}.{self.balls % BALLS_PER_OVER}"
+
+    @property
+    def economy(self) -> float:
+        return round(self.runs / (self.balls / BALLS_PER_OVER), 2) if self.balls else 0.0
+
+
+def _prefix(n: int, rows, cols, values, width: int) -> np.ndarray:
+    """(n + 1, width) running totals, with values[i] landing after ball rows[i] in column cols[i]."""
+    table = np.zeros((n + 1, width), dtype=np.int32)
+    np.add.at(table, (np.asarray(rows) + 1, cols), values)
+    return np.cumsum(table, axis=0)
+
+
+class _InningsCard:
+    """Per-player running totals for one innings."""
+
+    def __init__(self, cols: EventColumns, positions: np.ndarray):
+        self.positions = positions
+        self.names = cols.names
+        n = len(positions)
+        every = np.arange(n)
+        flags = cols.flags[positions]
+        bat, ns, bowl = cols.batter[positions], cols.non_striker[positions], cols.bowler[positions]
+        kinds = cols.dismissal[positions]
+
+        # -- Batting: in the order they came in, counting the non-striker's end
+        self.batters = list(dict.fromkeys(np.stack([bat, ns], axis=1).ravel().tolist()))
+        slot = {pid: j for j, pid in enumerate(self.batters)}
+        b = np.array([slot[p] for p in bat.tolist()], dtype=np.intp)
+        rb = cols.runs_batter[positions]
+        width = len(slot)
+        self.bat_runs = _prefix(n, every, b, rb, width)
+        self.bat_balls = _prefix(n, every, b, (flags & FLAG_WIDE) == 0, width)
+        self.bat_fours = _prefix(n, every, b, rb == 4, width)
+        self.bat_sixes = _prefix(n, every, b, rb == 6, width)
+
+        # Ball count by which each batter had walked out / been dismissed (n + 1 = never)
+        self.came_in = np.full(width, n + 1)
+        for j, (p, q) in enumerate(zip(bat.tolist(), ns.tolist())):
+            for pid in (p, q):
+                self.came_in[slot[pid]] = min(self.came_in[slot[pid]], j + 1)
+        self.out_at = np.full(width, n + 1)
+        self.out_kind = [""] * width
+        out = cols.player_out[positions]
+        for j in np.flatnonzero((flags & FLAG_WICKET) != 0).tolist():
+            pid = int(out[j])
+            if pid != NO_PLAYER and pid in slot and self.out_at[slot[pid]] > n:
+                self.out_at[slot[pid]] = j + 1
+                self.out_kind[slot[pid]] = cols.kinds[kinds[j]] if kinds[j] != NO_ID else "out"
+
+        # -- Bowling: in the order they came on
+        self.bowlers = list(dict.fromkeys(bowl.tolist()))
+        bslot = {pid: j for j, pid in enumerate(self.bowlers)}
+        w = np.array([bslot[p] for p in bowl.tolist()], dtype=np.intp)
+        width = len(bslot)
+        self.first_ball = np.full(width, n)
+        np.minimum.at(self.first_ball, w, every)
+        legal = ((flags & FLAG_LEGAL) != 0).astype(np.int32)
+        # Bye and leg-bye runs aren't the bowler's (a no-ball's penalty run is, byes or not);
+        # run-outs and retirements aren't their wickets
+        cost = cols.runs_total[positions] - cols.runs_byes[positions]
+        not_theirs = [i for i, k in enumerate(cols.kinds) if k in NOT_BOWLER_KINDS]
+        credited = ((flags & FLAG_WICKET) != 0) & (kinds != NO_ID) & ~np.isin(kinds, not_theirs)
+        self.bowl_balls = _prefix(n, every, w, legal, width)
+        self.bowl_runs = _prefix(n, every, w, cost, width)
+        self.bowl_wkts = _prefix(n, every, w, credited, width)
+
+        # A maiden is credited on an over's last ball: a full over with nothing off the bowler
+        self.bowl_maidens = np.zeros((n + 1, width), dtype=np.int32)
+        if n:
+            over = cols.over[positions]
+            starts = np.flatnonzero(np.append(True, over[1:] != over[:-1]))
+            ends = np.append(starts[1:], n) - 1
+            maiden = (np.add.reduceat(cost, starts) == 0) & (np.add.reduceat(legal, starts) == BALLS_PER_OVER)
+            self.bowl_maidens = _prefix(n, ends[maiden], w[ends[maiden]], 1, width)
+
+    def bowled(self, index: int) -> int:
+        """Balls of this innings bowled before timeline index `index`."""
+        return int(np.searchsorted(self.positions, index))
+
+    def batting(self, k: int) -> List[BattingLine]:
+        """Everyone who had come in after k balls, in batting order."""
+        lines = []
+        for j, pid in enumerate(self.batters):
+            if self.came_in[j] > k:
+                continue
+            if self.out_at[j] <= k:
+                status = self.out_kind[j]
+            else:
+                status = "batting" if k < len(self.positions) else "not out"
+            lines.append(BattingLine(pid, self.names.get(pid, "?"), int(self.bat_runs[k, j]),
+                                     int(self.bat_balls[k, j]), int(self.bat_fours[k, j]),
+                                     int(self.bat_sixes[k, j]), status))
+        return lines
+
+    def bowling(self, k: int) -> List[BowlingLine]:
+        """Everyone who had bowled after k balls, in the order they came on."""
+        row = (self.bowl_balls[k], self.bowl_maidens[k], self.bowl_runs[k], self.bowl_wkts[k])
+        return [
+            BowlingLine(pid, self.names.get(pid, "?"), int(row[0][j]), int(row[1][j]), int(row[2][j]), int(row[3][j]))
+            for j, pid in enumerate(self.bowlers)
+            if self.first_ball[j] < k
+        ]
+
+
+class LiveScorecard:
+    """Batting and bowling cards for each regular innings, at any timeline index."""
+
+    def __init__(self, cols: EventColumns):
+        self.total = len(cols)
+        self.innings: Dict[int, _InningsCard] = {}
+        for inn in (1, 2):
+            positions = np.flatnonzero(cols.innings == inn)
+            if len(positions):
+                self.innings[inn] = _InningsCard(cols, positions)
+
+    def batting(self, innings: int, index: int) -> List[BattingLine]:
+        card = self.innings.get(innings)
+        return card.batting(card.bowled(index)) if card else []
+
+    def bowling(self, innings: int, index: int) -> List[BowlingLine]:
+        card = self.innings.get(innings)
+        return card.bowling(card.bowled(index)) if card else []
+
+    def innings_over(self, innings: int, index: int) -> bool:
+        card = self.innings.get(innings)
+        if card is None:
+            return index >= self.total
+        return card.bowled(index) >= len(card.positions)
@@ -0,0 +1,336 @@
+"""
+Monte Carlo projection of the rest of an innings.
+
+Each delivery is one draw from what historically happened on a delivery
+in the same phase (powerplay / middle / death) with a similar number of
+wickets down.  outcome_counts (a data_io.mapreduce map fn) tallies those
+outcomes per season; OutcomeTallies weights the seasons up to the one
+being projected — recent ones count most, since scoring rates have
+climbed a long way since 2008 — and builds an OutcomeModel of per-row
+CDFs from them.
+
+simulate() plays thousands of innings side by side as NumPy arrays: each
+step draws one delivery for every simulation still live, so the Python
+loop runs once per ball, not once per ball per simulation.  Projector
+spreads a projection over a process pool and hands back the latest
+finished one, so the render loop never waits on it.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from engine.careers import NOT_OUT_KINDS
+from engine.columns import FLAG_LEGAL, FLAG_WICKET, NO_ID
+from engine.winprob import chase_target
+
+log = logging.getLogger(__name__)
+
+SIMULATIONS = 10_000
+MAX_WORKERS = 4
+POOL_RESTARTS = 2       # pools that may die before projections run in-process
+
+# A delivery outcome is (runs off it, legal?, wicket?), packed into one small int
+MAX_RUNS_PER_BALL = 7
+N_OUTCOMES = (MAX_RUNS_PER_BALL + 1) * 4
+
+PHASE_OVERS = (6, 15)           # powerplay ends after over 6, death starts at over 16
+WICKET_BUCKETS = (2, 5, 8)      # 0–1 down, 2–4, 5–7, 8–9
+N_ROWS = (len(PHASE_OVERS) + 1) * (len(WICKET_BUCKETS) + 1)
+
+SMOOTHING = 50.0                # pseudo-deliveries of the phase average per row
+HALF_LIFE_SEASONS = 2.0         # a season this many back counts half as much
+
+
+def _row(balls, wickets):
+    """Model row for deliveries bowled after `balls` legal balls with `wickets` down."""
+    phase = np.searchsorted(PHASE_OVERS, balls // 6, side="right")
+    bucket = np.searchsorted(WICKET_BUCKETS, wickets, side="right")
+    return phase * (len(WICKET_BUCKETS) + 1) + bucket
+
+
+def _wickets_fell(cols, mask) -> np.ndarray:
+    """Per ball under `mask`: did the batting side lose a wicket (retirements aside)?"""
+    kinds = cols.dismissal[mask]
+    not_out = [i for i, k in enumerate(cols.kinds) if k in NOT_OUT_KINDS]
+    return ((cols.flags[mask] & FLAG_WICKET) != 0) & (kinds != NO_ID) & ~np.isin(kinds, not_out)
+
+
+# -- Map step -----------------------------------------------------------------
+
+def outcome_counts(record) -> Tuple[str, np.ndarray]:
+    """Map step: (season, this match's regular-innings deliveries tallied by model row and outcome)."""
+    cols = record.columns
+    counts = np.zeros(N_ROWS * N_OUTCOMES, dtype=np.int64)
+    for innings in (1, 2):
+        mask = cols.innings == innings
+        if not mask.any():
+            continue
+        legal = (cols.flags[mask] & FLAG_LEGAL) != 0
+        fell = _wickets_fell(cols, mask)
+        balls_before = np.concatenate([[0], np.cumsum(legal)[:-1]])
+        wickets_before = np.concatenate([[0], np.cumsum(fell)[:-1]])
+        runs = np.minimum(cols.runs_total[mask], MAX_RUNS_PER_BALL)
+        outcome = runs * 4 + legal * 2 + fell
+        counts += np.bincount(_row(balls_before, wickets_before) * N_OUTCOMES + outcome,
+                              minlength=N_ROWS * N_OUTCOMES)
+    return record.season, counts
+
+
+def add_counts(acc, item):
+    """Reduce step for outcome_counts: a {season: counts} dict."""
+    season, counts = item
+    acc[season] = acc[season] + counts if season in acc else counts
+    return acc
+
+
+# -- Model --------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class OutcomeModel:
+    cdf: np.ndarray             # (N_ROWS, N_OUTCOMES), each row ends at 1
+    runs: np.ndarray            # per outcome
+    legal: np.ndarray
+    wicket: np.ndarray
+
+    @classmethod
+    def from_counts(cls, counts: np.ndarray) -> "OutcomeModel":
+        counts = counts.reshape(N_ROWS, N_OUTCOMES).astype(np.float64)
+        # Thin rows (nine down in the powerplay) lean on their phase's average
+        per_phase = counts.reshape(len(PHASE_OVERS) + 1, len(WICKET_BUCKETS) + 1, N_OUTCOMES).sum(axis=1)
+        phase_avg = np.repeat(per_phase / per_phase.sum(axis=1, keepdims=True), len(WICKET_BUCKETS) + 1, axis=0)
+        probs = counts + SMOOTHING * phase_avg
+        probs /= probs.sum(axis=1, keepdims=True)
+        cdf = np.cumsum(probs, axis=1)
+        cdf[:, -1] = 1.0
+
+        outcome = np.arange(N_OUTCOMES)
+        return cls(cdf, outcome // 4, (outcome // 2) % 2, outcome % 2)
+
+
+class OutcomeTallies:
+    """Per-season outcome counts, and the recency-weighted model for any season."""
+
+    def __init__(self, by_season: Dict[str, np.ndarray]):
+        self.by_season = by_season
+        self._models: Dict[str, OutcomeModel] = {}
+
+    def __len__(self) -> int:
+        return int(sum(c.sum() for c in self.by_season.values()))
+
+    def model_for(self, season: str) -> OutcomeModel:
+        """Seasons up to and including `season`, halving in weight every HALF_LIFE_SEASONS back."""
+        if season not in self._models:
+            year = _year(season)
+            weighted = np.zeros(N_ROWS * N_OUTCOMES)
+            for s, counts in self.by_season.items():
+                back = year - _year(s)
+                if back >= 0:
+                    weighted += counts * 0.5 ** (max(back, 0) / HALF_LIFE_SEASONS)
+            if not weighted.any():      # older than the corpus — use all of it
+                weighted = sum(self.by_season.values()).astype(np.float64)
+            self._models[season] = OutcomeModel.from_counts(weighted)
+        return self._models[season]
+
+
+def _year(season: str) -> int:
+    """'2020/21' → 2020, anything unparseable → 0."""
+    try:
+        return int(str(season)[:4])
+    except ValueError:
+        return 0
+
+
+# -- Simulation ---------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SimStart:
+    """Where an innings stands when the projection starts."""
+    innings: int
+    runs: int
+    wickets: int
+    balls: int                      # legal balls bowled
+    quota: int                      # legal balls available
+    target: Optional[int] = None    # chases only
+
+    @property
+    def over(self) -> int:
+        return self.balls // 6
+
+
+def start_from(state, cols, index: int, raw: dict) -> Optional[SimStart]:
+    """
+    The innings in progress just before timeline position `index`,
+    counted from the deliveries themselves.  `state` supplies the ball
+    quota.  None during a super over, which isn't worth projecting.
+    """
+    innings = int(cols.innings[index - 1]) if index else 1
+    if innings > 2:
+        return None
+    mask = np.zeros(len(cols), dtype=bool)
+    mask[:index] = cols.innings[:index] == innings
+    runs = int(cols.runs_total[mask].sum())
+    balls = int(((cols.flags[mask] & FLAG_LEGAL) != 0).sum())
+    wickets = int(_wickets_fell(cols, mask).sum())
+
+    if innings == 2:
+        target, quota = chase_target(cols, raw.get("innings", []), raw.get("info", {}))
+        return SimStart(innings, runs, wickets, balls, quota, target)
+    return SimStart(innings, runs, wickets, balls, state.balls_limit)
+
+
+def simulate(model: OutcomeModel, start: SimStart, n: int, seed=None) -> np.ndarray:
+    """Final totals of `n` simulated finishes to the innings."""
+    rng = np.random.default_rng(seed)
+    runs = np.full(n, start.runs, dtype=np.int32)
+    balls = np.full(n, start.balls, dtype=np.int32)
+    wickets = np.full(n, start.wickets, dtype=np.int32)
+    target = start.target if start.target is not None else np.iinfo(np.int32).max
+
+    live = np.flatnonzero((balls < start.quota) & (wickets < 10) & (runs < target))
+    for _ in range(start.quota * 3):        # wides and no-balls make it more than quota steps
+        if not len(live):
+            break
+        cdf = model.cdf[_row(balls[live], wickets[live])]
+        outcome = np.minimum((cdf < rng.random(len(live))[:, None]).sum(axis=1), N_OUTCOMES - 1)
+        runs[live] += model.runs[outcome]
+        balls[live] += model.legal[outcome]
+        wickets[live] += model.wicket[outcome]
+        live = live[(balls[live] < start.quota) & (wickets[live] < 10) & (runs[live] < target)]
+    return runs
+
+
+@dataclass(frozen=True)
+class Projection:
+    start: SimStart
+    finals: np.ndarray          # sorted final totals, one per simulation
+    elapsed_ms: float
+
+    def percentile(self, q: float) -> int:
+        return int(np.percentile(self.finals, q))
+
+    @property
+    def chase_win(self) -> Optional[float]:
+        if self.start.target is None:
+            return None
+        return float((self.finals >= self.start.target).mean())
+
+    def histogram(self, bins: int = 24) -> Tuple[np.ndarray, np.ndarray]:
+        lo, hi = self.finals[0], self.finals[-1]
+        return np.histogram(self.finals, bins=bins, range=(lo, max(hi, lo + bins)))
+
+
+def project(model: OutcomeModel, start: SimStart, n: int = SIMULATIONS, seed=None) -> Projection:
+    """In-process projection — see Projector for the non-blocking version."""
+    t0 = time.perf_counter()
+    finals = np.sort(simulate(model, start, n, seed))
+    return Projection(start, finals, (time.perf_counter() - t0) * 1000)
+
+
+# -- Background runner --------------------------------------------------------
+
+def lower_priority():
+    """Process-pool initializer: nice the worker, so the render loop wins the CPU."""
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass        # Windows, or not allowed — run at normal priority
+
+
+class Projector:
+    """
+    Runs projections on a process pool, split into one batch per worker.
+    request() returns straight away; poll() each frame picks up the result
+    once every batch is in.  One projection in flight at a time — a
+    request while busy is dropped, and the caller asks again next tick.
+
+    If a worker dies the pool is broken for good, so it's thrown away and
+    the next request starts a fresh one.  After POOL_RESTARTS of those in a
+    row, projections run in-process (blocking, at a tenth of the size)
+    rather than keep spawning pools that don't last.
+    """
+
+    def __init__(self, workers: Optional[int] = None, simulations: int = SIMULATIONS):
+        self.workers = workers or max(1, min(MAX_WORKERS, os.cpu_count() or 1))
+        self.simulations = simulations
+        self.latest: Optional[Projection] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._futures: List = []
+        self._pending: Optional[Tuple[object, SimStart, float]] = None
+        self._restarts = 0
+        self.latest_key = None
+
+    @property
+    def busy(self) -> bool:
+        return self._pending is not None
+
+    def request(self, key, model: OutcomeModel, start: SimStart) -> bool:
+        if self.busy:
+            return False
+        if self._restarts > POOL_RESTARTS:
+            self.latest = project(model, start, max(1, self.simulations // 10))
+            self.latest_key = key
+            return True
+        if self._pool is None:
+            # Spawned, not forked: the app has threads (prefetch, corpus builds) and a
+            # display.  Niced, so on a busy machine the render loop wins the CPU.
+            ctx = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx,
+                                             initializer=lower_priority)
+        seeds = np.random.SeedSequence().spawn(self.workers)
+        share = -(-self.simulations // self.workers)
+        try:
+            self._futures = [self._pool.submit(simulate, model, start, share, s) for s in seeds]
+        except BrokenProcessPool as exc:
+            self._pool_broke(exc)
+            return False
+        self._pending = (key, start, time.perf_counter())
+        return True
+
+    def poll(self) -> Optional[Projection]:
+        """The newest finished projection (None until the first lands)."""
+        if self._pending and all(f.done() for f in self._futures):
+            key, start, t0 = self._pending
+            self._pending = None
+            try:
+                finals = np.sort(np.concatenate([f.result() for f in self._futures]))
+                self.latest = Projection(start, finals, (time.perf_counter() - t0) * 1000)
+                self.latest_key = key
+                self._restarts = 0
+            except BrokenProcessPool as exc:
+                self._pool_broke(exc)
+            except Exception:
+                log.exception("Projection failed")
+            self._futures = []
+        return self.latest
+
+    def _pool_broke(self, exc):
+        self._restarts += 1
+        log.warning("Projection pool died (%s) — %s", exc,
+                    "starting a new one" if self._restarts <= POOL_RESTARTS else "projecting in-process from now on")
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._futures = []
+        self._pending = None
+
+    def reset(self):
+        """Forget the last projection (new match).  An in-flight one is discarded."""
+        for f in self._futures:
+            f.cancel()
+        self._futures = []
+        self._pending = None
+        self.latest = None
+        self.latest_key = None
+
+    def shutdown(self):
+        self.reset()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
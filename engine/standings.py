@@ -0,0 +1,257 @@
+"""
+League standings computed from the deliveries.
+
+Two steps, so the expensive one can run once per match and be cached
+(see data_io.season_stats):
+
+  * match_result(record)   — one match → MatchResult: who won, and each
+    side's runs and balls for net run rate.  A data_io.mapreduce map fn.
+  * SeasonStandings        — a season's MatchResults folded into a
+    table after every match, in (date, match number) order — the season
+    index's — so "the table going into this match" is a bisect, even on
+    the second game of a double-header.
+
+Rules, as the IPL applies them:
+  * only league matches count (Cricsheet gives playoffs an event.stage)
+  * win 2 points, no result 1 each; a tie decided by super over is a
+    win/loss like any other, and super-over runs don't touch NRR
+  * NRR = runs scored / overs faced − runs conceded / overs bowled, where
+    a side bowled out is charged its full quota of overs
+  * no-result matches are left out of NRR entirely
+  * D/L: the side batting first is credited with (target − 1) off the
+    revised overs, so both sides are measured over the same quota
+  * fixtures abandoned without a ball bowled have no Cricsheet file at
+    all; the "abandoned" list in data/league_adjustments.json adds their
+    no-results back in, and its "voided" matches (called off and replayed
+    from scratch) are left out
+"""
+
+import bisect
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from engine.columns import FLAG_LEGAL, FLAG_WICKET, NO_ID
+from engine.paths import get_resource_path
+
+log = logging.getLogger(__name__)
+
+POINTS_WIN = 2
+POINTS_NO_RESULT = 1
+
+# Dismissals that don't cost the batting side a wicket for all-out purposes
+_NOT_OUT_KINDS = frozenset({"retired hurt", "retired not out"})
+
+# Hand-kept corrections to what Cricsheet gives us:
+#   "voided"    — {match id: note}, matches it records that the league table ignores
+#   "abandoned" — {season: [{match_number, date, teams}]}, league fixtures washed
+#                 out without a ball bowled (so no file), names as Cricsheet spells
+#                 them that season.  Found as the gaps in each season's match
+#                 numbering, checked against data/points_table.json.
+ADJUSTMENTS_FILE = get_resource_path("data/league_adjustments.json")
+
+_adjustments = None
+
+
+def _load_adjustments() -> dict:
+    global _adjustments
+    if _adjustments is None:
+        try:
+            with open(ADJUSTMENTS_FILE, "r", encoding="utf-8") as f:
+                _adjustments = json.load(f)
+        except FileNotFoundError:
+            _adjustments = {}
+        except (OSError, ValueError) as exc:
+            log.warning("Ignoring %s: %s", ADJUSTMENTS_FILE, exc)
+            _adjustments = {}
+    return _adjustments
+
+
+def voided_matches() -> FrozenSet[str]:
+    return frozenset(_load_adjustments().get("voided", {}))
+
+
+@dataclass(frozen=True)
+class InningsTally:
+    team: str
+    runs: int
+    balls: int      # balls charged for NRR — the full quota if bowled out
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    match_id: str
+    date: str
+    match_number: int
+    league: bool
+    teams: Tuple[str, ...]
+    winner: Optional[str]           # None for no result
+    innings: Tuple[InningsTally, ...] = ()   # regular innings only, for NRR
+
+
+def match_result(record) -> MatchResult:
+    """Map step: reduce one match (a data_io.mapreduce.MatchRecord) to its result."""
+    info, cols = record.info, record.columns
+    event = info.get("event", {})
+    outcome = info.get("outcome", {})
+    teams = tuple(info.get("teams", ()))
+    quota_overs = int(info.get("overs") or 20)
+
+    # A tie settled by a super over names the side that won it as `eliminator`
+    winner = outcome.get("winner") or outcome.get("eliminator")
+    meta = [inn for inn in record.innings if not inn.get("super_over")]
+
+    tallies = ()
+    if winner:
+        target = next((inn["target"] for inn in meta if "target" in inn), None)
+        tallies = tuple(
+            _tally(cols, i + 1, inn, quota_overs, target, outcome.get("method") == "D/L")
+            for i, inn in enumerate(meta[:2])
+        )
+
+    return MatchResult(
+        match_id=record.match_id,
+        date=(info.get("dates") or [""])[0],
+        match_number=event.get("match_number") if isinstance(event.get("match_number"), int) else 999,
+        league="stage" not in event,
+        teams=teams,
+        winner=winner,
+        innings=tallies,
+    )
+
+
+def abandoned_results(season: str) -> List[MatchResult]:
+    """No-results for `season`'s fixtures that never got a ball bowled (and so a file)."""
+    return [
+        MatchResult(match_id=f"{season}/abandoned-{f['match_number']}", date=f["date"],
+                    match_number=f["match_number"], league=True, teams=tuple(f["teams"]), winner=None)
+        for f in _load_adjustments().get("abandoned", {}).get(season, ())
+    ]
+
+
+def _tally(cols, innings_no, meta, quota_overs, target, dls) -> InningsTally:
+    mask = cols.innings == innings_no
+    runs = int(cols.runs_total[mask].sum())
+    balls = int(((cols.flags[mask] & FLAG_LEGAL) != 0).sum())
+    balls = min(balls, quota_overs * 6)     # umpires' miscounted 7-ball overs don't count extra
+
+    kinds = cols.dismissal[mask & ((cols.flags & FLAG_WICKET) != 0)]
+    wickets = sum(1 for k in kinds.tolist() if k == NO_ID or cols.kinds[k] not in _NOT_OUT_KINDS)
+    all_out = wickets >= 10 - len(meta.get("absent_hurt", ()))
+
+    # Revised quota: the target's overs, for both sides if the match was
+    # shortened before the first innings ended, else just the chase
+    quota = quota_overs * 6
+    if target and target.get("overs"):
+        revised = _overs_to_balls(target["overs"])
+        if innings_no == 2 or balls <= revised:
+            quota = revised
+
+    if dls and innings_no == 1 and target:
+        return InningsTally(meta.get("team", ""), int(target["runs"]) - 1, _overs_to_balls(target["overs"]))
+    return InningsTally(meta.get("team", ""), runs, quota if all_out else balls)
+
+
+def _overs_to_balls(overs) -> int:
+    """Cricket notation — 9.2 overs is 9 overs and 2 balls, not 9.2 × 6."""
+    whole = int(overs)
+    return whole * 6 + round((overs - whole) * 10)
+
+
+# -- Table ---------------------------------------------------------------------
+
+@dataclass
+class TeamRow:
+    team: str
+    matches: int = 0
+    wins: int = 0
+    losses: int = 0
+    nr: int = 0
+    points: int = 0
+    runs_for: int = 0
+    balls_for: int = 0
+    runs_against: int = 0
+    balls_against: int = 0
+
+    @property
+    def nrr(self) -> float:
+        scored = self.runs_for * 6 / self.balls_for if self.balls_for else 0.0
+        conceded = self.runs_against * 6 / self.balls_against if self.balls_against else 0.0
+        return scored - conceded
+
+    def as_dict(self, rank: int) -> dict:
+        """Same shape as a data/points_table.json row."""
+        return {
+            "rank": rank, "team": self.team, "matches": self.matches, "wins": self.wins,
+            "losses": self.losses, "nr": self.nr, "nrr": round(self.nrr, 3), "points": self.points,
+        }
+
+
+@dataclass
+class SeasonStandings:
+    """Cumulative league table after every league match of one season."""
+    order: List[Tuple[str, int]] = field(default_factory=list)  # (date, match number) per match
+    tables: List[List[dict]] = field(default_factory=list)      # tables[i]: after order[i]
+    results: List[MatchResult] = field(default_factory=list)
+    opening: List[dict] = field(default_factory=list)           # every side on zero
+
+    @classmethod
+    def from_results(cls, results: List[MatchResult]) -> "SeasonStandings":
+        voided = voided_matches()
+        league = sorted((r for r in results if r.league and r.match_id not in voided),
+                        key=lambda r: (r.date, r.match_number))
+        rows: Dict[str, TeamRow] = {}
+        teams = sorted({t for r in league for t in r.teams})
+        out = cls(results=league, opening=_ranked({t: TeamRow(t) for t in teams}))
+
+        for r in league:
+            for team in r.teams:
+                rows.setdefault(team, TeamRow(team))
+            _apply_result(rows, r)
+            out.order.append((r.date, r.match_number))
+            out.tables.append(_ranked(rows))
+        return out
+
+    def final(self) -> List[dict]:
+        return self.tables[-1] if self.tables else []
+
+    def before(self, date: str, match_number: int = 0) -> List[dict]:
+        """
+        Table going into match `match_number` on `date` — so a double-header's
+        second game sees the first.  Without a number, going into the day.
+        """
+        i = bisect.bisect_left(self.order, (date, match_number))
+        return self.tables[i - 1] if i else self.opening
+
+    def after(self, date: str) -> List[dict]:
+        """Table at the end of `date`, including that day's matches."""
+        i = bisect.bisect_right(self.order, (date, float("inf")))
+        return self.tables[i - 1] if i else []
+
+
+def _apply_result(rows: Dict[str, TeamRow], r: MatchResult):
+    for team in r.teams:
+        row = rows[team]
+        row.matches += 1
+        if r.winner is None:
+            row.nr += 1
+            row.points += POINTS_NO_RESULT
+        elif r.winner == team:
+            row.wins += 1
+            row.points += POINTS_WIN
+        else:
+            row.losses += 1
+
+    for inn in r.innings:
+        bowling = next((t for t in r.teams if t != inn.team), None)
+        rows[inn.team].runs_for += inn.runs
+        rows[inn.team].balls_for += inn.balls
+        if bowling in rows:
+            rows[bowling].runs_against += inn.runs
+            rows[bowling].balls_against += inn.balls
+
+
+def _ranked(rows: Dict[str, TeamRow]) -> List[dict]:
+    order = sorted(rows.values(), key=lambda t: (-t.points, -t.nrr, -t.wins, t.team))
+    return [t.as_dict(i + 1) for i, t in enumerate(order)]
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Optional, Dict
 
+from engine.players import NO_PLAYER
+
 
 @dataclass(frozen=True, slots=True)
 class PlayerStats:
@@ -35,15 +37,20 @@ class MatchState:
     batting_team: str = "BAT"
     bowling_team: str = "BOWL"
 
+    # Display names for the HUD; the *_id fields are what stats are keyed on
     current_batter: str = ""
     current_non_striker: str = ""
     current_bowler: str = ""
+    current_batter_id: int = NO_PLAYER
+    current_non_striker_id: int = NO_PLAYER
+    current_bowler_id: int = NO_PLAYER
 
-    # Per-player breakdowns — shallow-copied on each transition
-    batter_stats: Dict[str, PlayerStats] = field(default_factory=dict)
-    bowler_stats: Dict[str, BowlerStats] = field(default_factory=dict)
+    # Per-player breakdowns keyed by registry id — shallow-copied on each transition
+    batter_stats: Dict[int, PlayerStats] = field(default_factory=dict)
+    bowler_stats: Dict[int, BowlerStats] = field(default_factory=dict)
 
-    overs_limit: int = 20
+    balls_limit: int = 120          # legal balls available — a revised quota needn't be whole overs
+    wickets_limit: int = 10         # wickets that end the innings: 2 in a super over
     target: Optional[int] = None
 
     extras_total: int = 0
@@ -58,6 +65,15 @@ class MatchState:
     def overs_str(self) -> str:
         return f"{self.legal_balls // 6}.{self.legal_balls % 6}"
 
+    @property
+    def overs_limit_str(self) -> str:
+        overs, balls = divmod(self.balls_limit, 6)
+        return f"{overs}.{balls}" if balls else str(overs)
+
+    @property
+    def balls_left(self) -> int:
+        return max(0, self.balls_limit - self.legal_balls)
+
     @property
     def run_rate(self) -> float:
         if self.legal_balls == 0:
@@ -68,8 +84,8 @@ class MatchState:
     def req_run_rate(self) -> Optional[float]:
         if self.target is None:
             return None
-        rem_runs = self.target - self.score
-        rem_balls = (self.overs_limit * 6) - self.legal_balls
+        rem_runs = max(0, self.target - self.score)
+        rem_balls = self.balls_limit - self.legal_balls
         if rem_balls <= 0:
             return 0.0
         return round((rem_runs / rem_balls) * 6, 2)
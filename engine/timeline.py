@@ -1,5 +1,6 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from engine.events import BallEvent
+from engine.columns import EventColumns
 
 
 class Timeline:
@@ -10,18 +11,27 @@ class Timeline:
     Speed is in "events per second" — 1.0 means one ball/second, 4.0 means
     four balls/second.  Seeking resets the accumulator so you don't get a
     stale partial-tick after jumping.
+
+    `events` can be a plain list or an EventColumns — the latter hands out
+    a BallEvent only for the ball that actually fires, and slicing
+    `timeline.events` stays a zero-copy view.
+
+    With `reverse` set, playback runs backwards: each tick steps the index
+    back one and returns the ball just *un*-bowled, for the caller to undo.
     """
 
-    def __init__(self, events: List[BallEvent]):
+    def __init__(self, events: Union[List[BallEvent], EventColumns]):
         self.events = events
         self.index = 0
         self.playing = False
         self.speed = 1.0
         self.accumulator = 0.0
+        self.reverse = False
         self.total_events = len(events)
 
     def update(self, dt: float) -> Optional[BallEvent]:
-        if not self.playing or self.index >= self.total_events:
+        at_end = self.index <= 0 if self.reverse else self.index >= self.total_events
+        if not self.playing or at_end:
             return None
 
         self.accumulator += dt * self.speed
@@ -29,6 +39,9 @@ class Timeline:
         # One ball fires when we cross the 1-second threshold
         if self.accumulator >= 1.0:
             self.accumulator = 0.0
+            if self.reverse:
+                self.index -= 1
+                return self.events[self.index]
             ev = self.events[self.index]
             self.index += 1
             return ev
@@ -42,6 +55,10 @@ class Timeline:
     def toggle_play(self):
         self.playing = not self.playing
 
+    def toggle_reverse(self):
+        self.reverse = not self.reverse
+        self.accumulator = 0.0
+
     def set_speed(self, speed: float):
         self.speed = max(0.1, min(speed, 50.0))
 
@@ -2,12 +2,15 @@
 Open-Meteo historical weather client.
 
 Fetches match-day conditions (temp, humidity, wind, rain) for a given
-lat/lon + date, caching results locally so we only hit the API once per
-venue-date combo.
+lat/lon + date.  Lookups go offline pack → local cache → network, so a
+kiosk with the pack bundled never touches the API at all.
 """
 
+import gzip
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 
 import requests
@@ -17,10 +20,73 @@ from engine.paths import get_resource_path
 log = logging.getLogger(__name__)
 
 CACHE_FILE = get_resource_path("data/weather_cache.json")
+PACK_FILE = get_resource_path("data/weather_pack.json.gz")
+PACK_VERSION = 1
 USER_AGENT = "IPLViz/1.0 (historical_weather_feature)"
+ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+
+# Order matters — the pack stores one list per field in exactly this order
+HOURLY_FIELDS = (
+    "temperature_2m", "relative_humidity_2m", "rain",
+    "wind_speed_10m", "weather_code", "apparent_temperature",
+)
+
+# IPL starts around 7:30 PM local — hour index 19 is close enough
+MATCH_START_HOUR = 19
+MINUTES_PER_OVER = 4.25     # regulation over rate incl. drinks/strategic breaks
+INNINGS_BREAK_MIN = 20
+
+
+def weather_key(lat: float, lon: float, date_str: str) -> str:
+    return f"{lat:.4f}_{lon:.4f}_{date_str}"
+
+
+# -- Offline pack -------------------------------------------------------------
+# gzip'd JSON: {"version": 1, "fields": [...], "hours": {key: [[24 values] per field]}}.
+# Loaded once and kept in memory — the whole corpus is a few hundred KB.
+
+_pack = None
+
+
+def _load_pack():
+    global _pack
+    if _pack is None:
+        _pack = read_pack(PACK_FILE)
+    return _pack
+
+
+def read_pack(path: Path) -> dict:
+    """Return the pack's key → series map, or {} if missing/incompatible."""
+    if not path.exists():
+        return {}
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            blob = json.load(f)
+    except (OSError, json.JSONDecodeError) as exc:
+        log.warning("Unreadable weather pack %s: %s", path, exc)
+        return {}
+    if blob.get("version") != PACK_VERSION or tuple(blob.get("fields", ())) != HOURLY_FIELDS:
+        log.warning("Weather pack %s has an incompatible layout — ignoring", path)
+        return {}
+    return blob.get("hours", {})
+
+
+def write_pack(path: Path, hours: dict):
+    """Serialise a key → series map as a compact, gzip'd pack."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    blob = {"version": PACK_VERSION, "fields": list(HOURLY_FIELDS), "hours": hours}
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=9) as f:
+        json.dump(blob, f, separators=(",", ":"))
 
 
 # -- File-backed cache --------------------------------------------------------
+# The prefetch thread and the main thread both add to it, so writes are a
+# locked read-modify-write, and land via a temp file swapped in with
+# os.replace — a reader never sees half a file, and neither writer's entry
+# is lost to the other's stale copy.
+
+_cache_lock = threading.Lock()
+
 
 def _load_cache():
     if not CACHE_FILE.exists():
@@ -32,70 +98,154 @@ def _load_cache():
         return {}
 
 
-def _save_cache(cache):
-    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CACHE_FILE, "w") as f:
-        json.dump(cache, f, indent=2)
+def _save_to_cache(key: str, value):
+    with _cache_lock:
+        cache = _load_cache()
+        cache[key] = value
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp, CACHE_FILE)
+        except OSError as exc:
+            log.warning("Couldn't write weather cache %s: %s", CACHE_FILE, exc)
+            tmp.unlink(missing_ok=True)
+
+
+# -- Network ------------------------------------------------------------------
+
+def fetch_hourly_range(lat: float, lon: float, start_date: str, end_date: str):
+    """
+    Pull hourly series for an inclusive date range in one request.  Returns
+    {date: [[24 values] per field]} or None on failure.  Used directly by the
+    pack builder, which batches a whole season per venue.
+    """
+    resp = requests.get(
+        ARCHIVE_URL,
+        params={
+            "latitude": lat,
+            "longitude": lon,
+            "start_date": start_date,
+            "end_date": end_date,
+            "hourly": ",".join(HOURLY_FIELDS),
+            "timezone": "auto",
+        },
+        headers={"User-Agent": USER_AGENT},
+        timeout=30,
+    )
+    if resp.status_code != 200:
+        log.error("Open-Meteo returned %d: %s", resp.status_code, resp.text[:200])
+        return None
+
+    hourly = resp.json().get("hourly", {})
+    if not hourly or "time" not in hourly:
+        return None
+
+    # Split the flat series back into per-day chunks keyed by local date
+    days = {}
+    for i, stamp in enumerate(hourly["time"]):
+        series = days.setdefault(stamp[:10], [[] for _ in HOURLY_FIELDS])
+        for j, name in enumerate(HOURLY_FIELDS):
+            series[j].append(hourly[name][i])
+    return days
 
 
 # -- Public API ---------------------------------------------------------------
 
-def get_match_weather(lat: float, lon: float, date_str: str):
+def get_hourly_weather(lat: float, lon: float, date_str: str, fetch: bool = True):
     """
-    Return a dict of weather conditions for the given coordinates + date,
-    or None if anything goes sideways.  Results are cached to disk.
+    Hourly series for one venue-date: a list with one 24-value list per
+    entry in HOURLY_FIELDS, or None.  Pack first, then disk cache, then
+    (unless `fetch` is False) the API.
     """
     if lat == 0.0 or lon == 0.0 or not date_str:
         return None
 
-    key = f"{lat:.4f}_{lon:.4f}_{date_str}"
+    key = weather_key(lat, lon, date_str)
+    pack = _load_pack()
+    if key in pack:
+        return pack[key]
+
     cache = _load_cache()
-    if key in cache:
-        return cache[key]
+    hourly_key = f"hourly_{key}"
+    if hourly_key in cache:
+        return cache[hourly_key]
+    if not fetch:
+        return None
 
     try:
-        resp = requests.get(
-            "https://archive-api.open-meteo.com/v1/archive",
-            params={
-                "latitude": lat,
-                "longitude": lon,
-                "start_date": date_str,
-                "end_date": date_str,
-                "hourly": "temperature_2m,relative_humidity_2m,rain,wind_speed_10m,weather_code,apparent_temperature",
-                "timezone": "auto",
-            },
-            headers={"User-Agent": USER_AGENT},
-        )
-        if resp.status_code != 200:
-            log.error("Open-Meteo returned %d: %s", resp.status_code, resp.text[:200])
-            return None
-
-        hourly = resp.json().get("hourly", {})
-        if not hourly or "time" not in hourly:
-            return None
-
-        # IPL starts around 7:30 PM local — hour index 19 is close enough
-        idx = 19 if len(hourly["time"]) > 19 else len(hourly["time"]) - 1
-        code = hourly["weather_code"][idx]
-
-        result = {
-            "air_temp":   f"{hourly['temperature_2m'][idx]}°C",
-            "feels_like": f"{hourly['apparent_temperature'][idx]}°C",
-            "humidity":   f"{hourly['relative_humidity_2m'][idx]}%",
-            "wind":       f"{hourly['wind_speed_10m'][idx]} km/h",
-            "rain":       f"{hourly['rain'][idx]} mm",
-            "summary":    _wmo_summary(code),
-            "icon":       _wmo_icon(code),
-            "source":     "Open-Meteo",
-        }
-
-        cache[key] = result
-        _save_cache(cache)
-        return result
-
+        days = fetch_hourly_range(lat, lon, date_str, date_str)
     except Exception as exc:
         log.error("Weather fetch failed: %s", exc)
         return None
+    if not days or date_str not in days:
+        return None
+
+    _save_to_cache(hourly_key, days[date_str])
+    return days[date_str]
+
+
+def cached_summary(lat: float, lon: float, date_str: str):
+    """
+    Start-of-match conditions cached by older versions (one summary dict
+    per venue-date, no hourly series), or None.
+    """
+    if lat == 0.0 or lon == 0.0 or not date_str:
+        return None
+    return _load_cache().get(weather_key(lat, lon, date_str))
+
+
+def get_match_weather(lat: float, lon: float, date_str: str, hour: int = MATCH_START_HOUR):
+    """
+    Return a dict of weather conditions for the given coordinates + date,
+    or None if anything goes sideways.
+    """
+    if lat == 0.0 or lon == 0.0 or not date_str:
+        return None
+
+    hourly = get_hourly_weather(lat, lon, date_str, fetch=False)
+    if hourly:
+        return conditions_at(hourly, hour)
+
+    # Summaries cached by older versions are still honoured at the default
+    # hour, so upgrading doesn't re-fetch anything the pack doesn't cover
+    if hour == MATCH_START_HOUR:
+        legacy = cached_summary(lat, lon, date_str)
+        if legacy:
+            return legacy
+
+    hourly = get_hourly_weather(lat, lon, date_str)
+    if not hourly:
+        return None
+    return conditions_at(hourly, hour)
+
+
+def conditions_at(hourly, hour: int) -> dict:
+    """Format one hour of an hourly series into the dict the weather panel reads."""
+    series = dict(zip(HOURLY_FIELDS, hourly))
+    n = len(series["temperature_2m"])
+    idx = max(0, min(hour, n - 1))
+    code = series["weather_code"][idx]
+
+    return {
+        "air_temp":   f"{series['temperature_2m'][idx]}°C",
+        "feels_like": f"{series['apparent_temperature'][idx]}°C",
+        "humidity":   f"{series['relative_humidity_2m'][idx]}%",
+        "wind":       f"{series['wind_speed_10m'][idx]} km/h",
+        "rain":       f"{series['rain'][idx]} mm",
+        "summary":    _wmo_summary(code),
+        "icon":       _wmo_icon(code),
+        "source":     "Open-Meteo",
+    }
+
+
+def hour_for_over(innings: int, over: int, start_hour: int = MATCH_START_HOUR) -> int:
+    """Rough local hour a given over was bowled at, assuming a 20-over innings."""
+    elapsed = ((innings - 1) * 20 + over) * MINUTES_PER_OVER
+    if innings > 1:
+        elapsed += INNINGS_BREAK_MIN
+    return start_hour + int(elapsed // 60)
 
 
 # -- WMO weather code mapping -------------------------------------------------
@@ -120,4 +270,4 @@ def _wmo_icon(code):
     if code in (51, 53, 55):    return "drizzle"
     if code in (61, 63, 65, 80, 81, 82): return "rain"
     if code >= 95:              return "thunder"
-    return "cloudy"
\ No newline at end of file
+    return "cloudy"
@@ -0,0 +1,266 @@
+"""
+Win probability for a chase, from what happened in every chase before.
+
+The model is a lookup table over (balls remaining, wickets in hand, runs
+required): the share of corpus chases that went on to win from that
+situation.  scripts/build_winprob_table.py counts every second-innings
+ball (chase_rows is its data_io.mapreduce map fn), then smooths the
+counts and ships the result as data/winprob_table.npz — probabilities
+quantised to a byte each, about 330k cells.
+
+Raw counts are thin at the edges (few sides ever needed 90 off 30 with
+two down), so the table is:
+  * blurred over neighbouring balls and runs, counts and wins separately,
+    so sparse cells borrow from their neighbours in proportion to data
+  * shrunk towards a logistic fit on required rate, wickets and balls
+    where even the blurred count is small — the fit also prices the
+    situations nobody was ever in
+  * forced monotone — more balls or wickets never hurt, more runs
+    required never helps
+
+chase_worm() then prices every ball of a match in one vectorised gather.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from engine.careers import NOT_OUT_KINDS
+from engine.columns import FLAG_LEGAL, FLAG_WICKET, NO_ID
+from engine.paths import get_resource_path
+
+log = logging.getLogger(__name__)
+
+TABLE_FILE = get_resource_path("data/winprob_table.npz")
+
+MAX_BALLS = 120
+MAX_WICKETS = 10
+MAX_RUNS = 250          # anything beyond is priced as 250 — effectively lost
+
+BLUR_BALLS = 3          # half-widths of the box blur
+BLUR_RUNS = 2
+PRIOR_WEIGHT = 8.0      # pseudo-observations of the logistic fit per cell
+
+
+# -- Chase situation ----------------------------------------------------------
+
+def chase_target(cols, headers, info):
+    """(runs to win, balls available) for the chase, honouring D/L revisions."""
+    quota = int(info.get("overs") or 20) * 6
+    meta = [inn for inn in headers if not inn.get("super_over")]
+    target = meta[1].get("target") if len(meta) > 1 else None
+    if target and target.get("runs"):
+        overs = target.get("overs")
+        if overs:
+            quota = int(overs) * 6 + round((overs - int(overs)) * 10)
+        return int(target["runs"]), quota
+    return int(cols.runs_total[cols.innings == 1].sum()) + 1, quota
+
+
+def chase_states(cols, target: int, quota: int):
+    """
+    Balls remaining, wickets in hand and runs required before each
+    second-innings delivery, plus one final entry for after the last —
+    so state[i + 1] is the situation once ball i has been bowled.
+    """
+    mask = cols.innings == 2
+    flags = cols.flags[mask]
+    legal = ((flags & FLAG_LEGAL) != 0).astype(np.int32)
+    kinds = cols.dismissal[mask]
+    out_kinds = [i for i, k in enumerate(cols.kinds) if k in NOT_OUT_KINDS]
+    fell = ((flags & FLAG_WICKET) != 0) & ~np.isin(kinds, out_kinds)
+    fell &= kinds != NO_ID
+
+    def before(per_ball):
+        return np.concatenate([[0], np.cumsum(per_ball)])
+
+    balls_left = quota - before(legal)
+    wickets_in_hand = MAX_WICKETS - before(fell.astype(np.int32))
+    runs_required = target - before(cols.runs_total[mask].astype(np.int32))
+    return np.stack([balls_left, wickets_in_hand, runs_required], axis=1)
+
+
+def chase_rows(record):
+    """
+    Map step: (situations before each chase ball, 1.0 / 0.5 / 0.0 for a
+    chase won / tied / lost), or None for matches with no chase result.
+    """
+    info, cols = record.info, record.columns
+    outcome = info.get("outcome", {})
+    meta = [inn for inn in record.innings if not inn.get("super_over")]
+    if len(meta) < 2 or not (cols.innings == 2).any():
+        return None
+    if outcome.get("result") == "tie":
+        won = 0.5       # level after 20 overs — the super over is a different game
+    elif outcome.get("winner"):
+        won = 1.0 if outcome["winner"] == meta[1].get("team") else 0.0
+    else:
+        return None
+    target, quota = chase_target(cols, record.innings, info)
+    states = chase_states(cols, target, quota)[:-1]
+    return states.astype(np.int16), won
+
+
+# -- Table --------------------------------------------------------------------
+
+class WinProbTable:
+    """P(chasing side wins) indexed [balls remaining, wickets in hand, runs required]."""
+
+    def __init__(self, probs: np.ndarray):
+        self.probs = probs      # float32, shape (MAX_BALLS + 1, MAX_WICKETS + 1, MAX_RUNS + 1)
+
+    @classmethod
+    def empty_counts(cls):
+        shape = (MAX_BALLS + 1, MAX_WICKETS + 1, MAX_RUNS + 1)
+        return np.zeros(shape, dtype=np.float64), np.zeros(shape, dtype=np.float64)
+
+    @staticmethod
+    def add_chase(acc, item):
+        """Reduce step: fold one chase_rows result into (wins, counts)."""
+        if item is not None:
+            states, won = item
+            wins, counts = acc
+            b, w, r = _clip(states[:, 0], states[:, 1], states[:, 2])
+            keep = r > 0        # already won — nothing to learn
+            np.add.at(counts, (b[keep], w[keep], r[keep]), 1.0)
+            np.add.at(wins, (b[keep], w[keep], r[keep]), won)
+        return acc
+
+    @classmethod
+    def from_counts(cls, wins: np.ndarray, counts: np.ndarray) -> "WinProbTable":
+        wins_s = _blur(_blur(wins, 0, BLUR_BALLS), 2, BLUR_RUNS)
+        counts_s = _blur(_blur(counts, 0, BLUR_BALLS), 2, BLUR_RUNS)
+        prior = _logistic_prior(wins, counts)
+        p = (wins_s + prior * PRIOR_WEIGHT) / (counts_s + PRIOR_WEIGHT)
+
+        # Settled situations
+        p[:, :, 0] = 1.0            # nothing required
+        p[0, :, 1:] = 0.0           # out of balls
+        p[:, 0, 1:] = 0.0           # out of wickets
+
+        # Monotone: fewer runs required, more balls, more wickets never hurt.
+        # Twice round, since fixing one axis can unsettle another.
+        for _ in range(2):
+            p = np.minimum.accumulate(p, axis=2)
+            p = np.maximum.accumulate(p, axis=0)
+            p = np.maximum.accumulate(p, axis=1)
+        return cls(p.astype(np.float32))
+
+    def lookup(self, balls_left, wickets_in_hand, runs_required) -> np.ndarray:
+        """Vectorised: arrays in, probabilities out.  Chases already won are 1."""
+        b, w, r = _clip(np.asarray(balls_left), np.asarray(wickets_in_hand), np.asarray(runs_required))
+        return self.probs[b, w, r]
+
+    # -- Persistence ----------------------------------------------------------
+
+    def save(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        quantised = np.round(self.probs * 255).astype(np.uint8)
+        np.savez_compressed(path, probs=quantised)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["WinProbTable"]:
+        try:
+            with np.load(path) as blob:
+                quantised = blob["probs"]
+        except (OSError, KeyError, ValueError) as exc:
+            log.warning("Unreadable win-probability table %s: %s", path, exc)
+            return None
+        if quantised.shape != (MAX_BALLS + 1, MAX_WICKETS + 1, MAX_RUNS + 1):
+            log.warning("Win-probability table %s has the wrong shape — rebuild it", path)
+            return None
+        return cls(quantised.astype(np.float32) / 255)
+
+
+def _clip(b, w, r):
+    return (np.clip(b, 0, MAX_BALLS).astype(np.intp),
+            np.clip(w, 0, MAX_WICKETS).astype(np.intp),
+            np.clip(r, 0, MAX_RUNS).astype(np.intp))
+
+
+def _features(b, w, r) -> np.ndarray:
+    balls = np.maximum(b, 1)
+    rrr = np.minimum(r * 6 / balls, 36.0)
+    return np.stack([np.ones_like(rrr), rrr, w / MAX_WICKETS, b / MAX_BALLS, rrr * w / MAX_WICKETS], axis=-1)
+
+
+def _logistic_prior(wins: np.ndarray, counts: np.ndarray, iterations: int = 25) -> np.ndarray:
+    """Weighted logistic regression over the observed cells (IRLS), evaluated everywhere."""
+    b, w, r = np.nonzero(counts)
+    x = _features(b, w, r)
+    n, y = counts[b, w, r], wins[b, w, r] / counts[b, w, r]
+    beta = np.zeros(x.shape[1])
+    for _ in range(iterations):
+        mu = 1 / (1 + np.exp(-(x @ beta)))
+        weight = n * mu * (1 - mu) + 1e-9
+        hessian = (x * weight[:, None]).T @ x + 1e-6 * np.eye(len(beta))
+        beta += np.linalg.solve(hessian, x.T @ (n * (y - mu)))
+
+    grid = np.indices(counts.shape)
+    return 1 / (1 + np.exp(-(_features(*grid) @ beta)))
+
+
+def _blur(a: np.ndarray, axis: int, radius: int) -> np.ndarray:
+    """Box sum of half-width `radius` along `axis`, edges truncated."""
+    a = np.moveaxis(a, axis, 0)
+    c = np.concatenate([np.zeros((1,) + a.shape[1:]), np.cumsum(a, axis=0)])
+    n = a.shape[0]
+    hi = np.minimum(np.arange(n) + radius + 1, n)
+    lo = np.maximum(np.arange(n) - radius, 0)
+    return np.moveaxis(c[hi] - c[lo], 0, axis)
+
+
+_table: Optional[WinProbTable] = None
+_table_loaded = False
+
+
+def get_win_table() -> Optional[WinProbTable]:
+    """The shipped table, loaded on first use — None if it hasn't been built."""
+    global _table, _table_loaded
+    if not _table_loaded:
+        _table_loaded = True
+        if TABLE_FILE.exists():
+            _table = WinProbTable.load(TABLE_FILE)
+        else:
+            log.info("No %s — run scripts/build_winprob_table.py", TABLE_FILE.name)
+    return _table
+
+
+# -- Per-match worm -----------------------------------------------------------
+
+@dataclass(frozen=True)
+class Worm:
+    """Chasing side's win probability after each ball of the chase."""
+    chasing: str
+    defending: str
+    target: int
+    quota: int                  # balls available to the chase
+    positions: np.ndarray       # timeline index of each chase ball
+    probs: np.ndarray           # P(chasing side wins) once that ball is bowled
+    start: float                # before the first ball
+
+    def upto(self, timeline_index: int) -> np.ndarray:
+        """Probabilities for the chase balls bowled before `timeline_index`."""
+        return self.probs[:int(np.searchsorted(self.positions, timeline_index))]
+
+
+def chase_worm(cols, raw: dict, table: Optional[WinProbTable] = None) -> Optional[Worm]:
+    """Price every ball of a match's chase, or None if there's no chase or no table."""
+    table = table or get_win_table()
+    if table is None or not len(cols):
+        return None
+    headers = raw.get("innings", [])
+    meta = [inn for inn in headers if not inn.get("super_over")]
+    positions = np.flatnonzero(cols.innings == 2)
+    if len(meta) < 2 or not len(positions):
+        return None
+
+    info = raw.get("info", {})
+    target, quota = chase_target(cols, headers, info)
+    states = chase_states(cols, target, quota)
+    probs = table.lookup(states[:, 0], states[:, 1], states[:, 2])
+    defending = next((t for t in info.get("teams", []) if t != meta[1].get("team")), "")
+    return Worm(meta[1].get("team", ""), defending, target, quota, positions, probs[1:], float(probs[0]))
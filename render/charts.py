@@ -0,0 +1,277 @@
+"""
+Worm and Manhattan charts for both innings, drawn straight onto pygame.
+
+The series come from one pass of cumulative sums over the match's
+EventColumns (ChartSeries).  Drawing is layered so a frame costs a couple
+of blits plus the bit that's actually moving:
+  * the static layer — card, axes, gridlines, labels — is rendered once
+    per match and size
+  * the progress layer holds every completed over: its worm segment,
+    Manhattan bar and wicket markers.  It's extended one over at a time
+    as the replay crosses over boundaries, and rebuilt from the static
+    layer only when the replay goes backwards past one
+  * the over in progress — a few worm points, a growing bar, the
+    playhead — is drawn fresh each frame
+
+Both layers are window-sized, so they live in the shared surface cache
+("charts") under its byte budget; an evicted layer is simply redrawn.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from data.team_registry import TEAM_COLORS, abbreviate_team
+from data.theme import BG_COLOR, BORDER_COLOR, DIVIDER_COLOR, LABEL_COLOR, TEXT_GOLD, TEXT_WHITE, WINDOW_BG
+from engine.careers import NOT_OUT_KINDS
+from engine.columns import EventColumns, FLAG_LEGAL, FLAG_WICKET, NO_ID
+from render.quality import cache_surface
+from render.surface_cache import get_surface_cache
+
+PAD = 24
+AXIS_W = 44             # room for the y labels
+WICKET_COLOR = (220, 50, 50)
+FALLBACK_COLORS = ((90, 160, 255), (255, 150, 60))
+
+_fonts: dict[str, pygame.font.Font] = {}
+
+
+def _font(key: str) -> pygame.font.Font:
+    if key not in _fonts:
+        _fonts.update({
+            "t": pygame.font.SysFont("Arial", 16, bold=True),
+            "s": pygame.font.SysFont("Arial", 12),
+        })
+    return _fonts[key]
+
+
+def _visible(rgb, i):
+    """Team colour, lifted towards white if it would vanish on the navy card."""
+    if rgb is None:
+        return FALLBACK_COLORS[i % 2]
+    lum = 0.299 * rgb[0] + 0.587 * rgb[1] + 0.114 * rgb[2]
+    if lum >= 110:
+        return rgb
+    k = (110 - lum) / 255 + 0.25
+    return tuple(int(c + (255 - c) * k) for c in rgb)
+
+
+# -- Series -------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class InningsSeries:
+    team: str
+    color: Tuple[int, int, int]
+    positions: np.ndarray       # timeline position of each ball
+    balls: np.ndarray           # legal balls after each ball, with a leading 0
+    runs: np.ndarray            # team total after each ball, with a leading 0
+    over_ends: np.ndarray       # timeline position of each over's last ball
+    over_numbers: np.ndarray    # and which over it was (0-based)
+    over_runs: np.ndarray       # runs per over
+    over_wickets: np.ndarray    # wickets per over
+    wickets: np.ndarray         # worm point index (1-based ball count) of each wicket
+
+    def bowled(self, index: int) -> int:
+        """Balls of this innings bowled before timeline index `index`."""
+        return int(np.searchsorted(self.positions, index))
+
+    def overs_done(self, index: int) -> int:
+        return int(np.searchsorted(self.over_ends, index))
+
+
+class ChartSeries:
+    """Both regular innings of a match, as arrays the charts read from."""
+
+    def __init__(self, cols: EventColumns):
+        not_out = [i for i, k in enumerate(cols.kinds) if k in NOT_OUT_KINDS]
+        self.innings: List[InningsSeries] = []
+        for inn in (1, 2):
+            positions = np.flatnonzero(cols.innings == inn)
+            if not len(positions):
+                continue
+            legal = (cols.flags[positions] & FLAG_LEGAL) != 0
+            kinds = cols.dismissal[positions]
+            fell = ((cols.flags[positions] & FLAG_WICKET) != 0) & (kinds != NO_ID) & ~np.isin(kinds, not_out)
+            over = cols.over[positions]
+            last_of_over = np.append(over[1:] != over[:-1], True)
+            team = cols.teams[cols.batting_team[positions[0]]]
+
+            self.innings.append(InningsSeries(
+                team=team,
+                color=_visible(TEAM_COLORS.get(team), inn - 1),
+                positions=positions,
+                balls=np.concatenate([[0], np.cumsum(legal)]),
+                runs=np.concatenate([[0], np.cumsum(cols.runs_total[positions])]),
+                over_ends=positions[last_of_over],
+                over_numbers=over[last_of_over],
+                over_runs=np.bincount(over, weights=cols.runs_total[positions]).astype(int),
+                over_wickets=np.bincount(over, weights=fell).astype(int),
+                wickets=np.flatnonzero(fell) + 1,
+            ))
+        self.overs = max([20] + [len(s.over_runs) for s in self.innings])
+        self.max_runs = max([0] + [int(s.runs[-1]) for s in self.innings])
+        self.max_over = max([0] + [int(s.over_runs.max()) for s in self.innings])
+
+
+def _nice_step(top: float, ticks: int = 5) -> int:
+    raw = max(1.0, top / ticks)
+    mag = 10 ** int(np.floor(np.log10(raw)))
+    return int(next(m * mag for m in (1, 2, 5, 10) if m * mag >= raw))
+
+
+# -- View ---------------------------------------------------------------------
+
+class ChartsView:
+
+    def __init__(self):
+        self._key = None
+        self.series: Optional[ChartSeries] = None
+        self._done: Tuple[int, ...] = ()    # overs per innings on the cached progress layer
+        self._worm_px: List[np.ndarray] = []
+
+    def invalidate(self):
+        """Forget the match drawn; the next draw() starts over."""
+        self._key = None
+        get_surface_cache().discard("charts")
+
+    def draw(self, screen, rect: pygame.Rect, cols: EventColumns, index: int):
+        # The corpus id ('2019/1181766') — unique, unlike Cricsheet's match number
+        key = (cols.match_id, rect.size)
+        if key != self._key:
+            get_surface_cache().discard("charts")
+            self._prepare(cols, rect)
+            self._key = key
+
+        cache = get_surface_cache()
+        progress = cache.get("charts", ("progress", key))
+        done = tuple(s.overs_done(index) for s in self.series.innings)
+        if progress is None or any(d < was for d, was in zip(done, self._done)):
+            progress = self._restart_progress(key)
+        if done != self._done:
+            for i, s in enumerate(self.series.innings):
+                self._draw_overs(progress, i, s, self._done[i], done[i])
+            self._done = done
+
+        screen.blit(progress, rect.topleft)
+        self._draw_live(screen, rect.topleft, index)
+
+    def _restart_progress(self, key) -> pygame.Surface:
+        """A fresh progress layer — the static one, no overs drawn yet."""
+        cache = get_surface_cache()
+        static = cache.get("charts", ("static", key), lambda: self._draw_static(*key[1]))
+        progress = static.copy()
+        cache.put("charts", ("progress", key), progress)
+        self._done = tuple(0 for _ in self.series.innings)
+        return progress
+
+    # -- Layout ---------------------------------------------------------------
+
+    def _prepare(self, cols, rect):
+        self.series = ChartSeries(cols)
+        w, h = rect.size
+        plot_h = (h - PAD * 5 - 24) // 2
+        self.worm_rect = pygame.Rect(PAD + AXIS_W, PAD * 2 + 24, w - PAD * 2 - AXIS_W, plot_h)
+        self.bar_rect = pygame.Rect(self.worm_rect.x, self.worm_rect.bottom + PAD * 2, self.worm_rect.w, plot_h)
+
+        s = self.series
+        self.worm_step = _nice_step(max(s.max_runs, 50))
+        self.worm_top = -(-max(s.max_runs, 1) // self.worm_step) * self.worm_step
+        self.bar_step = _nice_step(max(s.max_over, 10), 4)
+        self.bar_top = -(-max(s.max_over, 1) // self.bar_step) * self.bar_step
+
+        # Worm pixel coordinates for every ball, computed once
+        r = self.worm_rect
+        self._worm_px = [
+            np.stack([r.x + r.w * inn.balls / (s.overs * 6),
+                      r.bottom - r.h * inn.runs / self.worm_top], axis=1)
+            for inn in s.innings
+        ]
+
+        self._done = tuple(0 for _ in s.innings)
+
+    def _draw_static(self, w, h) -> pygame.Surface:
+        surf = cache_surface((w, h), WINDOW_BG)
+        pygame.draw.rect(surf, BG_COLOR, surf.get_rect(), border_radius=12)
+        pygame.draw.rect(surf, BORDER_COLOR, surf.get_rect(), 1, border_radius=12)
+        t, sm = _font("t"), _font("s")
+        s = self.series
+
+        # Legend
+        x = PAD
+        for inn in s.innings:
+            pygame.draw.rect(surf, inn.color, (x, PAD + 4, 14, 14), border_radius=3)
+            label = t.render(abbreviate_team(inn.team), True, TEXT_WHITE)
+            surf.blit(label, (x + 20, PAD + 2))
+            x += label.get_width() + 48
+
+        for rect, title, top, step in ((self.worm_rect, "WORM · RUNS", self.worm_top, self.worm_step),
+                                       (self.bar_rect, "MANHATTAN · RUNS PER OVER", self.bar_top, self.bar_step)):
+            surf.blit(sm.render(title, True, TEXT_GOLD), (rect.x, rect.y - 18))
+            for v in range(0, top + 1, step):
+                y = rect.bottom - rect.h * v / top
+                pygame.draw.line(surf, DIVIDER_COLOR if v else BORDER_COLOR, (rect.x, y), (rect.right, y), 1)
+                lbl = sm.render(str(v), True, LABEL_COLOR)
+                surf.blit(lbl, lbl.get_rect(midright=(rect.x - 6, y)))
+            for over in range(0, s.overs + 1, 5 if s.overs > 10 else 1):
+                x = rect.x + rect.w * over / s.overs
+                pygame.draw.line(surf, DIVIDER_COLOR, (x, rect.bottom), (x, rect.bottom + 4), 1)
+                lbl = sm.render(str(over), True, LABEL_COLOR)
+                surf.blit(lbl, lbl.get_rect(midtop=(x, rect.bottom + 6)))
+        return surf
+
+    # -- Drawing --------------------------------------------------------------
+
+    def _bar(self, surf, i, over, runs, wickets, origin=(0, 0)):
+        """Manhattan bar for innings `i`'s over, side by side with the other innings'."""
+        r, s = self.bar_rect, self.series
+        slot = r.w / s.overs
+        bw = max(2, slot * 0.8 / max(1, len(s.innings)))
+        x = origin[0] + r.x + slot * over + slot * 0.1 + bw * i
+        top = origin[1] + r.bottom - r.h * min(runs, self.bar_top) / self.bar_top
+        color = s.innings[i].color
+        pygame.draw.rect(surf, color, (x, top, bw - 1, origin[1] + r.bottom - top))
+        for k in range(wickets):
+            pygame.draw.circle(surf, WICKET_COLOR, (x + bw / 2, top - 5 - k * 9), 4)
+
+    def _worm(self, surf, i, lo, hi, origin=(0, 0)):
+        """Worm points lo..hi (ball counts) for innings `i`, plus wicket markers in that span."""
+        pts = self._worm_px[i][lo:hi + 1] + origin
+        inn = self.series.innings[i]
+        if len(pts) > 1:
+            pygame.draw.lines(surf, inn.color, False, pts.tolist(), 3)
+        for j in inn.wickets[(inn.wickets > lo) & (inn.wickets <= hi)]:
+            centre = tuple(self._worm_px[i][j] + origin)
+            pygame.draw.circle(surf, WICKET_COLOR, centre, 5)
+            pygame.draw.circle(surf, TEXT_WHITE, centre, 5, 1)
+
+    @staticmethod
+    def _over_span(inn, k: int) -> Tuple[int, int]:
+        """Worm point range (ball counts) covering the innings' k-th over."""
+        lo = int(np.searchsorted(inn.positions, inn.over_ends[k - 1], side="right")) if k else 0
+        if k >= len(inn.over_ends):
+            return lo, len(inn.positions)
+        return lo, int(np.searchsorted(inn.positions, inn.over_ends[k], side="right"))
+
+    def _draw_overs(self, surf, i, inn, first, stop):
+        for k in range(first, stop):
+            lo, hi = self._over_span(inn, k)
+            over = int(inn.over_numbers[k])
+            self._worm(surf, i, lo, hi)
+            self._bar(surf, i, over, int(inn.runs[hi] - inn.runs[lo]), int(inn.over_wickets[over]))
+
+    def _draw_live(self, screen, origin, index):
+        origin = np.array(origin)
+        for i, inn in enumerate(self.series.innings):
+            bowled = inn.bowled(index)
+            done = self._done[i]
+            if bowled == 0 or done >= len(inn.over_ends):
+                continue
+            lo, _ = self._over_span(inn, done)
+            if bowled > lo:
+                self._worm(screen, i, lo, bowled, origin)
+                fell = int(((inn.wickets > lo) & (inn.wickets <= bowled)).sum())
+                self._bar(screen, i, int(inn.over_numbers[done]), int(inn.runs[bowled] - inn.runs[lo]), fell, origin)
+            # Playhead: a dot on the worm's leading edge
+            pygame.draw.circle(screen, TEXT_WHITE, tuple(self._worm_px[i][bowled] + origin), 4)
@@ -1,6 +1,10 @@
 import pygame
 import math
 
+from data.theme import WINDOW_BG
+from render.quality import cache_surface, get_quality
+from render.surface_cache import get_surface_cache
+
 # Ground palette
 GRASS_DARK  = (18, 42, 22)
 GRASS_LIGHT = (34, 68, 40)
@@ -24,15 +28,11 @@ OUTER_RING_W     = 4
 class FieldRenderer:
     """
     Renders the cricket ground once into an off-screen surface, then blits
-    that cached texture every frame.  Only regenerates when the window is
-    resized or a different stadium is loaded.
+    that cached texture every frame.  The texture lives in the shared
+    surface cache, keyed by window size and stadium, so it's only
+    regenerated for a new size or ground — or after the cache evicted it.
     """
 
-    def __init__(self):
-        self._surface = None
-        self._dims = (0, 0)
-        self._stadium_name = None
-
     def _m2px(self, metres, scale):
         return int(round(metres * scale))
 
@@ -49,9 +49,10 @@ class FieldRenderer:
     def _grass_gradient(self, surf, center, max_r):
         """
         Radial gradient from dark outfield to lighter centre.  Expensive
-        loop, but it only runs on cache refresh (~once or twice per session).
+        loop, but it only runs on cache refresh (~once or twice per session);
+        the quality profile sets how many rings.
         """
-        steps = 160
+        steps = get_quality().gradient_steps
         for i in range(steps):
             t = i / steps
             r = int(max_r * (1 - t))
@@ -68,35 +69,31 @@ class FieldRenderer:
     def render(self, screen, stadium):
         w, h = screen.get_size()
 
-        if (w, h) != self._dims or stadium.name != self._stadium_name:
-            self._rebuild(w, h, stadium)
-            self._dims = (w, h)
-            self._stadium_name = stadium.name
-
-        screen.blit(self._surface, (0, 0))
+        surf = get_surface_cache().get("field", (w, h, stadium.name), lambda: self._rebuild(w, h, stadium))
+        screen.blit(surf, (0, 0))
 
     def _rebuild(self, w, h, stadium):
-        self._surface = pygame.Surface((w, h), pygame.SRCALPHA)
+        surf = cache_surface((w, h), WINDOW_BG)
         cx, cy = w // 2, h // 2
         center = (cx, cy)
 
         max_r = min(w, h) // 2 - 180
         scale = max_r / (min(stadium.width_m, stadium.length_m) / 2)
 
-        self._grass_gradient(self._surface, center, max_r + 80)
+        self._grass_gradient(surf, center, max_r + 80)
 
         # Boundary ellipse — shaped to match real ground dimensions
         bw = self._m2px(stadium.width_m / 2, scale)
         bh = self._m2px(stadium.length_m / 2, scale)
         boundary = pygame.Rect(cx - bw, cy - bh, bw * 2, bh * 2)
-        pygame.draw.ellipse(self._surface, WHITE, boundary, LINE_W)
+        pygame.draw.ellipse(surf, WHITE, boundary, LINE_W)
 
         # Outer spectator ring
         gap = self._m2px(OUTER_GAP, scale)
         outer = boundary.inflate(gap * 2, gap * 2)
-        pygame.draw.ellipse(self._surface, (200, 200, 200), outer, OUTER_RING_W)
+        pygame.draw.ellipse(surf, (200, 200, 200), outer, OUTER_RING_W)
 
-        self._dotted_circle(self._surface, center, self._m2px(THIRTY_YARD_R, scale))
+        self._dotted_circle(surf, center, self._m2px(THIRTY_YARD_R, scale))
 
         # Pitch rectangle with alternating soil-tone stripes
         pw = self._m2px(PITCH_WID, scale)
@@ -104,11 +101,11 @@ class FieldRenderer:
         pitch = pygame.Rect(0, 0, pw, pl)
         pitch.center = center
 
-        pygame.draw.rect(self._surface, PITCH_LIGHT, pitch)
+        pygame.draw.rect(surf, PITCH_LIGHT, pitch)
         stripe = 6
         for y in range(pitch.top, pitch.bottom, stripe * 2):
-            pygame.draw.rect(self._surface, PITCH_DARK, (pitch.left, y, pw, stripe))
-        pygame.draw.rect(self._surface, WHITE, pitch, LINE_W)
+            pygame.draw.rect(surf, PITCH_DARK, (pitch.left, y, pw, stripe))
+        pygame.draw.rect(surf, WHITE, pitch, LINE_W)
 
         # Bowling + popping creases at both ends
         bc = self._m2px(BOWL_CREASE_HALF + 2 * CREASE_EXT, scale)
@@ -117,9 +114,10 @@ class FieldRenderer:
 
         for sign in (-1, 1):
             by = pitch.bottom if sign == 1 else pitch.top
-            pygame.draw.line(self._surface, WHITE, (cx - bc // 2, by), (cx + bc // 2, by), LINE_W)
+            pygame.draw.line(surf, WHITE, (cx - bc // 2, by), (cx + bc // 2, by), LINE_W)
             py = by - sign * pop_off
-            pygame.draw.line(self._surface, WHITE, (cx - pc // 2, py), (cx + pc // 2, py), LINE_W)
+            pygame.draw.line(surf, WHITE, (cx - pc // 2, py), (cx + pc // 2, py), LINE_W)
+        return surf
 
 
 # Module-level singleton — avoids re-instantiating per frame
@@ -1,8 +1,13 @@
 """
 Points table + playoff bracket view.
 
+The standings tab is computed from the deliveries (engine.standings) and
+shows the table as it stood going into the match being replayed, with
+the two sides in it outlined.
+
 Uses matplotlib (Agg backend) to render the playoff tree into a PNG,
-caches the result per-season so the heavy render only happens once.
+kept per season and size in the shared surface cache so the heavy render
+doesn't happen every frame.
 """
 
 import io
@@ -18,7 +23,10 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.path import Path as MplPath
 
+from data_io.season_stats import season_standings_failed, season_standings_if_ready
 from engine.paths import get_resource_path
+from render.quality import scale_image
+from render.surface_cache import get_surface_cache
 
 from data.team_registry import(
     TEAM_COLORS as TEAM_COLORS_RGB,
@@ -56,7 +64,7 @@ class PointsTableView:
 
         self.points_data   = self._load(get_resource_path("data/points_table.json"))
         self.playoffs_data = self._load(get_resource_path("data/playoffs.json"))
-        self.tree_cache    = {}
+        self.tree_failed   = set()     # seasons matplotlib couldn't draw; they get the manual bracket
 
     @staticmethod
     def _load(path):
@@ -77,7 +85,7 @@ class PointsTableView:
                     return True
         return False
 
-    def draw(self, screen, rect, year, font_title, font_body):
+    def draw(self, screen, rect, year, font_title, font_body, match=None):
         pygame.draw.rect(screen, BG_COLOR, rect, border_radius=12)
         pygame.draw.rect(screen, BORDER_COLOR, rect, 1, border_radius=12)
 
@@ -86,7 +94,7 @@ class PointsTableView:
         yr = str(year)
 
         if self.current_tab == "standings":
-            self._standings(screen, content, yr)
+            self._standings(screen, content, yr, match)
         else:
             self._playoffs(screen, content, yr)
 
@@ -118,19 +126,42 @@ class PointsTableView:
 
     # -- Standings table ------------------------------------------------------
 
-    def _standings(self, screen, rect, year):
+    def _table_for(self, year, match):
+        """
+        (rows, caption).  Computed from the deliveries as the table stood
+        going into `match`; the shipped JSON while that's still building,
+        after a failed build (it's retried in the background), or for
+        seasons we can't compute.
+        """
+        standings = season_standings_if_ready(year)
+        if standings is None:
+            if season_standings_failed(year):
+                return self.points_data.get(year, []), "FINAL TABLE"
+            return self.points_data.get(year, []), "FINAL TABLE · UPDATING"
+        if not standings.tables:
+            return self.points_data.get(year, []), "FINAL TABLE"
+        if match and match.get("stage", "League") == "League":
+            return standings.before(match["date"], match.get("match_number", 0)), f"BEFORE {match['date']}"
+        return standings.final(), "FINAL LEAGUE TABLE"
+
+    def _standings(self, screen, rect, year, match=None):
         cols = [("TEAM", 250), ("M", 60), ("W", 60), ("L", 60), ("N/R", 60), ("NRR", 90), ("PTS", 70)]
         tw = sum(c[1] for c in cols)
         sx = rect.centerx - tw // 2
         y = rect.y
 
+        data, caption = self._table_for(year, match)
+        playing = set(match["teams"].split(" vs ")) if match else set()
+        cap = self.font_match.render(caption, True, TEXT_GOLD)
+        screen.blit(cap, (sx + tw - cap.get_width(), y))
+        y += cap.get_height() + 6
+
         pygame.draw.rect(screen, (0, 0, 0), (sx, y, tw, 40))
         cx = sx
         for name, w in cols:
             screen.blit(self.font_row.render(name, True, TEXT_WHITE), (cx + 10, y + 10))
             cx += w
 
-        data = self.points_data.get(year, [])
         if not data:
             self._no_data(screen, rect, f"No Standings for {year}")
             return
@@ -142,6 +173,8 @@ class PointsTableView:
             name = ts.get("team", "Unknown")
             bg = get_team_color(name)
             pygame.draw.rect(screen, bg, (sx, y, tw, 48))
+            if name in playing:
+                pygame.draw.rect(screen, TEXT_GOLD, (sx - 3, y - 3, tw + 6, 54), 3, border_radius=4)
 
             vals = [
                 name, ts.get("matches", 0), ts.get("wins", 0), ts.get("losses", 0),
@@ -166,14 +199,9 @@ class PointsTableView:
             self._no_data(screen, rect, f"No Playoff Data for {year}")
             return
 
-        if year not in self.tree_cache:
-            try:
-                self.tree_cache[year] = self._mpl_tree(data, year, rect.size)
-            except Exception as exc:
-                logging.warning("Matplotlib bracket failed: %s — using fallback", exc)
-                self.tree_cache[year] = None
-
-        surf = self.tree_cache[year]
+        surf = None
+        if year not in self.tree_failed:
+            surf = get_surface_cache().get("playoffs", (year, rect.size), lambda: self._tree_or_none(data, year, rect.size))
         if surf:
             ox = rect.x + (rect.width - surf.get_width()) // 2
             oy = rect.y + (rect.height - surf.get_height()) // 2
@@ -181,6 +209,14 @@ class PointsTableView:
         else:
             self._manual_playoffs(screen, rect, data, year)
 
+    def _tree_or_none(self, data, year, size):
+        try:
+            return self._mpl_tree(data, year, size)
+        except Exception as exc:
+            logging.warning("Matplotlib bracket failed: %s — using fallback", exc)
+            self.tree_failed.add(year)
+            return None
+
     def _mpl_tree(self, data, year, size):
         dpi = 100
         fig, ax = plt.subplots(figsize=(size[0] / dpi, size[1] / dpi), dpi=dpi)
@@ -248,7 +284,7 @@ class PointsTableView:
         img = pygame.image.load(buf)
         ir = img.get_rect()
         s  = min(size[0] / ir.width, size[1] / ir.height) * 0.95
-        return pygame.transform.smoothscale(img, (int(ir.width * s), int(ir.height * s)))
+        return scale_image(img, (int(ir.width * s), int(ir.height * s)))
 
     # -- Pygame-only fallback bracket -----------------------------------------
 
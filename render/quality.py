@@ -0,0 +1,117 @@
+"""
+Quality profiles: how much the renderers spend on looks.
+
+  high    — everything: per-pixel alpha on cached surfaces, gradient
+            panels, the full 160-ring grass gradient, rotated arc
+            lettering, smoothscaled images
+  medium  — as high, with a coarser grass gradient and plain scaling
+  low     — for kiosk boxes with no GPU: cached surfaces are opaque,
+            drawn over the backdrop they'll be blitted onto, so blits are
+            straight copies — or colorkeyed where there's no one backdrop;
+            flat panels, a 16-ring gradient, no rotated text
+
+The profile is picked once at startup — `python main.py --quality low`,
+or "quality" in settings.json — before anything is drawn.  Changing it
+later empties the surface cache so nothing rendered under the old one
+is reused.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import pygame
+
+from engine.paths import get_resource_path
+from render.surface_cache import get_surface_cache
+
+log = logging.getLogger(__name__)
+
+SETTINGS_FILE = "settings.json"
+COLORKEY = (255, 0, 255)    # transparent colour of cached surfaces when the profile has no per-pixel alpha
+
+
+@dataclass(frozen=True)
+class Quality:
+    name: str
+    alpha: bool             # per-pixel alpha on cached surfaces; opaque over their backdrop if not
+    gradient_steps: int     # rings in the field's grass gradient
+    panel_gradient: bool    # gradient panel backgrounds; flat if not
+    rotate_text: bool       # tactical overlay's arc lettering follows the boundary
+    smoothscale: bool       # filtered image scaling when loading icons and the bracket
+
+
+PROFILES: Dict[str, Quality] = {
+    "high":   Quality("high",   alpha=True,  gradient_steps=160, panel_gradient=True,  rotate_text=True,  smoothscale=True),
+    "medium": Quality("medium", alpha=True,  gradient_steps=64,  panel_gradient=True,  rotate_text=True,  smoothscale=False),
+    "low":    Quality("low",    alpha=False, gradient_steps=16,  panel_gradient=False, rotate_text=False, smoothscale=False),
+}
+
+_quality = PROFILES["high"]
+
+
+def get_quality() -> Quality:
+    return _quality
+
+
+def set_quality(name: str):
+    global _quality
+    if name not in PROFILES:
+        raise ValueError(f"Unknown quality profile {name!r}; pick one of {', '.join(PROFILES)}")
+    if PROFILES[name] != _quality:
+        _quality = PROFILES[name]
+        get_surface_cache().clear()
+
+
+def read_settings() -> dict:
+    """settings.json as a dict — empty if there isn't one, or it can't be read."""
+    path = get_resource_path(SETTINGS_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            settings = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        log.warning("Ignoring %s: %s", path, exc)
+        return {}
+    if not isinstance(settings, dict):
+        log.warning("Ignoring %s: not a JSON object", path)
+        return {}
+    return settings
+
+
+def quality_from_settings(default: str = "high") -> str:
+    """The "quality" named in settings.json, if there is one and it's a known profile."""
+    name = read_settings().get("quality", default)
+    if name not in PROFILES:
+        log.warning("Unknown quality %r in %s; using %s", name, SETTINGS_FILE, default)
+        return default
+    return name
+
+
+# -- Helpers ------------------------------------------------------------------
+
+def cache_surface(size: Tuple[int, int], backdrop=None) -> pygame.Surface:
+    """
+    A surface to render something into and keep: per-pixel alpha, or
+    under a profile without it, opaque and pre-filled with `backdrop` —
+    the colour it'll be blitted over.  With no `backdrop` (it goes over
+    the field, say) it's colorkeyed instead: whatever isn't drawn on is
+    skipped by the blit.  Don't antialias onto the keyed colour.
+    """
+    if _quality.alpha:
+        return pygame.Surface(size, pygame.SRCALPHA)
+    surf = pygame.Surface(size)
+    if backdrop is None:
+        surf.fill(COLORKEY)
+        surf.set_colorkey(COLORKEY)
+    else:
+        surf.fill(backdrop)
+    return surf
+
+
+def scale_image(img: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+    if _quality.smoothscale:
+        return pygame.transform.smoothscale(img, size)
+    return pygame.transform.scale(img, size)
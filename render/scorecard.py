@@ -1,20 +1,25 @@
 import pygame
 
 from data.team_registry import TEAM_COLORS
+from engine.players import get_registry
+from render.surface_cache import get_surface_cache
 from data.theme import (
     BG_COLOR, HEADER_BG as HEADER_BAR, TEXT_GOLD as TAB_ACTIVE,
-    BORDER_COLOR, TEXT_WHITE, TEXT_GOLD, TEXT_BLACK, ROW_A, ROW_B,
+    BORDER_COLOR, TEXT_WHITE, TEXT_GOLD, TEXT_BLACK, ROW_A, ROW_B, LABEL_COLOR,
 )
 
 TAB_INACTIVE = (60, 70, 90)
+FOW_H = 74
+INSET = 12      # the cached card sits inside the rounded border
 
 
 class ScorecardView:
     """
-    Batting / bowling scorecard — tabbed by innings.
-
-    Stats are computed live from the raw delivery data so we don't
-    need a separate aggregation step.
+    Batting / bowling scorecard — tabbed by innings, and in step with
+    the replay: the figures are looked up for the ball on screen from
+    engine.scorecard's running totals, never rescanned per frame.  The
+    card itself is rendered into a surface and only redrawn when the
+    state bus reports a change, or the tab, mode or size changes.
     """
 
     def __init__(self):
@@ -24,6 +29,12 @@ class ScorecardView:
         self.font_med = pygame.font.SysFont("Arial", 18, bold=True)
         self.font_res = pygame.font.SysFont("Arial", 24, bold=True)
         self.font_pom = pygame.font.SysFont("Arial", 22, bold=True)
+        self.font_fow = pygame.font.SysFont("Arial", 15, bold=True)
+        self._key = None
+
+    def invalidate(self, diff=None):
+        """State bus subscriber: the card on screen no longer matches the replay."""
+        get_surface_cache().discard("scorecard")
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -36,15 +47,43 @@ class ScorecardView:
                     return True
         return False
 
-    def draw(self, screen, rect, match_data, mode, font_title, font_body):
+    def draw(self, screen, rect, match_data, mode, font_title, font_body, card, index, partnerships=None):
+        """
+        The cards as they stood `index` balls into the replay, read from
+        `card` (engine.scorecard.LiveScorecard); the result only shows
+        once the last ball is in.  `partnerships`
+        (engine.partnerships.PartnershipTracker) adds a fall-of-wickets
+        strip under the batting card — wickets so far, plus the stand in
+        progress.
+        """
         pygame.draw.rect(screen, BG_COLOR, rect, border_radius=12)
         pygame.draw.rect(screen, BORDER_COLOR, rect, 1, border_radius=12)
 
+        inner = rect.inflate(-2 * INSET, -2 * INSET)
+        key = (mode, self.selected_inning, tuple(rect), id(card))
+        if key != self._key:
+            self.invalidate()
+            self._key = key
+        surf = get_surface_cache().get("scorecard", key, lambda: self._build(
+            rect, inner, match_data, mode, card, index, partnerships))
+        screen.blit(surf, inner.topleft)
+
+    def _build(self, rect, inner, match_data, mode, card, index, partnerships):
+        # Opaque, on the card's own background, so it blits cheaply and text blends the same
+        surf = pygame.Surface(inner.size)
+        surf.fill(BG_COLOR)
+        self._render(surf, rect.move(-inner.x, -inner.y), match_data, mode, card, index, partnerships)
+        self.tab_rects = {k: r.move(inner.topleft) for k, r in self.tab_rects.items()}
+        return surf
+
+    def _render(self, screen, rect, match_data, mode, card, index, partnerships):
         if not match_data or "innings" not in match_data:
             return
 
         innings = match_data["innings"]
-        squad   = match_data.get("info", {}).get("players", {})
+        info    = match_data.get("info", {})
+        squad   = info.get("players", {})
+        pids    = get_registry().register_match(info)
 
         if mode == "batting":
             cols = [("BATTER", 260), ("DISMISSAL", 300), ("R", 60), ("B", 60), ("4s", 60), ("6s", 60), ("SR", 80)]
@@ -94,84 +133,79 @@ class ScorecardView:
             ry = sy + 40
             limit = rect.bottom - footer_room
             if mode == "batting":
-                self._bat_rows(screen, inn, team_squad, sx, ry, cols, tw, limit)
+                if partnerships is not None:
+                    limit -= FOW_H + 8
+                    self._fow_strip(screen, partnerships, self.selected_inning + 1, pygame.Rect(sx, limit + 4, tw, FOW_H))
+                self._bat_rows(screen, card, self.selected_inning + 1, index, team_squad, pids, sx, ry, cols, tw, limit)
             else:
-                self._bowl_rows(screen, inn, sx, ry, cols, tw, limit)
+                self._bowl_rows(screen, card.bowling(self.selected_inning + 1, index), sx, ry, cols, tw, limit)
 
-        self._footer(screen, rect, match_data)
+        if index >= card.total:
+            self._footer(screen, rect, match_data)
 
     # -- Batting card ---------------------------------------------------------
 
-    def _bat_rows(self, screen, inn, squad, sx, y, cols, tw, limit):
-        stats = {}
-        for ov in inn.get("overs", []):
-            for ball in ov.get("deliveries", []):
-                bat = ball["batter"]
-                r = ball["runs"]["batter"]
-                if bat not in stats:
-                    stats[bat] = {"r": 0, "b": 0, "4": 0, "6": 0, "out": "not out"}
-                s = stats[bat]
-                s["r"] += r
-                if "wides" not in ball.get("extras", {}):
-                    s["b"] += 1
-                if r == 4: s["4"] += 1
-                if r == 6: s["6"] += 1
-                if "wickets" in ball:
-                    for w in ball["wickets"]:
-                        if w["player_out"] == bat:
-                            s["out"] = w["kind"]
-
-        display = squad if squad else list(stats.keys())
-
-        for i, name in enumerate(display):
+    def _bat_rows(self, screen, card, innings, index, squad, pids, sx, y, cols, tw, limit):
+        lines = card.batting(innings, index)
+        # Then the rest of the XI, keyed by player id so a respelt name can't list anyone twice
+        batted = {line.pid for line in lines}
+        waiting = "Did not bat" if card.innings_over(innings, index) else "Yet to bat"
+        rest = [name for name in squad if pids.get(name) not in batted]
+
+        rows = [(line.name, line.status, line.runs, line.balls, line.fours, line.sixes, line.strike_rate)
+                for line in lines]
+        rows += [(name, waiting, "-", "-", "-", "-", "-") for name in rest]
+
+        for i, vals in enumerate(rows):
             if y + 42 > limit:
                 break
             bg = ROW_A if i % 2 == 0 else ROW_B
             pygame.draw.rect(screen, bg, (sx, y, tw, 42))
-
-            if name in stats:
-                s = stats[name]
-                sr = round(s["r"] / s["b"] * 100, 1) if s["b"] > 0 else 0.0
-                vals = [name, s["out"], s["r"], s["b"], s["4"], s["6"], sr]
-            else:
-                vals = [name, "Did not bat", "-", "-", "-", "-", "-"]
-
             cx = sx
             for j, v in enumerate(vals):
-                col = (255, 255, 255) if j in (0, 2) else TEXT_WHITE
+                col = TEXT_GOLD if j == 1 and v == "batting" else TEXT_WHITE
                 screen.blit(self.font_lg.render(str(v), True, col), (cx + 10, y + 10))
                 cx += cols[j][1]
             y += 44
 
+    # -- Fall of wickets -----------------------------------------------------
+
+    def _fow_strip(self, screen, tracker, innings, rect):
+        pygame.draw.rect(screen, HEADER_BAR, rect, border_radius=6)
+        f = self.font_fow
+        x, y = rect.x + 12, rect.y + 8
+        screen.blit(f.render("FALL OF WICKETS", True, TEXT_GOLD), (x, y))
+
+        stand = tracker.current
+        if stand.innings == innings and stand.batters:
+            who = ", ".join(f"{tracker.cols.names.get(pid, '?')} {s.runs}" for pid, s in stand.batters.items())
+            txt = f.render(f"STAND {stand.runs} ({stand.balls}) · {who}", True, TEXT_WHITE)
+            screen.blit(txt, txt.get_rect(topright=(rect.right - 12, y)))
+
+        # Wickets flow left to right, wrapping onto a second line if need be
+        y += 24
+        entries = [f"{w.score}-{w.wicket} ({w.name}, {w.overs_str})" for w in tracker.fow_for(innings)]
+        if not entries:
+            screen.blit(f.render("No wickets yet", True, LABEL_COLOR), (x, y))
+        for text in entries:
+            surf = f.render(text, True, TEXT_WHITE)
+            if x + surf.get_width() > rect.right - 12:
+                x, y = rect.x + 12, y + 20
+                if y + 18 > rect.bottom:
+                    break
+            screen.blit(surf, (x, y))
+            x += surf.get_width() + 18
+
     # -- Bowling card ---------------------------------------------------------
 
-    def _bowl_rows(self, screen, inn, sx, y, cols, tw, limit):
-        stats = {}
-        for ov in inn.get("overs", []):
-            for ball in ov.get("deliveries", []):
-                bwl = ball["bowler"]
-                if bwl not in stats:
-                    stats[bwl] = {"b": 0, "r": 0, "w": 0}
-                s = stats[bwl]
-                ex = ball.get("extras", {})
-                if "wides" not in ex and "noballs" not in ex:
-                    s["b"] += 1
-                if "legbyes" not in ex and "byes" not in ex:
-                    s["r"] += ball["runs"]["total"]
-                if "wickets" in ball:
-                    for w in ball["wickets"]:
-                        if w["kind"] not in ["run out"]:
-                            s["w"] += 1
-
-        for i, (name, s) in enumerate(stats.items()):
+    def _bowl_rows(self, screen, lines, sx, y, cols, tw, limit):
+        for i, line in enumerate(lines):
             if y + 42 > limit:
                 break
-            overs = f"{s['b'] // 6}.{s['b'] % 6}"
-            econ = round(s["r"] / (s["b"] / 6), 2) if s["b"] > 0 else 0.0
             bg = ROW_A if i % 2 == 0 else ROW_B
             pygame.draw.rect(screen, bg, (sx, y, tw, 42))
 
-            vals = [name, overs, "0", s["r"], s["w"], econ]
+            vals = [line.name, line.overs_str, line.maidens, line.runs, line.wickets, line.economy]
             cx = sx
             for j, v in enumerate(vals):
                 screen.blit(self.font_lg.render(str(v), True, TEXT_WHITE), (cx + 10, y + 10))
@@ -0,0 +1,141 @@
+"""
+One memory budget for every rendered surface kept between frames.
+
+Views used to hold their own caches — a full-window field texture, a
+playoff bracket per season, panel backgrounds, the match table's text
+layer — each with its own idea of when to let go, and a long session
+across seasons and window sizes only ever grew.  SurfaceCache holds them
+all under a byte budget, evicting whatever was least recently used once
+the total goes over.
+
+Entries are keyed by (cache name, key).  A cache name is just a label —
+"field", "playoffs" — that groups entries for discard() and the
+per-cache statistics; a view asks with get(name, key, build) and gets
+the surface back, built on a miss.  Anything evicted is simply built
+again the next time it's asked for.
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional
+
+import pygame
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BUDGET = 96 * 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    return surf.get_pitch() * surf.get_height()
+
+
+class SurfaceCache:
+
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        self.budget = budget
+        self.total = 0
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()   # (name, key) → (surface, bytes)
+        self._stats: Dict[str, CacheStats] = {}
+
+    def set_budget(self, budget: int):
+        self.budget = budget
+        self._evict()
+
+    # -- Lookups --------------------------------------------------------------
+
+    def get(self, name: str, key: Hashable, build: Callable[[], pygame.Surface] = None) -> Optional[pygame.Surface]:
+        """
+        The surface cached under (name, key), now the most recently used.
+        On a miss it's `build()`-ed and stored, or None without `build`
+        (or if build returns None).
+        """
+        stats = self._stats.setdefault(name, CacheStats())
+        entry = self._entries.get((name, key))
+        if entry is not None:
+            self._entries.move_to_end((name, key))
+            stats.hits += 1
+            return entry[0]
+        stats.misses += 1
+        if build is None:
+            return None
+        surf = build()
+        if surf is not None:
+            self.put(name, key, surf)
+        return surf
+
+    def put(self, name: str, key: Hashable, surf: pygame.Surface):
+        self.discard(name, key)
+        size = surface_bytes(surf)
+        self._entries[(name, key)] = (surf, size)
+        stats = self._stats.setdefault(name, CacheStats())
+        stats.entries += 1
+        stats.bytes += size
+        self.total += size
+        self._evict()
+
+    def discard(self, name: str, key: Hashable = None):
+        """Drop (name, key), or every entry under `name` if key is None."""
+        if key is not None:
+            doomed = [(name, key)] if (name, key) in self._entries else []
+        else:
+            doomed = [k for k in self._entries if k[0] == name]
+        for k in doomed:
+            self._drop(k)
+
+    def clear(self):
+        for k in list(self._entries):
+            self._drop(k)
+
+    # -- Eviction -------------------------------------------------------------
+
+    def _drop(self, k):
+        _, size = self._entries.pop(k)
+        stats = self._stats[k[0]]
+        stats.entries -= 1
+        stats.bytes -= size
+        self.total -= size
+
+    def _evict(self):
+        """Least recently used first, down to the budget — but never the entry just added."""
+        while self.total > self.budget and len(self._entries) > 1:
+            k = next(iter(self._entries))
+            self._drop(k)
+            self._stats[k[0]].evictions += 1
+        if self.total > self.budget:
+            log.debug("Surface cache over budget with one entry: %s bytes", self.total)
+
+    # -- Reporting ------------------------------------------------------------
+
+    def stats(self) -> Dict[str, CacheStats]:
+        return dict(self._stats)
+
+    def dump(self) -> str:
+        """Per-cache table of entries, memory, hits, misses and evictions, most memory first."""
+        mb = 1024 * 1024
+        lines = [f"surface cache: {self.total / mb:.1f} / {self.budget / mb:.1f} MB in {len(self._entries)} entries",
+                 f"  {'cache':<12} {'entries':>7} {'MB':>7} {'hits':>8} {'misses':>7} {'evicted':>7}"]
+        for name, s in sorted(self._stats.items(), key=lambda kv: -kv[1].bytes):
+            lines.append(f"  {name:<12} {s.entries:>7} {s.bytes / mb:>7.1f} {s.hits:>8} {s.misses:>7} {s.evictions:>7}")
+        return "\n".join(lines)
+
+
+_cache: Optional[SurfaceCache] = None
+
+
+def get_surface_cache() -> SurfaceCache:
+    """Process-wide surface cache, created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = SurfaceCache()
+    return _cache
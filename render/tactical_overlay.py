@@ -3,6 +3,9 @@ import math
 
 from data.field_tactics import FIELD_TACTICS
 from data.team_colors import TEAM_COLORS
+from engine.players import get_registry
+from render.quality import cache_surface, get_quality
+from render.surface_cache import get_surface_cache
 
 YARD_M = 0.9144   # yards → metres conversion factor
 
@@ -34,10 +37,14 @@ def _pick_tactic(over, powerplay):
     return "death_overs" if over >= 16 else "ring_defense"
 
 
-def _fielding_xi(match, team, bowler):
+def _fielding_xi(match, team, bowler, bowler_id=None):
     """Return (wicket-keeper, outfielders) minus the bowler."""
     squad = match["info"]["players"].get(team, []).copy()
-    if bowler in squad:
+    if bowler_id is not None:
+        # Match on id, not spelling — the squad list and deliveries can disagree
+        pids = get_registry().register_match(match["info"])
+        squad = [p for p in squad if pids.get(p) != bowler_id]
+    elif bowler in squad:
         squad.remove(bowler)
 
     # Crude WK detection by name convention — good enough for visualisation
@@ -50,18 +57,59 @@ def _fielding_xi(match, team, bowler):
     return wk, squad
 
 
-def draw_tactical_overlay(screen, event, stadium, match, game):
+# MatchState fields the overlay is drawn from (engine.reducer.StateDiff names).  The
+# tactic also follows the over and powerplay, which no field carries — a seek can
+# land in another over with the same bowler — so subscribe with boundaries=True too
+OVERLAY_FIELDS = {
+    "current_batter_id", "current_non_striker_id", "current_bowler_id", "batting_team", "bowling_team",
+}
+
+
+class TacticalOverlay:
+    """
+    Renders the overlay once into an off-screen surface, cropped to what
+    was drawn, then blits that every frame.  It's re-rendered only when
+    invalidate() hears from the state bus that the batters, bowler or
+    sides changed or an over went by, or when the window size or match
+    changes.
+    """
+
+    def __init__(self):
+        self._offset = (0, 0)
+        self._key = None
+
+    def invalidate(self, diff=None):
+        get_surface_cache().discard("overlay")
+
+    def draw(self, screen, event, stadium, match, game):
+        if not event or not stadium or not match:
+            return
+        key = (screen.get_size(), id(stadium), id(match))
+        if key != self._key:
+            self.invalidate()
+            self._key = key
+        surf = get_surface_cache().get("overlay", key, lambda: self._build(screen.get_size(), event, stadium, match, game))
+        screen.blit(surf, self._offset)
+
+    def _build(self, size, event, stadium, match, game):
+        # Colorkeyed under low; text is drawn without antialiasing to match
+        full = cache_surface(size)
+        _render(full, event, stadium, match, game)
+        box = full.get_bounding_rect()
+        self._offset = box.topleft
+        return full.subsurface(box).copy()
+
+
+def _render(screen, event, stadium, match, game):
     """
     Place fielder + batter dots on the pitch using the tactic templates
     from `field_tactics.py`, assigning real player names from the squad.
     """
-    if not event or not stadium or not match:
-        return
-
     striker      = _striker(event)
     non_striker  = _attr(event, "non_striker")
     bowler       = _attr(event, "bowler")
-    field_team   = _attr(event, "fielding_team")
+    bowler_id    = _attr(event, "bowler_id")
+    field_team   = _attr(event, "fielding_team") or _attr(event, "bowling_team")
     bat_team     = _attr(event, "batting_team")
     over         = int(_attr(event, "over") or 0)
 
@@ -76,19 +124,18 @@ def draw_tactical_overlay(screen, event, stadium, match, game):
     fc = TEAM_COLORS.get(field_team, (220, 220, 220))
     bc = TEAM_COLORS.get(bat_team, (240, 240, 240))
     fn = _font("label")
+    q = get_quality()
 
     def label_at(pos, name, prefix=""):
         """Small translucent name tag next to a dot."""
-        txt = fn.render(f"{prefix}{name.split()[-1]}", True, bc)
+        txt = fn.render(f"{prefix}{name.split()[-1]}", q.alpha, bc)
         pad = 4
         bg_r = txt.get_rect(topleft=(pos[0] + 12, pos[1] - 8)).inflate(pad * 2, pad * 2)
-        overlay = pygame.Surface((bg_r.width, bg_r.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, bg_r.topleft)
+        screen.fill((0, 0, 0), bg_r)
         screen.blit(txt, (bg_r.x + pad, bg_r.y + pad))
 
     # Assign real names to tactical positions
-    wk, outfield = _fielding_xi(match, field_team, bowler)
+    wk, outfield = _fielding_xi(match, field_team, bowler, bowler_id)
     role_map = {"Bowler": bowler, "WK": wk}
     pool = iter(outfield)
 
@@ -116,7 +163,7 @@ def draw_tactical_overlay(screen, event, stadium, match, game):
             surname = f"B: {surname}"
         elif role.lower() == "wk":
             surname = f"WK: {surname}"
-        screen.blit(fn.render(surname, True, fc), (x + 8, y - 8))
+        screen.blit(fn.render(surname, q.alpha, fc), (x + 8, y - 8))
 
     # Batsmen at the crease
     ns_pos = (cx + 60, cy - 28)
@@ -143,6 +190,18 @@ def draw_tactical_overlay(screen, event, stadium, match, game):
             a = start + i * step
             tx = cx - radius * math.cos(a)
             ty = cy + radius * math.sin(a)
-            surf = af.render(ch, True, fc)
-            rot = pygame.transform.rotate(surf, math.degrees(a) - 90)
+            surf = af.render(ch, q.alpha, fc)
+            rot = pygame.transform.rotate(surf, math.degrees(a) - 90) if q.rotate_text else surf
             screen.blit(rot, rot.get_rect(center=(tx, ty)))
+
+
+# Module-level singleton — keeps the rendered overlay between frames
+_overlay = TacticalOverlay()
+
+
+def draw_tactical_overlay(screen, event, stadium, match, game):
+    _overlay.draw(screen, event, stadium, match, game)
+
+
+def invalidate_tactical_overlay(diff=None):
+    _overlay.invalidate(diff)
@@ -1,5 +1,6 @@
 import pygame
 
+from engine.players import get_registry
 from data.team_registry import TEAM_COLORS
 from data.theme import BG_COLOR, HEADER_BG as HEADER_COLOR, TEXT_WHITE, TEXT_GOLD, BORDER_COLOR
 
@@ -19,8 +20,23 @@ def _font(key: str) -> pygame.font.Font:
     return _fonts[key]
 
 
-def draw_team_view(screen, rect, match_data, font_title, font_body):
-    """Side-by-side squad lists plus officials block at the bottom."""
+def _career_line(c) -> str:
+    if not c.matches:
+        return "IPL debut"
+    parts = [f"{c.matches} m"]
+    if c.balls:
+        parts.append(f"{c.runs} runs")
+    if c.balls_bowled:
+        parts.append(f"{c.wickets} wkts")
+    return " · ".join(parts)
+
+
+def draw_team_view(screen, rect, match_data, font_title, font_body, careers=None):
+    """
+    Side-by-side squad lists plus officials block at the bottom.  With
+    `careers` (player id → engine.careers.CareerStats going into this
+    match) each row also gets a one-line career summary.
+    """
     lg, pl, sm = _font("lg"), _font("pl"), _font("sm")
 
     pygame.draw.rect(screen, BG_COLOR, rect, border_radius=12)
@@ -59,6 +75,13 @@ def draw_team_view(screen, rect, match_data, font_title, font_body):
     y = sy + 50
     row_h = 42
     l1, l2 = players.get(teams[0], []), players.get(teams[1], [])
+    pids = get_registry().register_match(info) if careers else {}
+
+    def player(x, name):
+        screen.blit(pl.render(name, True, TEXT_WHITE), (x + 20, y + 10))
+        if name in pids:
+            cs = sm.render(_career_line(careers(pids[name])), True, (150, 165, 195))
+            screen.blit(cs, cs.get_rect(midright=(x + col_w - 16, y + row_h // 2)))
 
     for i in range(max(len(l1), len(l2))):
         if y + row_h > sy + playable_h:
@@ -67,11 +90,11 @@ def draw_team_view(screen, rect, match_data, font_title, font_body):
 
         pygame.draw.rect(screen, bg, (x1, y, col_w, row_h))
         if i < len(l1):
-            screen.blit(pl.render(l1[i], True, TEXT_WHITE), (x1 + 20, y + 10))
+            player(x1, l1[i])
 
         pygame.draw.rect(screen, bg, (x2, y, col_w, row_h))
         if i < len(l2):
-            screen.blit(pl.render(l2[i], True, TEXT_WHITE), (x2 + 20, y + 10))
+            player(x2, l2[i])
         y += row_h
 
     # Officials block at the bottom
@@ -0,0 +1,113 @@
+"""
+Win-probability worm for the chase, drawn as a small overlay card.
+
+The line is the chasing side's chance after each ball bowled so far
+(engine.winprob.Worm); above the midline is their half of the card, below
+is the defenders'.  Balls still to come are left blank, so the worm grows
+as the replay plays.
+
+The card is rendered once per ball into the surface cache and blitted
+every frame in between; the state bus tells it when a ball has moved.
+Under a profile without per-pixel alpha the card is opaque and its
+translucent fills are mixed over the card colour up front.
+"""
+
+import pygame
+
+from data.team_registry import TEAM_COLORS, abbreviate_team
+from data.theme import BG_COLOR, BORDER_COLOR, DIVIDER_COLOR, TEXT_WHITE, LABEL_COLOR
+from render.quality import cache_surface, get_quality
+from render.surface_cache import get_surface_cache
+
+CARD_W, CARD_H = 360, 130
+PAD = 10
+
+_fonts: dict[str, pygame.font.Font] = {}
+
+
+def _font(key: str) -> pygame.font.Font:
+    if key not in _fonts:
+        _fonts.update({
+            "b": pygame.font.SysFont("Arial", 14, bold=True),
+            "s": pygame.font.SysFont("Arial", 11),
+        })
+    return _fonts[key]
+
+
+def _tone(color, alpha: int):
+    """`color` at `alpha` over the card: RGBA to blend, or pre-mixed when the profile can't."""
+    if get_quality().alpha:
+        return (*color, alpha)
+    t = alpha / 255
+    return tuple(round(bg + (c - bg) * t) for c, bg in zip(color, BG_COLOR))
+
+
+class WinWormCard:
+
+    def __init__(self):
+        self._key = None
+
+    def invalidate(self, diff=None):
+        get_surface_cache().discard("win_worm")
+
+    def draw(self, screen, anchor: pygame.Rect, worm, timeline_index: int):
+        """Card in the bottom-left of `anchor`; nothing until the chase starts."""
+        if worm is None:
+            return
+        probs = worm.upto(timeline_index)
+        if not len(probs):
+            return
+        key = (id(worm), len(probs))
+        if key != self._key:
+            self.invalidate()
+            self._key = key
+        surf = get_surface_cache().get("win_worm", key, lambda: _render(worm, probs))
+        screen.blit(surf, (anchor.x + 16, anchor.bottom - CARD_H - 16))
+
+
+def _render(worm, probs) -> pygame.Surface:
+    surf = cache_surface((CARD_W, CARD_H))     # colorkeyed corners under low
+    pygame.draw.rect(surf, _tone(BG_COLOR, 215), surf.get_rect(), border_radius=8)
+    pygame.draw.rect(surf, _tone(BORDER_COLOR, 120), surf.get_rect(), 1, border_radius=8)
+
+    chase_col = TEAM_COLORS.get(worm.chasing, (40, 90, 200))
+    defend_col = TEAM_COLORS.get(worm.defending, (200, 100, 50))
+    p = float(probs[-1])
+
+    b, s = _font("b"), _font("s")
+    title = b.render(f"{abbreviate_team(worm.chasing)} {p:.0%}", True, TEXT_WHITE)
+    surf.blit(title, (PAD, 6))
+    other = b.render(f"{abbreviate_team(worm.defending)} {1 - p:.0%}", True, LABEL_COLOR)
+    surf.blit(other, other.get_rect(topright=(CARD_W - PAD, 6)))
+    tag = s.render(f"WIN PROBABILITY · TARGET {worm.target}", True, LABEL_COLOR)
+    surf.blit(tag, tag.get_rect(midtop=(CARD_W // 2, 8)))
+
+    plot = pygame.Rect(PAD, 28, CARD_W - PAD * 2, CARD_H - 28 - PAD)
+    mid = plot.centery
+    pygame.draw.line(surf, DIVIDER_COLOR, (plot.x, mid), (plot.right, mid), 1)
+
+    # x spans the full quota, so the worm's length shows how far in we are
+    span = max(1, worm.quota, len(worm.probs))
+    values = [worm.start] + probs.tolist()
+    points = [(plot.x + plot.w * i / span, plot.bottom - plot.h * v) for i, v in enumerate(values)]
+
+    if len(points) > 1:
+        # Shade between the line and the midline in whoever's ahead's colours
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            ahead = chase_col if (y0 + y1) / 2 < mid else defend_col
+            pygame.draw.polygon(surf, _tone(ahead, 90), [(x0, mid), (x0, y0), (x1, y1), (x1, mid)])
+        pygame.draw.lines(surf, TEXT_WHITE, False, points, 2)
+    pygame.draw.circle(surf, chase_col if p >= 0.5 else defend_col, points[-1], 4)
+    return surf
+
+
+# Module-level singleton — keeps the rendered card between balls
+_card = WinWormCard()
+
+
+def draw_win_worm(screen, anchor: pygame.Rect, worm, timeline_index: int):
+    _card.draw(screen, anchor, worm, timeline_index)
+
+
+def invalidate_win_worm(diff=None):
+    _card.invalidate(diff)
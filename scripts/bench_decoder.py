@@ -0,0 +1,76 @@
+"""
+Benchmark the delivery decoder on a full season held in memory at once.
+
+Each match is loaded, decoded and its raw JSON dropped, the way the app
+and any corpus-wide pass would hold events.  Reports decode time (JSON
+load excluded), retained memory for the events, and how many distinct
+string objects back the name fields — with interning that should be
+roughly the number of players, not the number of deliveries.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+from data_io.season_index import IPL_JSON_DIR, CACHE_FILENAME, list_seasons
+from engine.parser import parse_match_events
+
+
+def _rss_mb():
+    """Current resident set size, or None where we can't read it cheaply."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def bench(season: str):
+    files = sorted(p for p in (IPL_JSON_DIR / season).glob("*.json") if p.name != CACHE_FILENAME)
+    if not files:
+        print(f"No match files for season {season}")
+        return
+
+    gc.collect()
+    rss_before = _rss_mb()
+    tracemalloc.start()
+
+    held, decode_s = [], 0.0
+    for path in files:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        t0 = time.perf_counter()
+        held.append(parse_match_events(raw))
+        decode_s += time.perf_counter() - t0
+        del raw
+
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = _rss_mb()
+
+    events = [e for match in held for e in match]
+    names = {id(s) for e in events for s in (e.batter, e.bowler, e.non_striker, e.batting_team, e.bowling_team)}
+
+    print(f"Season {season}: {len(files)} matches, {len(events)} deliveries")
+    print(f"  decode time     : {decode_s * 1000:.1f} ms ({decode_s * 1e6 / len(events):.2f} µs/delivery, tracemalloc on)")
+    print(f"  retained events : {retained / 1e6:.2f} MB ({retained / len(events):.0f} B/delivery)")
+    print(f"  name strings    : {len(names)} distinct objects across {len(events) * 5} references")
+    if rss_before is not None and rss_after is not None:
+        print(f"  RSS             : {rss_before:.1f} MB → {rss_after:.1f} MB")
+
+
+if __name__ == "__main__":
+    seasons = list_seasons()
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("season", nargs="?", default=seasons[-1] if seasons else "2025")
+    bench(ap.parse_args().season)
@@ -0,0 +1,95 @@
+"""
+Benchmark frame times under each quality profile.
+
+Runs the real app loop off-screen — one match, replayed at speed — and
+times whole frames (tick plus draw plus present) per view, playing and
+paused, once per profile.  Nothing is shown: SDL's dummy video driver
+stands in for a window unless --window is given.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+VIEWS = ("view_field", "view_batting", "view_charts")
+
+
+def _time_frames(app, frames: int) -> float:
+    """Mean ms per frame over `frames` frames."""
+    t = time.perf_counter()
+    for _ in range(frames):
+        app._tick(1 / 60)
+        app._draw()
+    return (time.perf_counter() - t) / frames * 1000
+
+
+def _run(profile: str, match: int, size, frames: int):
+    """{view: ms/frame} under `profile`, and the app that produced them."""
+    import pygame
+    import app as ipl_app
+    from render.quality import set_quality
+
+    set_quality(profile)
+    app = ipl_app.IPLVizApp()
+    pygame.event.post(pygame.event.Event(pygame.VIDEORESIZE, w=size[0], h=size[1], size=size))
+    app._events()
+    app.sel_idx = match
+    if not app._load_match():
+        sys.exit(f"Couldn't load match {match} of the current season")
+    app.phase = ipl_app.Phase.MATCH
+    app.timeline.set_speed(10)
+
+    row = {}
+    for view in VIEWS:
+        app.view = view
+        app.timeline.playing = True
+        _time_frames(app, 10)           # warm the caches for this view
+        row[view] = _time_frames(app, frames)
+        app.timeline.playing = False
+        _time_frames(app, 2)
+        row[view + " paused"] = _time_frames(app, frames)
+    return row, app
+
+
+def bench(profiles, match: int, size, frames: int):
+    # One untimed pass first: the season's background loading would otherwise land on whichever profile runs first
+    _run(profiles[0], match, size, 10)
+    results = {}
+    for name in profiles:
+        results[name], app = _run(name, match, size, frames)
+
+    m, (w, h) = app.matches[match], app.display.size
+    print(f"{m['teams']}, {m['date']} at {w}×{h}, {frames} frames each (ms/frame)")
+    print(f"  {'view':<22}" + "".join(f"{name:>9}" for name in results))
+    for view in next(iter(results.values())):
+        print(f"  {view:<22}" + "".join(f"{row[view]:>9.2f}" for row in results.values()))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--profiles", nargs="+", default=None, help="profiles to run (default: all)")
+    ap.add_argument("--match", type=int, default=3, help="index into the season's match list")
+    ap.add_argument("--size", default="1920x1080", help="window size as WxH")
+    ap.add_argument("--frames", type=int, default=120)
+    ap.add_argument("--window", action="store_true", help="open a real window instead of rendering off-screen")
+    args = ap.parse_args()
+
+    if not args.window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    logging.disable(logging.WARNING)
+
+    from render.quality import PROFILES
+    profiles = list(dict.fromkeys(args.profiles or PROFILES))
+    unknown = [p for p in profiles if p not in PROFILES]
+    if unknown:
+        ap.error(f"unknown profile(s): {', '.join(unknown)}; pick from {', '.join(PROFILES)}")
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    bench(profiles, args.match, size, args.frames)
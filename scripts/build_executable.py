@@ -22,9 +22,31 @@ def build():
     # OS-specific separator for --add-data
     sep = ";" if os.name == "nt" else ":"
     
-    # We include 'data' and 'images' folders
+    # The offline weather pack lives under data/ and ships with it.  Kiosks
+    # have no network, so a build without it is almost certainly a mistake.
+    weather_pack = root / "data" / "weather_pack.json.gz"
+    if weather_pack.exists():
+        print(f"Bundling weather pack: {weather_pack} ({weather_pack.stat().st_size / 1024:.1f} KB)")
+    else:
+        print("WARNING: data/weather_pack.json.gz not found — run scripts/build_weather_pack.py first.")
+        print("         The bundled app will show 'Unavailable' weather when offline.")
+
+    # Matches ship as the packed archive, not ~1200 loose JSON files.
+    # Rebuild it first so the bundle never carries a stale one.
+    print("Packing match archive...")
+    subprocess.run([sys.executable, str(script_dir / "build_match_archive.py"), "--no-report"],
+                   cwd=str(root), check=True)
+
+    # We include 'data' (minus the loose match files and this machine's
+    # parsed-match / map-reduce caches, which rebuild on first use) and 'images'
     # Format is: "source_path;dest_path" (on Windows)
-    data_path = f"{root / 'data'}{sep}data"
+    skip = {"ipl_json", "match_cache", "mapreduce_cache", "__pycache__"}
+    data_args = []
+    for item in sorted((root / "data").iterdir()):
+        if item.name in skip:
+            continue
+        dest = "data" if item.is_file() else f"data/{item.name}"
+        data_args += ["--add-data", f"{item}{sep}{dest}"]
     images_path = f"{root / 'images'}{sep}images"
 
     cmd = [
@@ -33,7 +55,7 @@ def build():
         "--onedir",
         "--clean",
         "--noconfirm",
-        "--add-data", data_path,
+        *data_args,
         "--add-data", images_path,
         "--name", name,
         str(main_script)
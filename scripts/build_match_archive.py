@@ -0,0 +1,101 @@
+"""
+Pack data/ipl_json into the random-access match archive (data/matches.pack).
+
+Reads every season through the loose-file indexer, stores each match
+compressed behind a central offset table, then reports the size against
+the loose tree and times a cold open both ways — each in a fresh
+interpreter, so module imports and file handles aren't shared.  (The OS
+page cache is still warm; a true first launch off disk favours the
+archive more than these numbers show.)
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+from data_io.archive import ARCHIVE_FILE, IPL_JSON_DIR, MatchArchive, disable_archive, write_archive
+
+# Index fields that are derived at runtime rather than shipped
+_RUNTIME_KEYS = ("file", "stadium_id")
+
+
+def build(out: Path, codec: str):
+    disable_archive()       # always pack from the loose files
+    from data_io.season_index import list_seasons, list_matches_for_season
+
+    seasons, sources = {}, []
+    for season in list_seasons():
+        metas = list_matches_for_season(season)
+        seasons[season] = [{k: v for k, v in m.items() if k not in _RUNTIME_KEYS} for m in metas]
+        sources += [(m["id"], IPL_JSON_DIR / season / m["filename"]) for m in metas]
+
+    t0 = time.perf_counter()
+    count = write_archive(out, seasons, sources, codec)
+    print(f"Packed {count} matches from {len(seasons)} seasons in {time.perf_counter() - t0:.1f} s ({codec})")
+
+
+def report(out: Path, samples: int):
+    loose = sum(p.stat().st_size for p in IPL_JSON_DIR.rglob("*.json"))
+    loose_files = sum(1 for _ in IPL_JSON_DIR.rglob("*.json"))
+    packed = out.stat().st_size
+    print(f"  loose tree : {loose / 1e6:7.1f} MB in {loose_files} files (incl. .index.json)")
+    print(f"  archive    : {packed / 1e6:7.1f} MB in 1 file ({packed / loose:.1%})")
+
+    ids = random.Random(0).sample(sorted(MatchArchive(out)._entries), samples)
+    for mode in ("loose", "archive"):
+        res = subprocess.run(
+            [sys.executable, __file__, "--time-open", mode, "--out", str(out)],
+            input=json.dumps(ids), capture_output=True, text=True, check=True,
+        )
+        t = json.loads(res.stdout.strip().splitlines()[-1])
+        print(f"  {mode:<8} cold open: index all seasons {t['index_ms']:6.1f} ms, "
+              f"{samples} match loads {t['load_ms']:6.1f} ms ({t['load_ms'] / samples:.2f} ms each)")
+
+
+def time_open(mode: str, out: Path):
+    """Child side of report(): time indexing every season, then loading the given ids."""
+    import data_io.archive as archive
+    ids = json.loads(sys.stdin.read())
+    if mode == "loose":
+        disable_archive()
+    else:
+        archive.ARCHIVE_FILE = out
+
+    from data_io.cricsheet import load_match
+    from data_io.season_index import list_seasons, list_matches_for_season
+
+    t0 = time.perf_counter()
+    for season in list_seasons():
+        list_matches_for_season(season)
+    t1 = time.perf_counter()
+    for match_id in ids:
+        load_match(match_id)
+    t2 = time.perf_counter()
+    print(json.dumps({"index_ms": (t1 - t0) * 1000, "load_ms": (t2 - t1) * 1000}))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--out", type=Path, default=ARCHIVE_FILE, help="archive path (default: %(default)s)")
+    ap.add_argument("--codec", choices=("zlib", "lzma"), default="zlib",
+                    help="entry compression (default: %(default)s)")
+    ap.add_argument("--samples", type=int, default=100, help="matches to load when timing (default: %(default)s)")
+    ap.add_argument("--no-report", action="store_true", help="skip the size / cold-open comparison")
+    ap.add_argument("--time-open", choices=("loose", "archive"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.time_open:
+        time_open(args.time_open, args.out)
+    else:
+        build(args.out, args.codec)
+        if not args.no_report:
+            report(args.out, args.samples)
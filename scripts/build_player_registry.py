@@ -0,0 +1,50 @@
+"""
+Build the player identity registry (data/player_registry.json).
+
+Walks every match oldest-first and registers everyone in each file's
+`info.registry.people`, so ids are dense and stable for the bundled
+corpus and each player keeps the most recent spelling Cricsheet uses.
+
+Re-running starts from the existing file, so players already numbered
+keep their ids and new seasons only append; pass --force to renumber.
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+from data_io.season_index import IPL_JSON_DIR, list_seasons, list_matches_for_season
+from engine.players import REGISTRY_FILE, PlayerRegistry, load_registry, save_registry
+
+
+def build(out: Path, force: bool = False):
+    reg = PlayerRegistry() if force else load_registry(out)
+    before = len(reg)
+
+    matches = [(m["date"], season, m["filename"]) for season in list_seasons()
+               for m in list_matches_for_season(season)]
+    matches.sort()
+
+    for _, season, filename in matches:
+        with open(IPL_JSON_DIR / season / filename, "r", encoding="utf-8") as f:
+            info = json.load(f).get("info", {})
+        for name, pid in reg.register_match(info).items():
+            reg.rename(pid, name)
+
+    save_registry(reg, out)
+    size_kb = out.stat().st_size / 1024
+    print(f"Wrote {out} — {len(reg)} players ({len(reg) - before} new) from {len(matches)} matches, {size_kb:.1f} KB")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--out", type=Path, default=REGISTRY_FILE, help="registry path (default: %(default)s)")
+    ap.add_argument("--force", action="store_true", help="ignore the existing registry and renumber everyone")
+    args = ap.parse_args()
+    build(args.out, args.force)
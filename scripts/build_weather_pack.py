@@ -0,0 +1,80 @@
+"""
+Build the offline weather pack (data/weather_pack.json.gz).
+
+Walks every season in data/ipl_json, resolves each match's venue to
+coordinates, and pulls the hourly series for every (venue, match date)
+from Open-Meteo.  Requests are batched per venue per season, so a full
+rebuild is a couple of hundred calls rather than one per match.
+
+Re-running only fetches keys the existing pack doesn't already have;
+pass --force to start from scratch.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+from data_io.match_context import resolve_stadium
+from data_io.season_index import list_seasons, list_matches_for_season
+from engine.weather import PACK_FILE, fetch_hourly_range, read_pack, weather_key, write_pack
+
+
+def collect_targets():
+    """Map (lat, lon, season) → set of match dates still needing a series."""
+    targets = defaultdict(set)
+    for season in list_seasons():
+        for m in list_matches_for_season(season):
+            stadium = resolve_stadium(m["venue"])
+            if stadium.lat == 0.0 or stadium.lon == 0.0:
+                print(f"  skip {m['filename']}: no coordinates for '{m['venue']}'")
+                continue
+            targets[(stadium.lat, stadium.lon, season)].add(m["date"])
+    return targets
+
+
+def build(out: Path, force: bool = False, pause: float = 0.2):
+    hours = {} if force else read_pack(out)
+    print(f"Existing pack entries: {len(hours)}")
+
+    targets = collect_targets()
+    fetched = failed = 0
+
+    for (lat, lon, season), dates in sorted(targets.items()):
+        missing = sorted(d for d in dates if weather_key(lat, lon, d) not in hours)
+        if not missing:
+            continue
+
+        print(f"  {season} @ {lat:.4f},{lon:.4f}: {len(missing)} date(s)")
+        try:
+            days = fetch_hourly_range(lat, lon, missing[0], missing[-1])
+        except Exception as exc:
+            print(f"    fetch failed: {exc}")
+            days = None
+
+        for d in missing:
+            if days and d in days:
+                hours[weather_key(lat, lon, d)] = days[d]
+                fetched += 1
+            else:
+                failed += 1
+        time.sleep(pause)       # be polite to the free API
+
+    write_pack(out, hours)
+    size_kb = out.stat().st_size / 1024
+    print(f"Wrote {out} — {len(hours)} entries, {size_kb:.1f} KB ({fetched} new, {failed} failed)")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--out", type=Path, default=PACK_FILE, help="pack path (default: %(default)s)")
+    ap.add_argument("--force", action="store_true", help="ignore the existing pack and refetch everything")
+    args = ap.parse_args()
+    sys.exit(0 if build(args.out, args.force) else 1)
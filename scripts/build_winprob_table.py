@@ -0,0 +1,76 @@
+"""
+Build the chase win-probability table (data/winprob_table.npz).
+
+Counts every second-innings ball in the corpus by (balls remaining,
+wickets in hand, runs required) and whether that chase was won, then
+smooths and saves the table (see engine.winprob).  Prints a calibration
+check: predicted vs actual win rate, bucketed.  --holdout SEASON builds
+from the other seasons and checks against that one instead, which is the
+honest version of the same check.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+from data_io.mapreduce import run_corpus
+from data_io.season_index import list_seasons
+from engine.winprob import TABLE_FILE, WinProbTable, chase_rows
+
+CACHE = ("chase_rows", 1)
+
+
+def _collect(acc, item):
+    if item is not None:
+        acc.append(item)
+    return acc
+
+
+def calibration(table: WinProbTable, chases):
+    states = np.concatenate([s for s, _ in chases])
+    won = np.concatenate([np.full(len(s), w) for s, w in chases])
+    live = states[:, 2] > 0
+    pred = table.lookup(states[live, 0], states[live, 1], states[live, 2])
+    won = won[live]
+
+    print(f"{'Predicted':>12} {'Balls':>8} {'Actual':>8}")
+    edges = np.linspace(0, 1, 11)
+    bucket = np.clip(np.digitize(pred, edges) - 1, 0, 9)
+    for i in range(10):
+        sel = bucket == i
+        if sel.any():
+            print(f"{edges[i]:>5.1f}–{edges[i + 1]:<5.1f} {int(sel.sum()):>8} {won[sel].mean():>8.3f}")
+    print(f"Brier score: {np.mean((pred - won) ** 2):.4f} over {len(pred):,} balls "
+          f"(coin flip: {np.mean((0.5 - won) ** 2):.4f})")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--out", type=Path, default=TABLE_FILE, help="table path (default: %(default)s)")
+    ap.add_argument("--holdout", help="leave this season out of the table and check calibration on it")
+    args = ap.parse_args()
+
+    seasons = [s for s in list_seasons() if s != args.holdout]
+    chases, stats = run_corpus(chase_rows, _collect, [], seasons=seasons, cache=CACHE)
+    print(f"{len(chases)} chases — {stats}")
+
+    wins, counts = WinProbTable.empty_counts()
+    for chase in chases:
+        WinProbTable.add_chase((wins, counts), chase)
+    table = WinProbTable.from_counts(wins, counts)
+
+    if args.holdout:
+        held, _ = run_corpus(chase_rows, _collect, [], seasons=[args.holdout], cache=CACHE)
+        print(f"\nHeld-out {args.holdout}: {len(held)} chases")
+        calibration(table, held)
+    else:
+        table.save(args.out)
+        print(f"Wrote {args.out} — {args.out.stat().st_size / 1024:.1f} KB\n")
+        calibration(WinProbTable.load(args.out), chases)
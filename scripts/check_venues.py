@@ -0,0 +1,32 @@
+"""
+Report Cricsheet venue strings that don't resolve to a known stadium.
+
+Anything listed here renders with generic dimensions and no weather, so
+the fix is usually a new alias in data/stadium_lookup.py.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+from data_io.season_index import unresolved_venues
+
+
+def main():
+    missing = unresolved_venues()
+    if not missing:
+        print("All venues in the corpus resolve to a known stadium.")
+        return 0
+
+    print(f"{len(missing)} unresolved venue(s):")
+    for venue, files in sorted(missing.items(), key=lambda kv: -len(kv[1])):
+        print(f"  {venue!r}: {len(files)} match(es), e.g. {files[0]}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Ask the delivery index a question from the command line.
+
+    python scripts/query_deliveries.py --bowler Bumrah --venue Wankhede --overs 16-20 --outcome boundary
+    python scripts/query_deliveries.py --batter "V Kohli" --phase death --by season
+    python scripts/query_deliveries.py --bowling-team "Chennai" --outcome wicket --list 20
+
+Names match exactly if anyone has that name, else by substring (so
+"Sharma" is every Sharma).  Repeat a flag to OR values together.  The
+first run maps the whole corpus; after that the per-match blocks come out
+of the map-reduce cache and building the index takes about a second.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+from data_io.season_stats import delivery_index
+from engine.query import OUTCOMES, PHASES, Query
+
+
+def _overs(text: str):
+    lo, _, hi = text.partition("-")
+    return int(lo), int(hi or lo)
+
+
+def _resolve(index, column, texts):
+    found = []
+    for text in texts or ():
+        hits = index.find_players(text) if column in ("batter", "bowler") else index.find(column, text)
+        if not hits:
+            sys.exit(f"No {column.replace('_', ' ')} matches {text!r}")
+        found.extend(hits)
+    return tuple(found)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--batter", action="append")
+    ap.add_argument("--bowler", action="append")
+    ap.add_argument("--batting-team", action="append")
+    ap.add_argument("--bowling-team", action="append")
+    ap.add_argument("--venue", action="append")
+    ap.add_argument("--season", action="append")
+    ap.add_argument("--innings", type=int, action="append")
+    ap.add_argument("--overs", type=_overs, help="over range, 1-based and inclusive, e.g. 16-20")
+    ap.add_argument("--phase", action="append", choices=sorted(PHASES))
+    ap.add_argument("--outcome", action="append", choices=OUTCOMES)
+    ap.add_argument("--super-overs", action="store_true", help="include super-over deliveries")
+    ap.add_argument("--by", choices=("batter", "bowler", "batting_team", "bowling_team", "venue", "season", "over"),
+                    help="break the summary down by this column")
+    ap.add_argument("--list", type=int, default=0, metavar="N", help="print the first N matching deliveries")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    index = delivery_index()
+    print(f"Index: {len(index):,} deliveries, {len(index.match_ids):,} matches ({time.perf_counter() - t0:.2f} s)")
+
+    query = Query(
+        batters=_resolve(index, "batter", args.batter),
+        bowlers=_resolve(index, "bowler", args.bowler),
+        batting_teams=_resolve(index, "batting_team", args.batting_team),
+        bowling_teams=_resolve(index, "bowling_team", args.bowling_team),
+        venues=_resolve(index, "venue", args.venue),
+        seasons=_resolve(index, "season", args.season),
+        innings=tuple(args.innings or ()),
+        overs=args.overs,
+        phases=tuple(args.phase or ()),
+        outcomes=tuple(args.outcome or ()),
+        super_overs=args.super_overs,
+    )
+    result = index.select(query)
+    print(f"Query: {len(result):,} deliveries in {result.elapsed_ms:.2f} ms")
+    print()
+    print(result.summary())
+
+    if args.by:
+        print()
+        print(f"{args.by:<32} {'Balls':>6} {'Runs':>6} {'Wkts':>5} {'4s':>4} {'6s':>4} {'Econ':>6} {'SR':>6}")
+        for label, s in result.group_by(args.by):
+            print(f"{label[:32]:<32} {s.balls:>6} {s.runs:>6} {s.wickets:>5} {s.fours:>4} {s.sixes:>4} "
+                  f"{s.economy:>6.2f} {s.strike_rate:>6.1f}")
+
+    if args.list:
+        print()
+        for row in result.rows(args.list):
+            wicket = f"  W ({row['wicket']})" if row["wicket"] else ""
+            print(f"{row['date']}  {row['match_id']:<14} inn {row['innings']}  {row['ball']:>5}  "
+                  f"{row['bowler']} to {row['batter']}: {row['runs']}{wicket}")
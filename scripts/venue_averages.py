@@ -0,0 +1,61 @@
+"""
+Average first-innings total per stadium, across the whole corpus.
+
+Mostly a worked example of data_io.mapreduce: the map step pulls one
+number out of each match, the reduce step groups them by stadium.  Run it
+twice to see the per-match result cache at work; --no-cache to time a
+full map.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)      # resource paths resolve relative to the project root
+
+from data_io.archive import ARCHIVE_FILE
+from data_io.mapreduce import ArchiveSource, run_corpus
+from data_io.match_context import stadium_id_for
+
+
+def first_innings(m):
+    """(stadium, first-innings total) — None for matches with no first innings."""
+    cols = m.columns
+    first = cols.innings == 1
+    if not first.any():
+        return None
+    return stadium_id_for(m.info.get("venue", "")) or m.info.get("venue"), int(cols.runs_total[first].sum())
+
+
+def group(acc, item):
+    if item is not None:
+        stadium, runs = item
+        acc.setdefault(stadium, []).append(runs)
+    return acc
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--seasons", nargs="*", help="limit to these seasons (default: all)")
+    ap.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    ap.add_argument("--archive", action="store_true", help=f"read {ARCHIVE_FILE} instead of the app's corpus")
+    ap.add_argument("--no-cache", action="store_true", help="map every match, ignoring cached results")
+    args = ap.parse_args()
+
+    by_stadium, stats = run_corpus(
+        first_innings, group, {},
+        seasons=args.seasons,
+        source=ArchiveSource(ARCHIVE_FILE) if args.archive else None,
+        cache=None if args.no_cache else ("venue_first_innings", 1),
+        workers=args.workers,
+    )
+
+    rows = sorted(by_stadium.items(), key=lambda kv: -len(kv[1]))
+    print(f"{'Stadium':<52} {'Matches':>7} {'Avg 1st inns':>12}")
+    for stadium, totals in rows:
+        print(f"{stadium[:52]:<52} {len(totals):>7} {sum(totals) / len(totals):>12.1f}")
+    print()
+    print(stats)
@@ -0,0 +1,185 @@
+"""
+The window, and the canvas everything is drawn on.
+
+Normally they're the same surface.  With a render scale below 1, or a cap
+on the render size smaller than the window, the app draws into an
+off-screen canvas instead and Display.present() scales it up to the
+window — so on a 4K wall the fills, gradients and full-window textures
+cost what they would at 1080p.  The canvas keeps the window's aspect
+ratio, so nothing is stretched.
+
+Presenting only re-scales what changed: the canvas is compared with the
+last frame shown in bands of BAND rows, and only the dirty span of each
+run of changed bands is scaled and pushed to the display.  A paused
+replay costs a compare and nothing else.
+
+Mouse positions arrive in window coordinates.  map_event() rewrites them
+for the canvas, and widgets ask mouse_pos() rather than
+pygame.mouse.get_pos(), so hit-testing is the same at any scale.
+
+The scale and the cap come from `--render-scale` / `--render-max` on the
+command line, or "render_scale" / "render_max" in settings.json
+(render_size_from_settings()); the command line wins.
+"""
+
+from typing import List, Optional, Tuple
+
+import logging
+
+import numpy as np
+import pygame
+
+from render.quality import SETTINGS_FILE, read_settings
+
+log = logging.getLogger(__name__)
+
+BAND = 32       # canvas rows compared as one strip
+
+_active: Optional["Display"] = None
+
+
+class Display:
+
+    def __init__(self, size: Tuple[int, int], scale: float = 1.0, max_size: Tuple[int, int] = None,
+                 flags: int = pygame.RESIZABLE, vsync: int = 1):
+        global _active
+        self.scale = scale
+        self.max_size = max_size
+        self.flags, self.vsync = flags, vsync
+        self.resize(size)
+        _active = self
+
+    def resize(self, size: Tuple[int, int]):
+        self.window = pygame.display.set_mode(size, self.flags, vsync=self.vsync)
+        ww, wh = self.window.get_size()
+        k = self.scale
+        if self.max_size:
+            k = min(k, self.max_size[0] / ww, self.max_size[1] / wh)
+        # Even widths keep each canvas row a whole number of 64-bit words for the compare
+        cw, ch = int(ww * k) // 2 * 2, int(wh * k)
+        if k >= 1 or cw >= ww:
+            self.canvas = self.window
+        else:
+            self.canvas = pygame.Surface((cw, ch)).convert(self.window)
+        self._shown = None
+
+    @property
+    def scaled(self) -> bool:
+        return self.canvas is not self.window
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.canvas.get_size()
+
+    # -- Coordinates ----------------------------------------------------------
+
+    def to_canvas(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        if not self.scaled:
+            return pos
+        (cw, ch), (ww, wh) = self.canvas.get_size(), self.window.get_size()
+        return pos[0] * cw // ww, pos[1] * ch // wh
+
+    def map_event(self, ev: pygame.event.Event) -> pygame.event.Event:
+        if self.scaled and hasattr(ev, "pos"):
+            ev.pos = self.to_canvas(ev.pos)
+        return ev
+
+    # -- Presenting -----------------------------------------------------------
+
+    def present(self):
+        if not self.scaled:
+            pygame.display.flip()
+            return
+        dirty = self._dirty()
+        if dirty is None:
+            pygame.transform.scale(self.canvas, self.window.get_size(), self.window)
+            pygame.display.flip()
+            return
+        updated = []
+        for rect in dirty:
+            target = self._to_window(rect)
+            pygame.transform.scale(self.canvas.subsurface(rect), target.size, self.window.subsurface(target))
+            updated.append(target)
+        if updated:
+            pygame.display.update(updated)
+
+    def _to_window(self, rect: pygame.Rect) -> pygame.Rect:
+        (cw, ch), (ww, wh) = self.canvas.get_size(), self.window.get_size()
+        x0, y0 = rect.x * ww // cw, rect.y * wh // ch
+        return pygame.Rect(x0, y0, rect.right * ww // cw - x0, rect.bottom * wh // ch - y0)
+
+    def _dirty(self) -> Optional[List[pygame.Rect]]:
+        """Canvas rects changed since the last present — one per run of changed bands — or None for all of it."""
+        w, h = self.canvas.get_size()
+        if self.canvas.get_bytesize() != 4 or self.canvas.get_pitch() % 8:
+            return None
+        buf = self.canvas.get_buffer()
+        now = np.frombuffer(buf, np.uint64).reshape(h, -1)
+        if self._shown is None or self._shown.shape != now.shape:
+            self._shown = now.copy()
+            return None
+
+        changed = np.logical_or.reduceat(now != self._shown, np.arange(0, h, BAND), axis=0)
+        np.copyto(self._shown, now)
+        del now, buf
+
+        px = self.canvas.get_pitch() // changed.shape[1] // 4     # pixels per 64-bit word
+        # A padded pitch has words past the last pixel: ignore them, and keep spans on the canvas
+        changed = changed[:, :-(-w // px)]
+        rects, run = [], None
+        for band, row in enumerate(changed):
+            cols = np.flatnonzero(row)
+            if len(cols):
+                span = (int(cols[0]) * px, min((int(cols[-1]) + 1) * px, w))
+                run = (run[0], band, min(run[2], span[0]), max(run[3], span[1])) if run else (band, band, *span)
+            elif run:
+                rects.append(run)
+                run = None
+        if run:
+            rects.append(run)
+        return [pygame.Rect(x0, b0 * BAND, x1 - x0, min((b1 + 1) * BAND, h) - b0 * BAND) for b0, b1, x0, x1 in rects]
+
+
+def parse_render_max(value) -> Tuple[int, int]:
+    """A render size cap from "1920x1080" or [1920, 1080]."""
+    parts = value.lower().split("x") if isinstance(value, str) else value
+    try:
+        w, h = (int(p) for p in parts)
+    except (TypeError, ValueError):
+        raise ValueError(f"render size {value!r} isn't WIDTHxHEIGHT") from None
+    if w <= 0 or h <= 0:
+        raise ValueError(f"render size {value!r} must be positive")
+    return w, h
+
+
+def parse_render_scale(value) -> float:
+    try:
+        k = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"render scale {value!r} isn't a number") from None
+    if not 0 < k <= 1:
+        raise ValueError(f"render scale {value!r} must be above 0 and at most 1")
+    return k
+
+
+def render_size_from_settings(scale: float = 1.0,
+                              max_size: Optional[Tuple[int, int]] = None) -> Tuple[float, Optional[Tuple[int, int]]]:
+    """The "render_scale" and "render_max" in settings.json, where they're there and make sense."""
+    settings = read_settings()
+    if "render_scale" in settings:
+        try:
+            scale = parse_render_scale(settings["render_scale"])
+        except ValueError as exc:
+            log.warning("Ignoring render_scale in %s: %s", SETTINGS_FILE, exc)
+    if settings.get("render_max") is not None:
+        try:
+            max_size = parse_render_max(settings["render_max"])
+        except ValueError as exc:
+            log.warning("Ignoring render_max in %s: %s", SETTINGS_FILE, exc)
+    return scale, max_size
+
+
+def mouse_pos() -> Tuple[int, int]:
+    """pygame.mouse.get_pos(), in canvas coordinates."""
+    pos = pygame.mouse.get_pos()
+    return _active.to_canvas(pos) if _active else pos
@@ -1,4 +1,5 @@
 import pygame
+from ui.display import mouse_pos
 
 THEME_BG     = (20, 60, 160)
 THEME_HOVER  = (40, 90, 200)
@@ -53,7 +54,7 @@ class Dropdown:
         pygame.draw.polygon(screen, THEME_GOLD, [(ax - 4, ay - 2), (ax + 4, ay - 2), (ax, ay + 4)])
 
         if self.open:
-            mpos = pygame.mouse.get_pos()
+            mpos = mouse_pos()
             for i, opt in enumerate(self.options):
                 iy = self.rect.bottom + i * self.item_height
                 ir = pygame.Rect(self.rect.x, iy, self.rect.width, self.item_height)
@@ -1,9 +1,21 @@
 import pygame
 from engine.state import MatchState, PlayerStats, BowlerStats
+from ui.display import mouse_pos
 from ui.match_table import abbreviate_teams
 from engine.paths import get_resource_path
+from render.quality import cache_surface, scale_image
+from render.surface_cache import get_surface_cache
 
 HUD_HEIGHT = 80
+OVERHANG   = 10     # the team and score pills stand this far above the bar
+CARD_W     = 340    # widest cached card: batting with career numbers
+
+# MatchState fields each cached card is drawn from (engine.reducer.StateDiff names)
+CARD_FIELDS = {
+    "info":    {"score", "wickets", "legal_balls", "batting_team", "bowling_team"},
+    "batting": {"current_batter", "current_non_striker", "current_batter_id", "current_non_striker_id"},
+    "bowling": {"current_bowler", "current_bowler_id", "bowler_stats", "batter_stats", "score", "legal_balls"},
+}
 
 # Broadcast palette — kept inline for locality (only used here)
 BLUE_DARK   = (10, 30, 80)
@@ -40,19 +52,28 @@ class HUD:
         self.font_stats = pygame.font.SysFont("Arial", 13, bold=True)
 
         self.ctrl_rects = {}
+        # Cards and the over strip live in the surface cache under "hud"
+        self._strip_key = None      # (innings, over, deliveries shown) of the over strip
+        self._card_w = {}           # card name → drawn width, kept with the cached card
+        get_surface_cache().discard("hud")
+        self._batters_shown = ()
+        self._careers_shown = False
 
     def _load_icons(self):
         import os
         self.icons = {}
-        for name in ("rewind", "arrow-left", "play", "pause", "arrow-right", "speed-", "speed+"):
+        for name in ("rewind", "arrow-left", "play", "pause", "arrow-right", "speed-", "speed+",
+                     "arrow-up", "arrow-down"):
             path = get_resource_path(os.path.join("images", "controls", f"{name}.png"))
             try:
                 img = pygame.image.load(path).convert_alpha()
-                self.icons[name] = pygame.transform.smoothscale(img, (32, 32))
+                self.icons[name] = scale_image(img, (32, 32))
             except pygame.error:
                 import logging
                 logging.warning("Missing icon: %s", path)
                 self.icons[name] = None
+        if self.icons.get("play"):
+            self.icons["play-back"] = pygame.transform.flip(self.icons["play"], True, False)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -68,34 +89,85 @@ class HUD:
 
     # -- Main render ----------------------------------------------------------
 
-    def render(self, screen, state: MatchState, recent_events: list, speed=1.0, playing=False):
+    def render(self, screen, state: MatchState, current_over=None, speed=1.0, playing=False, careers=None,
+               partnership=None, last_wicket=None, reverse=False):
+        """
+        `current_over` is (engine.overs.OverSummary, deliveries bowled in
+        it so far) for the over in progress, or None before the first ball.
+        `careers`, when given, maps a player id to their IPL career going
+        into this match (engine.careers.CareerStats); the cards then show
+        career numbers with the live innings folded in.  `partnership` and
+        `last_wicket` come from engine.partnerships.PartnershipTracker.
+        """
         pygame.draw.rect(screen, BLUE_DARK, self.rect)
         pygame.draw.line(screen, WHITE, (0, self.rect.y), (self.width, self.rect.y), 2)
 
-        self._match_info(screen, state)
-
-        bat_w = self._batting_card(screen, state, x=300)
-        bowl_w = self._bowling_card(screen, state, x=300 + bat_w + 20)
-        self._over_timeline(screen, recent_events, state, x=300 + bat_w + 20 + bowl_w + 20)
-
-        ctrl_w = 340
-        self._controls(screen, self.width - ctrl_w - 20, self.rect.y + 12, speed, playing, ctrl_w)
+        if (careers is not None) != self._careers_shown:
+            self._careers_shown = careers is not None
+            get_surface_cache().discard("hud", "batting")
+            get_surface_cache().discard("hud", "bowling")
+        self._batters_shown = (state.current_batter_id, state.current_non_striker_id)
+
+        top = self.rect.y - OVERHANG
+        info, _ = self._card("info", self._match_info, state, partnership, last_wicket)
+        screen.blit(info, (20, top))
+        bat, bat_w = self._card("batting", self._batting_card, state, careers)
+        screen.blit(bat, (300, top))
+        bowl, bowl_w = self._card("bowling", self._bowling_card, state, careers)
+        screen.blit(bowl, (300 + bat_w + 20, top))
+        self._over_timeline(screen, current_over, x=300 + bat_w + 20 + bowl_w + 20)
+
+        ctrl_w = 382
+        self._controls(screen, self.width - ctrl_w - 20, self.rect.y + 12, speed, playing, ctrl_w, reverse)
+        jump_w = 248
+        self._jumps(screen, self.width - ctrl_w - jump_w - 32, self.rect.y + 12, jump_w)
+
+    # -- Cached cards ---------------------------------------------------------
+
+    def invalidate(self, diff):
+        """State bus subscriber: drop the cards an engine.reducer.StateDiff touches."""
+        cache = get_surface_cache()
+        for name, fields in CARD_FIELDS.items():
+            if diff.touches(fields):
+                cache.discard("hud", name)
+        if not diff.players.isdisjoint(self._batters_shown):
+            cache.discard("hud", "batting")
+
+    def _card(self, name, draw, *args):
+        """
+        (surface, width) of a card, drawn by `draw(surf, top, *args)` only
+        when it isn't cached (or was evicted).  The partnership and last
+        wicket on the info card move only when the score, wickets or balls
+        do, so the info card's fields cover them too.
+        """
+        def build():
+            # The overhang sits over whatever view is up, so it's keyed under low; below it
+            # the bar itself is painted in, keeping the card's text off the key colour
+            surf = cache_surface((CARD_W, HUD_HEIGHT + OVERHANG))
+            surf.fill(BLUE_DARK, (0, OVERHANG, CARD_W, HUD_HEIGHT))
+            pygame.draw.line(surf, WHITE, (0, OVERHANG), (CARD_W, OVERHANG), 2)
+            self._card_w[name] = draw(surf, OVERHANG, *args)
+            return surf
+
+        surf = get_surface_cache().get("hud", name, build)
+        return surf, self._card_w[name]
 
     # -- Sub-sections ---------------------------------------------------------
+    # The cards draw at x = 0 on their own surfaces; `top` is where the bar's top edge falls
 
-    def _match_info(self, screen, state):
-        x, y = 20, self.rect.y + 10
+    def _match_info(self, screen, top, state, partnership=None, last_wicket=None):
+        x, y = 0, top + 10
 
         raw = abbreviate_teams(f"{state.batting_team} vs {state.bowling_team}")
         parts = raw.split(" vs ")
         title = f"{parts[0]} v {parts[1]}" if len(parts) == 2 else raw
 
-        tr = pygame.Rect(x, self.rect.y - 10, 150, 30)
+        tr = pygame.Rect(x, top - 10, 150, 30)
         self._rrect(screen, tr, WHITE, 6, (150, 150, 150))
         ts = self.font_bold.render(title, True, TEXT_DARK)
         screen.blit(ts, ts.get_rect(center=tr.center))
 
-        sr = pygame.Rect(x + 155, self.rect.y - 10, 120, 42)
+        sr = pygame.Rect(x + 155, top - 10, 120, 42)
         self._rrect(screen, sr, GOLD, 6, WHITE)
         ss = self.font_score.render(f"{state.score}-{state.wickets}", True, TEXT_DARK)
         screen.blit(ss, ss.get_rect(center=sr.center))
@@ -104,12 +176,24 @@ class HUD:
         self._rrect(screen, ov, BLUE_MID, 4, BLUE_LIGHT)
         screen.blit(self.font_norm.render(f"OVERS {state.overs_str}", True, WHITE), (ov.x + 10, ov.y + 4))
 
-    def _batting_card(self, screen, state, x):
-        y = self.rect.y + 12
+        if partnership is not None:
+            pr = pygame.Rect(x + 155, y + 24, 120, 24)
+            self._rrect(screen, pr, BLUE_DARK, 4, BLUE_LIGHT)
+            pt = self.font_sm.render(f"P'SHIP {partnership.runs} ({partnership.balls})", True, WHITE)
+            screen.blit(pt, pt.get_rect(center=pr.center))
+        if last_wicket is not None:
+            lw = f"LAST WKT {last_wicket.score}-{last_wicket.wicket} {last_wicket.name[:14]} ({last_wicket.overs_str})"
+            screen.blit(self.font_sm.render(lw, True, SILVER), (x, y + 52))
+        return 280
+
+    def _batting_card(self, screen, top, state, careers=None):
+        x, y = 0, top + 12
         nw, rw, bw = 160, 45, 35
-        total = nw + 2 + rw + 2 + bw
+        cw = 88 if careers else 0
+        total = nw + 2 + rw + 2 + bw + (2 + cw if cw else 0)
 
-        def row(name, runs, balls, striker, dy):
+        def row(name, pid, stats, striker, dy):
+            runs, balls = stats.runs, stats.balls
             bg = WHITE if striker else SILVER
             fg = TEXT_DARK if striker else (60, 60, 60)
             nr = pygame.Rect(x, y + dy, nw, 26)
@@ -125,16 +209,25 @@ class HUD:
             bt = self.font_sm.render(str(balls), True, SILVER)
             screen.blit(bt, bt.get_rect(center=br.center))
 
-        p1 = state.batter_stats.get(state.current_batter, PlayerStats())
-        p2 = state.batter_stats.get(state.current_non_striker, PlayerStats())
-        row(state.current_batter + "*", p1.runs, p1.balls, True, 0)
-        row(state.current_non_striker, p2.runs, p2.balls, False, 30)
+            if cw:
+                # Career runs @ average, this innings included
+                c = careers(pid).plus_innings(runs=runs, balls=balls, fours=stats.fours, sixes=stats.sixes)
+                avg = f"{c.batting_avg:.1f}" if c.batting_avg is not None else "-"
+                cr = pygame.Rect(x + nw + rw + bw + 6, y + dy, cw, 26)
+                self._rrect(screen, cr, BLUE_DARK, 4, BLUE_MID)
+                ct = self.font_sm.render(f"{c.runs} @ {avg}", True, GREY_LIGHT)
+                screen.blit(ct, ct.get_rect(center=cr.center))
+
+        p1 = state.batter_stats.get(state.current_batter_id, PlayerStats())
+        p2 = state.batter_stats.get(state.current_non_striker_id, PlayerStats())
+        row(state.current_batter + "*", state.current_batter_id, p1, True, 0)
+        row(state.current_non_striker, state.current_non_striker_id, p2, False, 30)
         return total
 
-    def _bowling_card(self, screen, state, x):
-        y = self.rect.y + 12
-        cw = 250
-        bl = state.bowler_stats.get(state.current_bowler, BowlerStats())
+    def _bowling_card(self, screen, top, state, careers=None):
+        x, y = 0, top + 12
+        cw = 320 if careers else 250
+        bl = state.bowler_stats.get(state.current_bowler_id, BowlerStats())
 
         br = pygame.Rect(x, y, cw, 28)
         self._rrect(screen, br, WHITE, 6, SILVER)
@@ -142,6 +235,13 @@ class HUD:
         ft = self.font_bold.render(f"{bl.wickets}-{bl.runs_conceded}", True, BLUE_DARK)
         screen.blit(ft, ft.get_rect(midright=(br.right - 10, br.centery)))
 
+        if careers:
+            # Career wickets · economy, this spell included
+            c = careers(state.current_bowler_id).plus_innings(
+                wickets=bl.wickets, balls_bowled=bl.balls, runs_conceded=bl.runs_conceded)
+            ct = self.font_sm.render(f"{c.wickets}w · econ {c.economy:.2f}", True, (90, 90, 100))
+            screen.blit(ct, ct.get_rect(midright=(br.right - 20 - ft.get_width(), br.centery)))
+
         sr = pygame.Rect(x, y + 32, cw, 24)
         self._rrect(screen, sr, BLUE_MID, 4, BLUE_LIGHT)
         st = self.font_stats.render(
@@ -151,65 +251,76 @@ class HUD:
         screen.blit(st, st.get_rect(center=sr.center))
         return cw
 
-    def _over_timeline(self, screen, events, state, x):
-        """Visual ball-by-ball strip for the current over."""
-        y = self.rect.y + 12
-
-        # Filter to just the balls from the current over
-        cur_over = []
-        if events:
-            target = events[-1].over
-            cur_over = [e for e in events if e.over == target]
-
-        legal_so_far = sum(1 for e in cur_over if e.is_legal)
+    def _over_timeline(self, screen, current_over, x):
+        """Ball-by-ball strip for the current over, re-rendered only when a ball is added or the over changes."""
+        key = (current_over[0].innings, current_over[0].over, current_over[1]) if current_over else None
+        cache = get_surface_cache()
+        if key != self._strip_key:
+            cache.discard("hud", ("strip", self._strip_key))
+            self._strip_key = key
+        strip = cache.get("hud", ("strip", key), lambda: self._render_strip(current_over))
+        screen.blit(strip, (x, self.rect.y + 12))
+        return strip.get_width()
+
+    def _render_strip(self, current_over):
+        chips, over_no = [], 1
+        if current_over:
+            over, shown = current_over
+            chips, over_no = over.chips[:shown], over.over + 1
+        legal_so_far = sum(1 for c in chips if c.legal)
         remaining = max(0, 6 - legal_so_far)
-        slots = max(8, len(cur_over) + remaining)
+        slots = max(8, len(chips) + remaining)
 
         ball_sz, gap, pad = 26, 6, 12
         w = slots * (ball_sz + gap) + pad * 2
         h = 56
+        surf = cache_surface((w, h), BLUE_DARK)
 
-        self._rrect(screen, pygame.Rect(x, y, w, h), WHITE, 6, SILVER)
-        screen.blit(self.font_sm.render(f"OVER {state.legal_balls // 6 + 1}", True, (80, 80, 90)), (x + 8, y + 4))
+        self._rrect(surf, pygame.Rect(0, 0, w, h), WHITE, 6, SILVER)
+        label = f"OVER {over_no}"
+        if current_over and shown == len(current_over[0].chips):
+            over = current_over[0]
+            label += f" · {over.runs} RUN{'S' if over.runs != 1 else ''}" + (" · MAIDEN" if over.maiden else "")
+        surf.blit(self.font_sm.render(label, True, (80, 80, 90)), (8, 4))
 
-        bx_start = x + pad
-        by = y + 22
+        by = 22
 
         # Delivered balls, color-coded
-        for i, ev in enumerate(cur_over):
-            bx = bx_start + i * (ball_sz + gap)
-            rect = pygame.Rect(bx, by, ball_sz, ball_sz)
-
-            bg, txt, fg = (60, 60, 70), str(ev.runs_batter), WHITE
-            if ev.is_wicket:
-                bg, txt = RED, "W"
-            elif ev.runs_batter == 4:
+        for i, chip in enumerate(chips):
+            rect = pygame.Rect(pad + i * (ball_sz + gap), by, ball_sz, ball_sz)
+
+            bg, fg = (60, 60, 70), WHITE
+            if chip.wicket:
+                bg = RED
+            elif chip.runs_batter == 4:
                 bg = BLUE_LIGHT
-            elif ev.runs_batter == 6:
+            elif chip.runs_batter == 6:
                 bg, fg = GOLD, TEXT_DARK
-            elif not ev.is_legal:
-                bg, txt = ORANGE, ("wd" if ev.is_wide else "nb")
+            elif not chip.legal:
+                bg = ORANGE
 
-            self._rrect(screen, rect, bg, 4)
-            screen.blit(self.font_sm.render(txt, True, fg), self.font_sm.render(txt, True, fg).get_rect(center=rect.center))
+            self._rrect(surf, rect, bg, 4)
+            t = self.font_sm.render(chip.label, True, fg)
+            surf.blit(t, t.get_rect(center=rect.center))
 
         # Placeholder dots for balls yet to come
         for i in range(remaining):
-            bx = bx_start + (len(cur_over) + i) * (ball_sz + gap)
-            rect = pygame.Rect(bx, by, ball_sz, ball_sz)
-            pygame.draw.rect(screen, GREY_LIGHT, rect, border_radius=4)
-            pygame.draw.circle(screen, (180, 180, 190), rect.center, 3)
+            rect = pygame.Rect(pad + (len(chips) + i) * (ball_sz + gap), by, ball_sz, ball_sz)
+            pygame.draw.rect(surf, GREY_LIGHT, rect, border_radius=4)
+            pygame.draw.circle(surf, (180, 180, 190), rect.center, 3)
 
-        return w
+        return surf
 
-    def _controls(self, screen, x, y, speed, playing, w):
+    def _controls(self, screen, x, y, speed, playing, w, reverse=False):
         h = 56
         self._rrect(screen, pygame.Rect(x, y, w, h), WHITE, 6, SILVER)
 
+        # Rewind is the play icon mirrored, ringed while playback runs backwards
         btns = [
             ("RESTART",    "rewind"),
             ("PREV",       "arrow-left"),
-            ("PLAY_PAUSE", "pause" if playing else "play"),
+            ("REWIND",     "pause" if playing and reverse else "play-back"),
+            ("PLAY_PAUSE", "pause" if playing and not reverse else "play"),
             ("NEXT",       "arrow-right"),
             ("SPEED_DOWN", "speed-"),
             ("SPEED_UP",   "speed+"),
@@ -218,7 +329,7 @@ class HUD:
         cx = x + 16
         cy = y + h // 2
         btn_sz = 32
-        mpos = pygame.mouse.get_pos()
+        mpos = mouse_pos()
 
         for action, icon_key in btns:
             rect = pygame.Rect(cx, cy - btn_sz // 2, btn_sz, btn_sz)
@@ -227,6 +338,9 @@ class HUD:
             if rect.collidepoint(mpos):
                 pygame.draw.circle(screen, (220, 220, 230), rect.center, btn_sz // 2 + 2)
 
+            if action == "REWIND" and reverse:
+                pygame.draw.circle(screen, GOLD, rect.center, btn_sz // 2 + 2, 2)
+
             icon = self.icons.get(icon_key)
             if icon:
                 screen.blit(icon, icon.get_rect(center=rect.center))
@@ -236,4 +350,39 @@ class HUD:
 
             cx += btn_sz + 10
 
-        screen.blit(self.font_bold.render(f"{speed:.1f}x", True, TEXT_DARK), (cx + 8, cy - 8))
\ No newline at end of file
+        screen.blit(self.font_bold.render(f"{speed:.1f}x", True, TEXT_DARK), (cx + 8, cy - 8))
+
+    def _jumps(self, screen, x, y, w):
+        """Previous / next over, wicket and boundary."""
+        h = 56
+        self._rrect(screen, pygame.Rect(x, y, w, h), WHITE, 6, SILVER)
+        screen.blit(self.font_sm.render("JUMP", True, (80, 80, 90)), (x + 8, y + 3))
+
+        # Overs get the arrow icons; wickets and boundaries are lettered chips
+        btns = [
+            ("PREV_OVER",     "arrow-down", None),
+            ("NEXT_OVER",     "arrow-up",   None),
+            ("PREV_WICKET",   None,         "<W"),
+            ("NEXT_WICKET",   None,         "W>"),
+            ("PREV_BOUNDARY", None,         "<4"),
+            ("NEXT_BOUNDARY", None,         "4>"),
+        ]
+        btn_sz, gap = 32, 6
+        cx, cy = x + 12, y + h // 2 + 6
+        mpos = mouse_pos()
+
+        for action, icon_key, label in btns:
+            rect = pygame.Rect(cx, cy - btn_sz // 2, btn_sz, btn_sz)
+            self.ctrl_rects[action] = rect
+            if rect.collidepoint(mpos):
+                pygame.draw.circle(screen, (220, 220, 230), rect.center, btn_sz // 2 + 2)
+
+            icon = self.icons.get(icon_key) if icon_key else None
+            if icon:
+                screen.blit(icon, icon.get_rect(center=rect.center))
+            else:
+                chip = RED if "WICKET" in action else BLUE_LIGHT
+                self._rrect(screen, rect.inflate(-6, -6), chip, 4)
+                t = self.font_sm.render(label or icon_key[:2], True, WHITE)
+                screen.blit(t, t.get_rect(center=rect.center))
+            cx += btn_sz + gap
\ No newline at end of file
@@ -3,6 +3,8 @@ from pygame import Rect
 import math
 
 from data.team_registry import TEAM_ABBR
+from render.surface_cache import get_surface_cache
+from ui.display import mouse_pos
 from data.theme import (
     BG_COLOR, TV_BLUE_ALT as BG_ALT, TV_BLUE_LIGHT as BG_HOVER,
     HEADER_BG, BORDER_COLOR, TV_WHITE as TEXT, TV_SILVER as TEXT_MUTED,
@@ -36,8 +38,9 @@ class MatchTable:
     """
     Paginated table listing matches for a season.
 
-    Pre-renders the text layer once per page change so the per-frame draw
-    is just a pair of blits (row backgrounds + cached text surface).
+    Pre-renders the text layer once per page (it's kept in the shared
+    surface cache) so the per-frame draw is just a pair of blits (row
+    backgrounds + cached text surface).
     """
 
     COLUMNS = [
@@ -57,12 +60,21 @@ class MatchTable:
         self.matches  = []
         self.page     = 0
         self.hover_index = None
-        self._text_layer = None
+        self._hover_since = 0       # ticks when hover_index last changed
+        self._generation = 0        # bumped per set_matches, so a new season's pages don't hit old layers
 
     def set_matches(self, matches):
         self.matches = matches
         self.page = 0
-        self._prerender()
+        self._generation += 1
+
+    def dwell_index(self, dwell_ms):
+        """The hovered row once the pointer has rested on it for `dwell_ms`, else None."""
+        if self.hover_index is None:
+            return None
+        if pygame.time.get_ticks() - self._hover_since < dwell_ms:
+            return None
+        return self.hover_index
 
     @property
     def rows_per_page(self):
@@ -79,13 +91,11 @@ class MatchTable:
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEWHEEL:
-            if self.rect.collidepoint(pygame.mouse.get_pos()):
+            if self.rect.collidepoint(mouse_pos()):
                 if event.y < 0 and self.page < self.total_pages - 1:
                     self.page += 1
-                    self._prerender()
                 elif event.y > 0 and self.page > 0:
                     self.page -= 1
-                    self._prerender()
                 return None
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -94,12 +104,10 @@ class MatchTable:
 
             if prev_btn.collidepoint(mx, my) and self.page > 0:
                 self.page -= 1
-                self._prerender()
                 return None
 
             if next_btn.collidepoint(mx, my) and self.page < self.total_pages - 1:
                 self.page += 1
-                self._prerender()
                 return None
 
             if self.hover_index is not None:
@@ -124,7 +132,8 @@ class MatchTable:
 
         # Row backgrounds + hover highlight
         start_y = self.rect.y + self.header_h
-        mpos = pygame.mouse.get_pos()
+        mpos = mouse_pos()
+        prev_hover = self.hover_index
         self.hover_index = None
         count = min(self.rows_per_page, len(self.matches) - self.page * self.rows_per_page)
 
@@ -136,9 +145,11 @@ class MatchTable:
                 self.hover_index = gi
             elif gi % 2 == 0:
                 pygame.draw.rect(screen, BG_ALT, rr)
+        if self.hover_index != prev_hover:
+            self._hover_since = pygame.time.get_ticks()
 
-        if self._text_layer:
-            screen.blit(self._text_layer, self.rect.topleft)
+        key = (self._generation, self.page, self.rect.size)
+        screen.blit(get_surface_cache().get("match_table", key, self._render_text_layer), self.rect.topleft)
         self._draw_footer(screen)
 
     # -- Internals ------------------------------------------------------------
@@ -147,8 +158,8 @@ class MatchTable:
         y = self.rect.bottom - self.footer_h + 8
         return Rect(self.rect.x + 16, y, 80, 28), Rect(self.rect.right - 96, y, 80, 28)
 
-    def _prerender(self):
-        self._text_layer = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+    def _render_text_layer(self):
+        layer = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
         start = self.page * self.rows_per_page
         visible = self.matches[start : start + self.rows_per_page]
         y = self.header_h
@@ -170,10 +181,11 @@ class MatchTable:
                     tr.midleft = (xc + 8, rcy)
 
                 clip = Rect(xc, ry, w, self.row_h)
-                self._text_layer.set_clip(clip)
-                self._text_layer.blit(surf, tr)
-                self._text_layer.set_clip(None)
+                layer.set_clip(clip)
+                layer.blit(surf, tr)
+                layer.set_clip(None)
                 xc += w
+        return layer
 
     def _draw_footer(self, screen):
         fy = self.rect.bottom - self.footer_h
@@ -1,5 +1,8 @@
 import pygame
-from functools import lru_cache
+
+from data.theme import WINDOW_BG
+from render.quality import cache_surface, get_quality
+from render.surface_cache import get_surface_cache
 
 _weather_lbl_font = None
 
@@ -28,9 +31,19 @@ class PanelTheme:
     ROW_GAP = 8
 
 
-@lru_cache(maxsize=32)
 def _panel_bg(w, h):
-    """Gradient background with rounded corners — cached by (width, height)."""
+    """Gradient background with rounded corners — cached by (width, height) in the shared surface cache."""
+    return get_surface_cache().get("panel_bg", (w, h), lambda: _render_panel_bg(w, h))
+
+
+def _render_panel_bg(w, h):
+    if not get_quality().panel_gradient:
+        # Flat and opaque, over the window background the panels sit on
+        surf = cache_surface((w, h), WINDOW_BG)
+        pygame.draw.rect(surf, PanelTheme.BG_TOP, (0, 0, w, h), border_radius=PanelTheme.RADIUS)
+        pygame.draw.rect(surf, PanelTheme.BORDER, (0, 0, w, h), 1, border_radius=PanelTheme.RADIUS)
+        return surf
+
     surf = pygame.Surface((w, h), pygame.SRCALPHA)
     for i in range(h):
         t = i / h
@@ -165,4 +178,35 @@ def draw_weather_panel(screen, x, y, w, h, weather_data, icons, font_body, font_
     summary = weather_data.get("summary", "Unknown")
     s_surf = font_title.render(summary, True, PanelTheme.TITLE)
     icon_h = main_icon.get_height() if main_icon else 32
-    screen.blit(s_surf, (txt_x, sum_y + (icon_h - s_surf.get_height()) // 2))
\ No newline at end of file
+    screen.blit(s_surf, (txt_x, sum_y + (icon_h - s_surf.get_height()) // 2))
+
+
+def draw_histogram(screen, rect, counts, edges, marker=None, font=None):
+    """
+    Bar chart of `counts` over bin `edges` inside `rect`, with the range
+    labelled underneath.  `marker` draws a gold line at that x value
+    (a chase target, say).
+    """
+    if not len(counts) or max(counts) == 0:
+        return
+    label_h = font.get_height() + 2 if font else 0
+    plot = pygame.Rect(rect.x, rect.y, rect.w, rect.h - label_h)
+    lo, hi = float(edges[0]), float(edges[-1])
+    bar_w = plot.w / len(counts)
+    top = max(counts)
+
+    for i, c in enumerate(counts):
+        h = int(plot.h * c / top)
+        if h:
+            bar = pygame.Rect(int(plot.x + i * bar_w), plot.bottom - h, max(1, int(bar_w) - 1), h)
+            pygame.draw.rect(screen, PanelTheme.SECTION, bar)
+    pygame.draw.line(screen, PanelTheme.DIVIDER, (plot.x, plot.bottom), (plot.right, plot.bottom), 1)
+
+    if marker is not None and hi > lo:
+        mx = plot.x + plot.w * min(max((marker - lo) / (hi - lo), 0.0), 1.0)
+        pygame.draw.line(screen, PanelTheme.TITLE, (mx, plot.y), (mx, plot.bottom), 2)
+
+    if font:
+        screen.blit(font.render(f"{lo:.0f}", True, PanelTheme.LABEL), (plot.x, plot.bottom + 2))
+        r = font.render(f"{hi:.0f}", True, PanelTheme.LABEL)
+        screen.blit(r, (plot.right - r.get_width(), plot.bottom + 2))
@@ -9,18 +9,19 @@ BORDER    = (200, 200, 210)
 
 
 class ViewSelector:
-    """Sidebar tab strip — lets the user swap between the five view modes."""
+    """Sidebar tab strip — lets the user swap between the six view modes."""
 
     TABS = [
         ("FIELD",      "view_field"),
         ("TEAMS",      "view_teams"),
         ("SCORECARD",  "view_batting"),
         ("SUMMARY",    "view_bowling"),
+        ("CHARTS",     "view_charts"),
         ("STANDINGS",  "view_points"),
     ]
 
     def __init__(self, x, y, w, font):
-        self.rect = pygame.Rect(x, y, w, 220)
+        self.rect = pygame.Rect(x, y, w, 260)
         self.font = font
         self.btn_rects = {}
         self._layout()